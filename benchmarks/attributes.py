@@ -0,0 +1,35 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Times reading loaded attributes, as analysis loops over many anime do, against reading the attributes they're kept in.
+
+Usage: python benchmarks/attributes.py [number of reads]
+
+Reads title, score and members a million times each by default, from an anime whose attributes are already set,
+so that no page is ever loaded.
+"""
+import sys
+import timeit
+
+import common
+
+ATTRIBUTES = [u'title', u'score', u'members']
+
+SETUP = u"""from myanimelist.anime import Anime
+from myanimelist.session import Session
+bebop = Anime(Session(), 1).set({u'title': u'Cowboy Bebop', u'score': (8.83, 300000), u'members': 500000})"""
+
+
+def nanoseconds_per_read(statement, reads):
+    return min(timeit.Timer(statement, setup=SETUP).repeat(repeat=3, number=reads)) / reads * 1e9
+
+
+def main(argv):
+    reads = int(argv[1]) if len(argv) > 1 else 1000000
+    print u'%-10s %14s %14s' % (u'attribute', u'loadable', u'underscored')
+    for attribute in ATTRIBUTES:
+        print u'%-10s %12.0fns %12.0fns' % (attribute, nanoseconds_per_read(u'bebop.' + attribute, reads),
+                                            nanoseconds_per_read(u'bebop._' + attribute, reads))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Compares decoding recorded pages by sniffing their charset, as requests does, against decoding them with
+the encoding they declare, as :class:`myanimelist.transport.Response` does.
+
+Usage: python benchmarks/decoding.py [recordings directory]
+
+The directory holds pages recorded by :class:`myanimelist.transport.ReplayTransport`.
+Without one, the hand-written pages under tests/fixtures are used, which are no stand-in for recorded ones.
+"""
+import sys
+
+import requests
+
+import common
+from myanimelist.transport import Response
+
+
+def sniffed(content):
+    return content.decode(requests.compat.chardet.detect(content)[u'encoding'] or u'utf-8', u'replace')
+
+
+def declared(content):
+    return Response(u'', content=content).text
+
+
+def main(argv):
+    transport = common.recordings(argv)
+    print u'%-60s %8s %14s %14s' % (u'page', u'KB', u'sniffed', u'declared')
+    try:
+        for url in transport.urls():
+            content = transport.load(url).content
+            print u'%-60s %8.1f %12.2fms %12.2fms' % (url[:60], len(content) / 1024.0,
+                                                        common.best_of(lambda: sniffed(content), number=3),
+                                                        common.best_of(lambda: declared(content)))
+    finally:
+        common.cleanup(transport, argv)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Times parsing large anime and manga lists, in rows per second, and the share of that spent parsing their dates.
+
+Usage: python benchmarks/lists.py [number of rows]
+
+The lists are generated, with 10000 rows by default, and start, finish and airing dates spread over twenty years.
+"""
+import datetime
+import random
+import re
+import sys
+import timeit
+
+import common
+from myanimelist import utilities
+from myanimelist.session import Session
+from myanimelist.transport import Response
+
+# a row of each type of list.
+ROWS = {
+    u'anime': """  <anime>
+    <series_animedb_id>%(id)d</series_animedb_id><series_title>Anime %(id)d</series_title><series_type>%(type)d</series_type>
+    <series_episodes>12</series_episodes><series_status>%(series_status)d</series_status>
+    <series_start>%(series_start)s</series_start><series_end>%(series_end)s</series_end>
+    <series_image>http://cdn.myanimelist.net/images/anime/1/%(id)d.jpg</series_image>
+    <my_start_date>%(my_start)s</my_start_date><my_finish_date>%(my_finish)s</my_finish_date>
+    <my_score>%(score)d</my_score><my_status>%(status)d</my_status><my_watched_episodes>3</my_watched_episodes>
+    <my_rewatching>0</my_rewatching><my_rewatching_ep>0</my_rewatching_ep><my_last_updated>1400000000</my_last_updated>
+  </anime>""",
+    u'manga': """  <manga>
+    <series_mangadb_id>%(id)d</series_mangadb_id><series_title>Manga %(id)d</series_title><series_type>%(type)d</series_type>
+    <series_chapters>120</series_chapters><series_volumes>12</series_volumes><series_status>%(series_status)d</series_status>
+    <series_start>%(series_start)s</series_start><series_end>%(series_end)s</series_end>
+    <series_image>http://cdn.myanimelist.net/images/manga/1/%(id)d.jpg</series_image>
+    <my_start_date>%(my_start)s</my_start_date><my_finish_date>%(my_finish)s</my_finish_date>
+    <my_score>%(score)d</my_score><my_status>%(status)d</my_status><my_read_chapters>30</my_read_chapters>
+    <my_read_volumes>3</my_read_volumes><my_rereadingg>0</my_rereadingg><my_rereading_chap>0</my_rereading_chap>
+    <my_last_updated>1400000000</my_last_updated>
+  </manga>"""
+}
+
+
+class ListTransport(object):
+    """Serves the same list for every URL."""
+
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url):
+        return Response(url, content=self.content, encoding=u'utf-8')
+
+    def post(self, url, data=None):
+        return self.get(url)
+
+
+def list_date(rand):
+    day = datetime.date(1995, 1, 1) + datetime.timedelta(days=rand.randint(0, 365 * 20))
+    # some dates are only partly known.
+    return rand.choice([day.isoformat(), day.strftime('%Y-%m-00'), day.strftime('%Y-00-00'), '0000-00-00'])
+
+
+def synthetic_list(list_type, rows):
+    rand = random.Random(0)
+    entries = []
+    for media_id in range(1, rows + 1):
+        entries.append(ROWS[list_type] % {
+            u'id': media_id, u'type': rand.randint(1, 6), u'series_status': rand.randint(1, 3),
+            u'score': rand.randint(0, 10), u'status': rand.choice([1, 2, 3, 4, 6]),
+            u'series_start': list_date(rand), u'series_end': list_date(rand),
+            u'my_start': list_date(rand), u'my_finish': list_date(rand)})
+    return """<?xml version="1.0" encoding="UTF-8" ?>
+<myanimelist>
+  <myinfo><user_id>1</user_id><user_name>benchmark</user_name></myinfo>
+%s
+</myanimelist>""" % '\n'.join(entries)
+
+
+def main(argv):
+    rows = int(argv[1]) if len(argv) > 1 else 10000
+    print u'%-8s %12s %12s %12s' % (u'list', u'rows/s', u'list', u'dates')
+    for list_type in [u'anime', u'manga']:
+        xml = synthetic_list(list_type, rows)
+        media_list = getattr(Session(transport=ListTransport(xml)), list_type + u'_list')(u'benchmark')
+        dates = re.findall(r'_(?:start|end|start_date|finish_date)>([^<]*)<', xml)
+
+        def parse_list():
+            utilities._date_cache.clear()
+            for _ in media_list.parse_entries(xml):
+                pass
+
+        def parse_dates():
+            utilities._date_cache.clear()
+            for text in dates:
+                utilities.parse_profile_date(text)
+
+        list_seconds = min(timeit.repeat(parse_list, repeat=3, number=1))
+        date_seconds = min(timeit.repeat(parse_dates, repeat=3, number=1))
+        print u'%-8s %12.0f %11.2fs %6.2fs %3.0f%%' % (list_type, rows / list_seconds, list_seconds, date_seconds,
+                                                     date_seconds / list_seconds * 100)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
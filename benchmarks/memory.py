@@ -0,0 +1,47 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Measures the memory each model object takes, by building a million unloaded ones and watching the process grow.
+
+Usage: python benchmarks/memory.py [anime|manga|character|person|user] [number of objects]
+
+Builds 1000000 anime by default. Each type is best measured in a process of its own, as this one does.
+"""
+import gc
+import resource
+import sys
+import time
+
+import common
+from myanimelist import anime, character, manga, person, user
+from myanimelist.session import Session
+
+MODELS = {
+    u'anime': lambda session, i: anime.Anime(session, i),
+    u'manga': lambda session, i: manga.Manga(session, i),
+    u'character': lambda session, i: character.Character(session, i),
+    u'person': lambda session, i: person.Person(session, i),
+    u'user': lambda session, i: user.User(session, u'user%d' % i),
+}
+
+
+def peak_kilobytes():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(argv):
+    model = argv[1] if len(argv) > 1 else u'anime'
+    count = int(argv[2]) if len(argv) > 2 else 1000000
+    session = Session()
+    build = MODELS[model]
+    gc.collect()
+    before = peak_kilobytes()
+    start = time.time()
+    # built directly rather than through the session, which would keep only one object per ID.
+    objects = [build(session, i) for i in xrange(1, count + 1)]
+    seconds = time.time() - start
+    grown = peak_kilobytes() - before
+    print u'%d %s objects: %.0f bytes each, built in %.2fs' % (len(objects), model, grown * 1024.0 / count, seconds)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
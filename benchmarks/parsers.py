@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Times parsing recorded anime, user and character pages under each installed BeautifulSoup tree builder.
+
+Usage: python benchmarks/parsers.py [recordings directory]
+
+The directory holds pages recorded by :class:`myanimelist.transport.ReplayTransport`.
+Without one, the hand-written pages under tests/fixtures are used, which are no stand-in for recorded ones.
+"""
+import re
+import sys
+
+import bs4
+
+import common
+from myanimelist import utilities
+from myanimelist.session import Session
+
+ENGINES = [u'html.parser', u'lxml', u'html5lib']
+
+# page kinds, as (name, URL path pattern, function taking a session, the URL's match and a DOM and parsing it).
+PAGES = [
+    (u'anime', re.compile(r'^/anime/(?P<id>[0-9]+)/?$'),
+     lambda session, match, dom: session.anime(int(match.group(u'id'))).parse(dom)),
+    (u'anime characters', re.compile(r'^/anime/(?P<id>[0-9]+)/[^/]+/characters$'),
+     lambda session, match, dom: session.anime(int(match.group(u'id'))).parse_characters(dom)),
+    (u'user', re.compile(r'^/profile/(?P<username>[^/]+)$'),
+     lambda session, match, dom: session.user(match.group(u'username')).parse(dom)),
+    (u'character', re.compile(r'^/character/(?P<id>[0-9]+)'),
+     lambda session, match, dom: session.character(int(match.group(u'id'))).parse(dom)),
+]
+
+
+def page_kind(url):
+    path = url.split(u'myanimelist.net', 1)[-1].split(u'?')[0]
+    for name, pattern, parse in PAGES:
+        match = pattern.match(path)
+        if match:
+            return name, match, parse
+    return None
+
+
+def main(argv):
+    transport = common.recordings(argv)
+    engines = [engine for engine in ENGINES if bs4.builder.builder_registry.lookup(engine) is not None]
+    print u'%-60s %s' % (u'page', u' '.join(u'%14s' % engine for engine in engines))
+    try:
+        for url in transport.urls():
+            kind = page_kind(url)
+            if kind is None:
+                continue
+            name, match, parse = kind
+            html = transport.get(url).text
+            timings = []
+            for engine in engines:
+                session = Session(transport=transport, parser=engine)
+                try:
+                    parse(session, match, utilities.get_clean_dom(html, engine))
+                except Exception as e:
+                    timings.append(u'%14s' % (u'fails: ' + e.__class__.__name__[:7]))
+                    continue
+                milliseconds = common.best_of(lambda: parse(session, match, utilities.get_clean_dom(html, engine)))
+                timings.append(u'%12.2fms' % milliseconds)
+            print u'%-60s %s' % ((name + u': ' + url)[:60], u' '.join(timings))
+    finally:
+        common.cleanup(transport, argv)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
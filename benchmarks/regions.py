@@ -0,0 +1,37 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Compares building whole recorded pages against building only the regions their parsers use.
+
+Usage: python benchmarks/regions.py [recordings directory]
+
+The directory holds pages recorded by :class:`myanimelist.transport.ReplayTransport`.
+Without one, the hand-written pages under tests/fixtures are used, which are no stand-in for recorded ones.
+"""
+import sys
+
+import bs4
+
+import common
+from myanimelist import utilities
+
+
+def main(argv):
+    transport = common.recordings(argv)
+    print u'%-50s %12s %12s %10s %10s' % (u'page', u'whole', u'regions', u'nodes', u'nodes')
+    try:
+        for url in transport.urls():
+            page_type = utilities.resource_family(url)
+            if page_type not in utilities.REGIONS:
+                continue
+            html = utilities.fix_bad_html(transport.get(url).text, page_type)
+            whole = lambda: bs4.BeautifulSoup(html, u'lxml')
+            regions = lambda: bs4.BeautifulSoup(html, u'lxml', parse_only=utilities.REGIONS[page_type])
+            print u'%-50s %10.2fms %10.2fms %10d %10d' % (url[:50], common.best_of(whole), common.best_of(regions),
+                                                        len(list(whole().descendants)),
+                                                        len(list(regions().descendants)))
+    finally:
+        common.cleanup(transport, argv)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
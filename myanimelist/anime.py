@@ -23,6 +23,8 @@ class InvalidAnimeError(media.InvalidMediaError):
 class Anime(media.Media):
     """Primary interface to anime resources on MAL.
     """
+    __slots__ = ('_episodes', '_aired', '_producers', '_duration', '_rating', '_voice_actors', '_staff')
+
     _status_terms = [
         u'Unknown',
         u'Currently Airing',
@@ -53,28 +55,29 @@ class Anime(media.Media):
         self._voice_actors = None
         self._staff = None
 
-    def parse_producers(self, anime_page):
+    def parse_producers(self, anime_page, labels=None):
         """Parse the DOM and returns anime producers.
 
         :type media_page: :class:`bs4.BeautifulSoup`
         :param media_page: MAL media page's DOM
 
+        :type labels: dict
+        :param labels: The page's sidebar fields, as indexed by :func:`myanimelist.utilities.sidebar_labels`.
+            Built from anime_page if omitted.
+
         :rtype: list
         :return: anime produres.
         """
-        producers_tag = [x for x in anime_page.find_all('span')
-                         if 'Producers' in x.text][0].parent
+        if labels is None:
+            labels = utilities.sidebar_labels(anime_page)
+        producers_tag = labels[u'Producers']
         result = []
         for producer_link in producers_tag.find_all('a'):
             # e.g. http://myanimelist.net/anime/producer/23
             if '/anime/producer/' not in producer_link.get('href'):
                 continue  # skip when not producer link
             producer_id = producer_link.get('href').split('/producer/')[-1].split('/')[0]
-            producer_name = producer_link.text
-            result.append(self
-                          .session
-                          .producer(int(producer_id))
-                          .set({'name': producer_name}))
+            result.append(self.session.producer(int(producer_id), name=producer_link.text))
         return result
 
     def parse_sidebar(self, anime_page, anime_page_original=None):
@@ -83,14 +86,16 @@ class Anime(media.Media):
         :type anime_page: :class:`bs4.BeautifulSoup`
         :param anime_page: MAL anime page's DOM
 
-        :type anime_page: :class:`bs4.BeautifulSoup`
-        :param anime_page: MAL anime page's DOM uncleaned
+        :type anime_page_original: :class:`bs4.BeautifulSoup`
+        :param anime_page_original: MAL anime page's DOM, for the current page layout. Defaults to anime_page.
 
         :rtype: dict
         :return: anime attributes
 
         :raises: :class:`.InvalidAnimeError`, :class:`.MalformedAnimePageError`
         """
+        if anime_page_original is None:
+            anime_page_original = anime_page
         # if MAL says the series doesn't exist, raise an InvalidAnimeError.
         error_tag = anime_page.find(u'div', {'class': 'badresult'})
         if error_tag:
@@ -104,18 +109,18 @@ class Anime(media.Media):
             except IndexError:
                 raise MalformedAnimePageError(self.id, None, message="Could not find title div")
 
-        anime_info = super(Anime, self).parse_sidebar(anime_page, anime_page_original)
-        info_panel_first = anime_page.find(u'div', {'id': 'content'}).find(u'table').find(u'td')
+        labels = utilities.sidebar_labels(anime_page_original)
+        anime_info = super(Anime, self).parse_sidebar(anime_page, anime_page_original, labels)
 
         try:
-            episode_tag = [x for x in anime_page_original.find_all('span')if 'Episodes:' in x.text][0].parent
+            episode_tag = labels[u'Episodes']
             anime_info[u'episodes'] = int(episode_tag.text.split(':')[-1].strip()) if episode_tag.text.strip() != 'Unknown' else 0
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            aired_tag = [x for x in anime_page_original.find_all('span')if 'Aired:' in x.text][0].parent
+            aired_tag = labels[u'Aired']
             aired_tag_text = aired_tag.text.split(':')[1]
             aired_parts = aired_tag_text.strip().split(u' to ')
             if len(aired_parts) == 1:
@@ -145,13 +150,13 @@ class Anime(media.Media):
             if not self.session.suppress_parse_exceptions:
                 raise
         try:
-            anime_info[u'producers'] = self.parse_producers(anime_page)
+            anime_info[u'producers'] = self.parse_producers(anime_page, labels)
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            duration_tag = [x for x in anime_page_original.find_all('span')if 'Duration:' in x.text][0].parent
+            duration_tag = labels[u'Duration']
             anime_info[u'duration'] = duration_tag.text.split(':')[1].strip()
             duration_parts = [part.strip() for part in anime_info[u'duration'].split(u'.')]
             duration_mins = 0
@@ -170,7 +175,7 @@ class Anime(media.Media):
                 raise
 
         try:
-            rating_tag = [x for x in anime_page_original.find_all('span')if 'Rating:' in x.text][0].parent
+            rating_tag = labels[u'Rating']
             utilities.extract_tags(rating_tag.find_all(u'span', {'class': 'dark_text'}))
             anime_info[u'rating'] = rating_tag.text.strip()
         except:
@@ -217,12 +222,17 @@ class Anime(media.Media):
         :type character_page: :class:`bs4.BeautifulSoup`
         :param character_page: MAL anime character page's DOM
 
+        :type character_page_original: :class:`bs4.BeautifulSoup`
+        :param character_page_original: MAL anime character page's DOM, for the current page layout. Defaults to character_page.
+
         :rtype: dict
         :return: anime character attributes
 
         :raises: :class:`.InvalidAnimeError`, :class:`.MalformedAnimePageError`
 
         """
+        if character_page_original is None:
+            character_page_original = character_page
         anime_info = self.parse_sidebar(character_page, character_page_original)
 
         try:
@@ -280,15 +290,13 @@ class Anime(media.Media):
 
         return anime_info
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def episodes(self):
         """The number of episodes in this anime. If undetermined, is None, otherwise > 0.
         """
         return self._episodes
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def aired(self):
         """A tuple(2) containing up to two :class:`datetime.date` objects representing the start and end dates of this anime's airing.
 
@@ -303,35 +311,30 @@ class Anime(media.Media):
         """
         return self._aired
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def producers(self):
         """A list of :class:`myanimelist.producer.Producer` objects involved in this anime.
         """
         return self._producers
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def duration(self):
         """The duration of an episode of this anime as a :class:`datetime.timedelta`.
         """
         return self._duration
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def rating(self):
         """The MPAA rating given to this anime.
         """
         return self._rating
 
-    @property
     @loadable(u'load_characters')
     def voice_actors(self):
         """A voice actors dict with :class:`myanimelist.person.Person` objects of the voice actors as keys, and dicts containing info about the roles played, e.g. {'role': 'Main', 'character': myanimelist.character.Character(1)} as values.
         """
         return self._voice_actors
 
-    @property
     @loadable(u'load_characters')
     def staff(self):
         """A staff dict with :class:`myanimelist.person.Person` objects of the staff members as keys, and lists containing the various duties performed by staff members as values.
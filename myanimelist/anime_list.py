@@ -2,11 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import media_list
+from anime import Anime
 
 
 class AnimeList(media_list.MediaList):
     __id_attribute = "username"
 
+    _user_status_terms = media_list.user_status_table(u"watch")
+    _media_status_terms = Anime._status_terms
+
     def __init__(self, session, user_name):
         super(AnimeList, self).__init__(session, user_name)
 
@@ -18,6 +22,10 @@ class AnimeList(media_list.MediaList):
     def verb(self):
         return "watch"
 
+    @property
+    def series_type_terms(self):
+        return {1: u'TV', 2: u'OVA', 3: u'Movie', 4: u'Special', 5: u'ONA', 6: u'Music'}
+
     def parse_entry_media_attributes(self, soup):
         attributes = super(AnimeList, self).parse_entry_media_attributes(soup)
 
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""A session whose requests and loaders run in the background, returning futures."""
+from session import Session
+from workers import WorkerPool
+
+
+class AsyncSession(Session):
+    """A :class:`myanimelist.session.Session` that fetches and loads on a pool of worker threads, without blocking the caller.
+
+    Resources are created exactly as with a Session, e.g. session.anime(1), and parsed by their usual parse methods.
+    Fetching and loading them returns a :class:`myanimelist.workers.Future`, which a caller may wait on or chain callbacks onto.
+    """
+
+    def __init__(self, username=None, password=None, user_agent="iMAL-iOS", workers=16, **kwargs):
+        """Creates a new instance of AsyncSession. Takes the same arguments as :class:`myanimelist.session.Session`, and:
+
+        :type workers: int
+        :param workers: The number of requests to keep in flight at once. Also the default connection pool size.
+
+        :rtype: :class:`.AsyncSession`
+        :return: The desired session.
+
+        """
+        kwargs.setdefault('pool_maxsize', workers)
+        super(AsyncSession, self).__init__(username=username, password=password, user_agent=user_agent, **kwargs)
+        self.pool = WorkerPool(size=workers)
+
+    def fetch_async(self, url):
+        """Fetches a page from MAL in the background.
+
+        :type url: str
+        :param url: The URL to fetch.
+
+        :rtype: :class:`myanimelist.workers.Future`
+        :return: A future of the :class:`myanimelist.transport.Response`.
+
+        """
+        return self.pool.submit(self.fetch, url)
+
+    def load(self, resource, *loaders):
+        """Runs a resource's loaders in the background.
+
+        :type resource: :class:`myanimelist.base.Base`
+        :param resource: A MAL resource belonging to this session, e.g. session.anime(1)
+
+        :type loaders: str
+        :param loaders: Names of the loaders to run, in order. Defaults to 'load'.
+
+        :rtype: :class:`myanimelist.workers.Future`
+        :return: A future of the resource, once loaded. If a loader raises, the future raises its exception.
+
+        """
+        loaders = loaders or (u'load',)
+
+        def load():
+            for loader in loaders:
+                getattr(resource, loader)()
+            return resource
+
+        return self.pool.submit(load)
+
+    def close(self):
+        """Stops this session's worker threads once every request submitted so far has finished.
+        """
+        self.pool.shutdown()
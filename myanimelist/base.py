@@ -1,7 +1,9 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 import abc
-import functools
+import threading
+
+from coalesce import SingleFlight
 
 
 class Error(Exception):
@@ -60,29 +62,111 @@ class InvalidBaseError(Error):
         ])
 
 
-def loadable(func_name):
+class Loadable(object):
+    """Descriptor for attributes that require a load() upon first access, made by :func:`.loadable`.
+
+    Reading the attribute returns the object's underscored attribute, e.g. _title for title, calling the loader first
+    if it's None. Once loaded, that's a single slot or dict read: the decorated getter only names and documents the
+    attribute. Like a property, the attribute can't be set; set() the underscored one instead.
+
+    Threads reading an unloaded attribute at once share a single call of its loader: the first runs it, and the rest
+    wait for it, per object and loader, then read what it set or raise what it raised. Loaded attributes take no lock.
+    """
+
+    """Loader calls in progress, keyed by object and loader.
+    """
+    _loads = SingleFlight()
+
+    def __init__(self, func, func_name, loader_args):
+        """Creates a new instance of Loadable.
+
+        :type func: function
+        :param func: the getter this attribute was declared with.
+
+        :type func_name: str
+        :param func_name: name of the loader to call while the underscored attribute is None, e.g. load
+
+        :type loader_args: tuple
+        :param loader_args: arguments to pass to the loader.
+
+        :rtype: :class:`.Loadable`
+        :return: The desired descriptor.
+
+        """
+        self.func = func
+        self.func_name = func_name
+        self.loader_args = loader_args
+        self.cached_name = '_' + func.__name__
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.cached_name)
+        if value is None:
+            self.load(obj)
+            value = getattr(obj, self.cached_name)
+        return value
+
+    def __set__(self, obj, value):
+        raise AttributeError("can't set attribute")
+
+    def __delete__(self, obj):
+        raise AttributeError("can't delete attribute")
+
+    def __call__(self, obj, *args, **kwargs):
+        # the getter, loading first, for anything that still wraps this in a property.
+        if getattr(obj, self.cached_name) is None:
+            self.load(obj)
+        return self.func(obj, *args, **kwargs)
+
+    def load(self, obj):
+        """Calls this attribute's loader on obj, or if another thread already is, waits for that call to finish.
+
+        :type obj: :class:`.Base`
+        :param obj: The object to load.
+
+        """
+        # keyed by id() rather than the object, as objects equal by ID in different sessions load separately.
+        # the id can't be reused by another object while the call holds this one.
+        self._loads.do((id(obj), self.func_name, self.loader_args), self._load_unloaded, obj)
+
+    def _load_unloaded(self, obj):
+        # a call that was in progress when this thread found the attribute unloaded may have loaded it since.
+        if getattr(obj, self.cached_name) is None:
+            getattr(obj, self.func_name)(*self.loader_args)
+
+
+def loadable(func_name, *loader_args):
     """Decorator for getters that require a load() upon first access.
 
     :type func_name: function
     :param func_name: class method that requires that load() be called if the class's _attribute value is None
 
+    :type loader_args: list
+    :param loader_args: arguments to pass to the loader, e.g. the name of the section to load_section()
+
     :rtype: function
-    :return: the decorated class method.
+    :return: a decorator turning the getter into a :class:`.Loadable` attribute.
 
     """
 
     def inner(func):
-        cached_name = '_' + func.__name__
+        return Loadable(func, func_name, loader_args)
 
-        @functools.wraps(func)
-        def _decorator(self, *args, **kwargs):
-            if getattr(self, cached_name) is None:
-                getattr(self, func_name)()
-            return func(self, *args, **kwargs)
+    return inner
 
-        return _decorator
 
-    return inner
+"""Guards the sections objects have parsed, so that threads parsing different sections of one object don't lose
+each other's. Only held to record a section, not to parse it.
+"""
+_sections_lock = threading.Lock()
+
+"""Fetches of pages to keep for load_section() in progress, keyed by object, so that threads loading different
+sections of an object that has no page kept share one fetch and one DOM.
+"""
+_page_loads = SingleFlight()
 
 
 class Base(object):
@@ -90,11 +174,20 @@ class Base(object):
     """
     __metaclass__ = abc.ABCMeta
 
+    """Models keep their attributes in slots, declared by each subclass, rather than a dict per object.
+    Attributes a subclass doesn't declare, e.g. ones only some pages have, still go in a dict, made on first use.
+    """
+    __slots__ = ('session', '_page', '_parsed_sections', '__dict__', '__weakref__')
+
     """Attribute name for primary reference key to this object.
     When an attribute by the name given by _id_attribute is passed into set(), set() doesn't prepend an underscore for load()ing.
     """
     _id_attribute = "id"
 
+    """Names of the sections of this object's main page that parse_section() can parse on their own.
+    """
+    _sections = ()
+
     def __repr__(self):
         return u"".join([
             "<",
@@ -107,9 +200,12 @@ class Base(object):
         ])
 
     def __hash__(self):
-        return hash('-'.join([self.__class__.__name__, unicode(getattr(self, self._id_attribute))]))
+        return hash((self.__class__.__name__, getattr(self, self._id_attribute)))
 
     def __eq__(self, other):
+        # interned and session-shared objects are usually compared against themselves.
+        if self is other:
+            return True
         return isinstance(other, self.__class__) and getattr(self, self._id_attribute) == getattr(other,
                                                                                                   other._id_attribute)
 
@@ -124,6 +220,9 @@ class Base(object):
 
         """
         self.session = session
+        self._page = None
+        # a tuple rather than a set, being far smaller while there are only a handful of sections.
+        self._parsed_sections = ()
 
     @abc.abstractmethod
     def load(self):
@@ -131,6 +230,101 @@ class Base(object):
         """
         pass
 
+    def fetch_page(self):
+        """Fetches this object's main page, for load_section().
+        Objects that don't split their page into _sections have none to keep, and return None.
+
+        :rtype: :class:`myanimelist.transport.Response`
+        :return: the page's response.
+
+        """
+        return None
+
+    def parse_page(self, response):
+        """Parses this object's main page into a DOM, for parse_section() to parse sections out of.
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: the page's response, as returned by fetch_page().
+
+        :rtype: :class:`bs4.BeautifulSoup`
+        :return: the page's DOM.
+
+        """
+        return None
+
+    def parse_section(self, section, page):
+        """Parses one of the sections in _sections out of this object's main page.
+
+        :type section: str
+        :param section: the section's name.
+
+        :type page: :class:`bs4.BeautifulSoup`
+        :param page: the page's DOM, as returned by parse_page().
+
+        :rtype: dict
+        :return: the section's attributes.
+
+        """
+        # objects without sections of their own are loaded whole.
+        self.load()
+        return {}
+
+    def load_section(self, section):
+        """Parses a single section of this object's main page and sets its attributes, instead of the whole page as load() does.
+        The page is fetched and parsed on the first call, and kept for the other sections until every section has been
+        parsed out of it, or until the session lets it go to keep others, in which case it's fetched again.
+        Threads loading different sections at once share the page's fetch and DOM, and parse one section at a time.
+
+        :type section: str
+        :param section: the section's name, one of _sections.
+
+        :rtype: :class:`.Base`
+        :return: The current object.
+
+        """
+        if section in self._parsed_sections:
+            return self
+        if not self._sections:
+            return self.load()
+        # read once, as a thread loading another section, or the session, may let the page go meanwhile.
+        page = self._page
+        if page is None:
+            # keyed by id() rather than the object, as objects equal by ID in different sessions keep separate pages.
+            page = _page_loads.do(id(self), self._keep_page)
+
+        def parse(response):
+            # section parsers may edit the DOM as they go, e.g. extracting tags, so only one walks it at a time.
+            with page[2]:
+                if page[1] is None:
+                    page[1] = self.parse_page(response)
+                return self.parse_section(section, page[1])
+
+        self.set(self.session.parse_response(page[0], parse, section))
+        # every thread that kept a page comes through here after, so the last to finish lets it go.
+        with _sections_lock:
+            if section not in self._parsed_sections:
+                self._parsed_sections += (section,)
+            parsed_all = all(name in self._parsed_sections for name in self._sections)
+        if parsed_all:
+            self.session.release_page(self)
+        return self
+
+    def _keep_page(self):
+        # a fetch that was in progress when this thread found no page kept may have kept one since.
+        page = self._page
+        if page is None:
+            # the response, its DOM once a section has to be parsed out of it, and the lock parsing it is done under.
+            page = [self.fetch_page(), None, threading.RLock()]
+            self.session.keep_page(self, page)
+        return page
+
+    def parsed_all_sections(self):
+        """Records that every section has been parsed, as load() does, letting go of any page kept for load_section().
+        """
+        with _sections_lock:
+            self._parsed_sections = tuple(self._sections)
+        self.session.release_page(self)
+
     def set(self, attr_dict):
         """Sets attributes of this user object.
 
@@ -147,3 +341,35 @@ class Base(object):
             else:
                 setattr(self, u"_" + key, attr_dict[key])
         return self
+
+
+class Interned(Base):
+    """Abstract base class for the MAL resources :mod:`myanimelist.catalog` keeps one object of for the whole process.
+
+    Interned resources are shared by every session, so belong to none, and have no page of their own to load:
+    their names come from the catalog's snapshot or the first page that links to them, and are None until then.
+    Once named, they're never renamed, as that would rename them for every session at once.
+    """
+
+    def load(self):
+        """Interned resources have nothing to load, having no session to load it with.
+
+        :rtype: :class:`.Interned`
+        :return: The current object.
+
+        """
+        return self
+
+    def set(self, attr_dict):
+        """Sets attributes of this resource, refusing to rename it once it has a name.
+
+        :type attr_dict: dict
+        :param attr_dict: Parameters to set, with attribute keys.
+
+        :rtype: :class:`.Interned`
+        :return: The current object.
+
+        """
+        if u'name' in attr_dict and self._name is not None and attr_dict[u'name'] != self._name:
+            raise AttributeError("can't rename an interned resource")
+        return super(Interned, self).set(attr_dict)
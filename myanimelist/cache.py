@@ -0,0 +1,393 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Persistent on-disk cache of MAL responses."""
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+
+import utilities
+from base import Base
+from throttle import is_block_page
+from transport import Transport, Response
+
+# the suffix of files being written, before they're renamed into place.
+TEMP_SUFFIX = u'.tmp'
+
+# how old in seconds a file being written has to be before it's taken for one left behind.
+STALE_TEMP_AGE = 60 * 60
+
+
+class ResponseCache(object):
+    """Stores MAL responses on disk, keyed by URL.
+
+    Entries expire after a time-to-live that depends on the family of resource they point to,
+    as given by :func:`myanimelist.utilities.resource_family`.
+    Once the cache grows past its maximum size, the least-recently-used entries are evicted.
+    """
+
+    """Default time-to-live, in seconds, for each resource family.
+    A time-to-live of 0 caches responses but revalidates them on every request; None doesn't cache them at all.
+    """
+    DEFAULT_TTLS = {
+        u'media': 24 * 60 * 60,
+        u'stats': 6 * 60 * 60,
+        u'characters': 7 * 24 * 60 * 60,
+        u'list': 60 * 60,
+        u'profile': 60 * 60,
+        u'other': None
+    }
+
+    def __init__(self, directory, ttls=None, max_size=256 * 1024 * 1024):
+        """Creates a new instance of ResponseCache.
+
+        :type directory: str
+        :param directory: The directory to store cached responses in. Created if it doesn't exist.
+
+        :type ttls: dict
+        :param ttls: Time-to-live overrides in seconds, with resource families as keys. May be omitted.
+
+        :type max_size: int
+        :param max_size: The maximum total size in bytes of cached response bodies.
+
+        :rtype: :class:`.ResponseCache`
+        :return: The desired cache.
+
+        """
+        self.directory = directory
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        # maps entry keys to [body size, last-used time], to decide what to evict.
+        self._entries = {}
+        self._size = 0
+        self._sweep_temp_files()
+        for filename in os.listdir(self.directory):
+            key, extension = os.path.splitext(filename)
+            if extension == u'.body':
+                path = os.path.join(self.directory, filename)
+                self._entries[key] = [os.path.getsize(path), os.path.getmtime(path)]
+                self._size += self._entries[key][0]
+
+    @property
+    def size(self):
+        """The total size in bytes of cached response bodies.
+        """
+        return self._size
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode(u'utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def _write(self, path, content):
+        # written in full beside the entry, then renamed over it, so that readers see the old file or the new one,
+        # never one half-written by a concurrent store.
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=TEMP_SUFFIX)
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(content)
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            # e.g. the disk filling up partway through the write.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _sweep_temp_files(self):
+        # removes files left half-written by a process that died mid-write, leaving any that may still be being written.
+        for filename in os.listdir(self.directory):
+            if filename.endswith(TEMP_SUFFIX):
+                path = os.path.join(self.directory, filename)
+                try:
+                    if time.time() - os.path.getmtime(path) > STALE_TEMP_AGE:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def ttl(self, url):
+        """The time-to-live in seconds for responses from the given URL.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: int
+        :return: The time-to-live for this URL's resource family, or None if it isn't cached.
+
+        """
+        return self.ttls.get(utilities.resource_family(url), self.ttls.get(u'other'))
+
+    def get(self, url):
+        """Reads the cached response for the given URL, whether or not it's expired.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: tuple
+        :return: A tuple(2) of the cached :class:`myanimelist.transport.Response` and the time it was stored at, or None if it isn't cached.
+
+        """
+        key = self._key(url)
+        path = self._path(key)
+        try:
+            with open(path + u'.json', 'rb') as meta_file:
+                meta = json.load(meta_file)
+            with open(path + u'.body', 'rb') as body_file:
+                content = body_file.read()
+        except (IOError, ValueError):
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries[key][1] = time.time()
+        response = Response(meta[u'url'], status_code=meta[u'status_code'], headers=meta[u'headers'],
+                            content=content, encoding=meta[u'encoding'])
+        return response, meta[u'stored_at']
+
+    def lookup(self, url):
+        """Reads the cached response for the given URL, counting a hit if it hasn't expired and a miss otherwise.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: tuple
+        :return: A tuple(2) of the cached :class:`myanimelist.transport.Response` or None if it isn't cached, and whether it's unexpired.
+
+        """
+        entry = self.get(url)
+        ttl = self.ttl(url)
+        fresh = entry is not None and ttl is not None and time.time() - entry[1] < ttl
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return (entry[0] if entry is not None else None), fresh
+
+    def touch(self, url):
+        """Marks the cached response for the given URL as freshly-stored, e.g. after MAL reports it unchanged.
+
+        :type url: str
+        :param url: The URL to refresh.
+
+        """
+        key = self._key(url)
+        path = self._path(key)
+        try:
+            with open(path + u'.json', 'rb') as meta_file:
+                meta = json.load(meta_file)
+            meta[u'stored_at'] = time.time()
+            self._write(path + u'.json', json.dumps(meta))
+        except (IOError, OSError, ValueError):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries[key][1] = time.time()
+
+    def store(self, url, response):
+        """Caches a response for the given URL, evicting old entries if the cache grows too large.
+
+        :type url: str
+        :param url: The URL that was requested.
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: The response to cache.
+
+        """
+        key = self._key(url)
+        path = self._path(key)
+        # the metadata goes in last, so an entry isn't read until its body is in place.
+        self._write(path + u'.body', response.content)
+        self._write(path + u'.json', json.dumps({
+            u'url': url,
+            u'status_code': response.status_code,
+            u'headers': dict(response.headers),
+            u'encoding': response.encoding,
+            u'stored_at': time.time()
+        }))
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries[key][0]
+            self._entries[key] = [len(response.content), time.time()]
+            self._size += len(response.content)
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_size and self._entries:
+            self._remove(min(self._entries, key=lambda k: self._entries[k][1]))
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)[0]
+        for extension in (u'.body', u'.json'):
+            try:
+                os.remove(self._path(key) + extension)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Removes every cached response.
+        """
+        with self._lock:
+            for key in self._entries.keys():
+                self._remove(key)
+        self._sweep_temp_files()
+
+
+class CachingTransport(Transport):
+    """Serves unexpired responses from a :class:`.ResponseCache`, fetching and caching the rest through another transport.
+
+    Expired responses that carry an ETag or Last-Modified header are revalidated with a conditional request,
+    and reused if MAL replies 304 Not Modified.
+    Truncated responses and block pages are passed on but never cached.
+    Requests to resource families the cache has no time-to-live for go straight to the other transport.
+    """
+
+    def __init__(self, transport, cache):
+        """Creates a new instance of CachingTransport.
+
+        :type transport: :class:`myanimelist.transport.Transport`
+        :param transport: The transport to fetch uncached responses through.
+
+        :type cache: :class:`.ResponseCache`
+        :param cache: The cache to serve and store responses in.
+
+        """
+        self.transport = transport
+        self.cache = cache
+        self.revalidations = 0
+
+    def get(self, url, headers=None):
+        if self.cache.ttl(url) is None:
+            # never cached, so there's nothing to look up.
+            return self.transport.get(url, headers=headers)
+        cached, fresh = self.cache.lookup(url)
+        if fresh:
+            cached.from_cache = True
+            return cached
+
+        if cached is not None:
+            # ask MAL to only send the page if it's changed since we cached it.
+            headers = dict(headers or {})
+            if u'ETag' in cached.headers:
+                headers[u'If-None-Match'] = cached.headers[u'ETag']
+            if u'Last-Modified' in cached.headers:
+                headers[u'If-Modified-Since'] = cached.headers[u'Last-Modified']
+
+        response = self.transport.get(url, headers=headers)
+        if response.incomplete or is_block_page(response):
+            # neither is the page, so mustn't stand in for it, nor vouch for the copy already cached.
+            return response
+        if response.status_code == 304 and cached is not None:
+            self.revalidations += 1
+            self.cache.touch(url)
+            cached.from_cache = True
+            cached.not_modified = True
+            return cached
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def post(self, url, data=None):
+        return self.transport.post(url, data=data)
+
+
+def _weaken(value):
+    # copies parsed attributes, with weak references in place of the MAL resources in them.
+    if isinstance(value, Base):
+        return weakref.ref(value)
+    if isinstance(value, dict):
+        return dict((_weaken(key), _weaken(item)) for key, item in value.iteritems())
+    if isinstance(value, (list, tuple, set)):
+        return value.__class__(_weaken(item) for item in value)
+    return value
+
+
+def _strengthen(value):
+    # the reverse of _weaken(), returning None if any of the resources has been let go since.
+    if isinstance(value, weakref.ref):
+        return value()
+    if isinstance(value, dict):
+        copy = {}
+        for key, item in value.iteritems():
+            key, strong_item = _strengthen(key), _strengthen(item)
+            if key is None or (strong_item is None and item is not None):
+                return None
+            copy[key] = strong_item
+        return copy
+    if isinstance(value, (list, tuple, set)):
+        items = [_strengthen(item) for item in value]
+        if any(strong_item is None and item is not None for strong_item, item in zip(items, value)):
+            return None
+        return value.__class__(items)
+    return value
+
+
+class ParsedAttributeCache(object):
+    """Remembers the attributes parsed from recent responses, so that unchanged pages aren't parsed twice.
+
+    The MAL resources among the attributes are only held by weak reference, so that remembering a parse doesn't keep
+    alive the objects the session's identity map would let go. If any of them has been let go, the response is parsed
+    again, as the objects it created would have to be made, and their attributes set, anew.
+    """
+
+    def __init__(self, max_entries=1000):
+        """Creates a new instance of ParsedAttributeCache.
+
+        :type max_entries: int
+        :param max_entries: The maximum number of parses, e.g. of a whole page or one of its sections, to remember.
+
+        :rtype: :class:`.ParsedAttributeCache`
+        :return: The desired cache.
+
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, response, parser, key=None):
+        """Parses a response, reusing the attributes parsed from an identical response for the same URL.
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: The response to parse.
+
+        :type parser: function
+        :param parser: A function that takes a response and returns a dict of parsed attributes.
+
+        :type key: str
+        :param key: Tells apart parsers that parse different attributes out of the same URL's responses.
+
+        :rtype: dict
+        :return: The parsed attributes.
+
+        """
+        digest = hashlib.sha1(response.content).digest()
+        entry_key = (response.url, key)
+        with self._lock:
+            entry = self._entries.pop(entry_key, None)
+            if entry is not None and entry[0] == digest:
+                attrs = _strengthen(entry[1])
+                if attrs is not None:
+                    self._entries[entry_key] = entry
+                    self.hits += 1
+                    return attrs
+
+        attrs = parser(response)
+        with self._lock:
+            self._entries[entry_key] = (digest, _weaken(attrs))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return attrs
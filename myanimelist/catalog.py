@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Keeps one object per genre, producer and publication for the whole process, shared by every session.
+
+These are small, rarely change, and are linked from nearly every anime and manga page, so rather than each session
+making its own, parsers reuse the one interned here. The registries start out with the names in catalog.json,
+a snapshot of MAL's catalog bundled with the package; entities missing from it are interned the first time they're seen.
+Anime and manga number their genres separately, so each has a registry, and a class, of its own.
+
+Interned entities are shared by every session, so pages only name ones that have no name yet, and never rename them
+for everyone: see :class:`myanimelist.base.Interned`. Tags, being made up by users and unbounded in number,
+aren't interned.
+"""
+import json
+import os
+import threading
+
+import genre
+import producer
+import publication
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), u'catalog.json')
+
+
+class Registry(object):
+    """Maps each entity of one type, by ID, to the one object the process shares for it.
+
+    Entities are held for the life of the process and belong to no session, having nothing to load.
+    """
+
+    def __init__(self, cls):
+        """Creates a new instance of Registry.
+
+        :type cls: type
+        :param cls: The entities' class, e.g. :class:`myanimelist.genre.Genre`
+
+        :rtype: :class:`.Registry`
+        :return: The desired registry.
+
+        """
+        self.cls = cls
+        self._objects = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, key):
+        return key in self._objects
+
+    def get(self, key, name=None):
+        """Returns the entity with the given ID, interning it on first request.
+
+        :type key: object
+        :param key: The entity's ID, e.g. a genre's ID.
+
+        :type name: str
+        :param name: A name for the entity, e.g. a page's link text, given to it only if it has none yet.
+
+        :rtype: :class:`myanimelist.base.Interned`
+        :return: The entity's object.
+
+        """
+        obj = self._objects.get(key)
+        if obj is None or (name is not None and obj._name is None):
+            with self._lock:
+                obj = self._objects.get(key)
+                if obj is None:
+                    obj = self.cls(None, key)
+                    self._objects[key] = obj
+                # named under the lock, so that pages naming it at once don't race to.
+                if name is not None and obj._name is None:
+                    obj.set({u'name': name})
+        return obj
+
+    def load(self, names):
+        """Interns entities with the given names, leaving the names of ones already interned alone.
+
+        :type names: dict
+        :param names: Names, keyed by entity ID.
+
+        """
+        for key, name in names.iteritems():
+            self.get(key, name)
+
+
+GENRES = {
+    u'anime': Registry(genre.AnimeGenre),
+    u'manga': Registry(genre.MangaGenre),
+}
+PRODUCERS = Registry(producer.Producer)
+PUBLICATIONS = Registry(publication.Publication)
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Interns the genres, producers and publications in a catalog snapshot.
+
+    :type path: str
+    :param path: The snapshot's path. Defaults to the one bundled with the package.
+
+    """
+    with open(path) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+    for registry, section in [(GENRES[u'anime'], u'anime_genres'), (GENRES[u'manga'], u'manga_genres'),
+                              (PRODUCERS, u'producers'), (PUBLICATIONS, u'publications')]:
+        registry.load(dict((int(key), name) for key, name in snapshot.get(section, {}).iteritems()))
+
+
+load_snapshot()
@@ -25,6 +25,11 @@ class Character(Base):
     """Primary interface to character resources on MAL.
     """
 
+    __slots__ = ('id', '_name', '_full_name', '_name_jpn', '_description', '_voice_actors', '_animeography',
+                 '_mangaography', '_num_favorites', '_favorites', '_picture', '_pictures', '_clubs')
+
+    _sections = (u'sidebar', u'details')
+
     def __init__(self, session, character_id):
         """Creates a new instance of Character.
 
@@ -151,7 +156,20 @@ class Character(Base):
 
         """
         character_info = self.parse_sidebar(character_page)
+        character_info.update(self.parse_details(character_page))
+        return character_info
 
+    def parse_details(self, character_page):
+        """Parses the DOM and returns character attributes in the main column: names, description and voice actors.
+
+        :type character_page: :class:`bs4.BeautifulSoup`
+        :param character_page: MAL character page's DOM
+
+        :rtype: dict
+        :return: Character attributes.
+
+        """
+        character_info = {}
         second_col = \
             character_page.find(u'div', {'id': 'content'}).find(u'table').find(u'tr').find_all(u'td', recursive=False)[
                 1]
@@ -321,10 +339,54 @@ class Character(Base):
         :return: Current character object.
 
         """
-        character = self.session.session.get(u'http://myanimelist.net/character/' + str(self.id)).text
-        self.set(self.parse(utilities.get_clean_dom(character)))
+        character = self.session.fetch(u'http://myanimelist.net/character/' + str(self.id)).text
+        self.set(self.parse(utilities.get_clean_dom(character, self.session.parser_for(u'character'), u'character')))
+        self.parsed_all_sections()
         return self
 
+    def fetch_page(self):
+        """Fetches the MAL character page, for load_section().
+
+        :rtype: :class:`myanimelist.transport.Response`
+        :return: the character page's response.
+
+        """
+        return self.session.fetch(u'http://myanimelist.net/character/' + str(self.id))
+
+    def parse_page(self, response):
+        """Parses the MAL character page, for load_section().
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: the character page's response.
+
+        :rtype: :class:`bs4.BeautifulSoup`
+        :return: the character page's DOM.
+
+        :raises: :class:`.InvalidCharacterError`
+
+        """
+        character_page = utilities.get_clean_dom(response.text, self.session.parser_for(u'character'), u'character')
+        if character_page.find(u'div', {'class': 'badresult'}):
+            raise InvalidCharacterError(self.id)
+        return character_page
+
+    def parse_section(self, section, character_page):
+        """Parses one section of the character page: the sidebar, or the details in the main column.
+
+        :type section: str
+        :param section: 'sidebar' or 'details'.
+
+        :type character_page: :class:`bs4.BeautifulSoup`
+        :param character_page: MAL character page's DOM
+
+        :rtype: dict
+        :return: the section's character attributes.
+
+        """
+        if section == u'sidebar':
+            return self.parse_sidebar(character_page)
+        return self.parse_details(character_page)
+
     def load_favorites(self):
         """(Deprecated)Fetches the MAL character favorites page and sets the current character's favorites attributes.
 
@@ -335,10 +397,10 @@ class Character(Base):
         import warnings
         warnings.warn('Character favorites page is no longer exists.',DeprecationWarning)
         '''
-        character = self.session.session.get(
+        character = self.session.fetch(
             u'http://myanimelist.net/character/' + str(self.id) + u'/' + utilities.urlencode(
                 self.name) + u'/favorites').text
-        self.set(self.parse_favorites(utilities.get_clean_dom(character)))
+        self.set(self.parse_favorites(utilities.get_clean_dom(character, self.session.parser_for(u'other'), u'other')))
         return self
         '''
         pass
@@ -350,10 +412,10 @@ class Character(Base):
         :return: Current character object.
 
         """
-        character = self.session.session.get(
+        character = self.session.fetch(
             u'http://myanimelist.net/character/' + str(self.id) + u'/' + utilities.urlencode(
                 self.name) + u'/pictures').text
-        self.set(self.parse_pictures(utilities.get_clean_dom(character)))
+        self.set(self.parse_pictures(utilities.get_clean_dom(character, self.session.parser_for(u'other'), u'other')))
         return self
 
     def load_clubs(self):
@@ -363,90 +425,78 @@ class Character(Base):
         :return: Current character object.
 
         """
-        character = self.session.session.get(
+        character = self.session.fetch(
             u'http://myanimelist.net/character/' + str(self.id) + u'/' + utilities.urlencode(
                 self.name) + u'/clubs').text
-        self.set(self.parse_clubs(utilities.get_clean_dom(character)))
+        self.set(self.parse_clubs(utilities.get_clean_dom(character, self.session.parser_for(u'other'), u'other')))
         return self
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'details')
     def name(self):
         """Character name.
         """
         return self._name
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def full_name(self):
         """Character's full name.
         """
         return self._full_name
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'details')
     def name_jpn(self):
         """Character's Japanese name.
         """
         return self._name_jpn
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'details')
     def description(self):
         """Character's description.
         """
         return self._description
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'details')
     def voice_actors(self):
         """Voice actor dict for this character, with :class:`myanimelist.person.Person` objects as keys and the language as values.
         """
         return self._voice_actors
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def animeography(self):
         """Anime appearance dict for this character, with :class:`myanimelist.anime.Anime` objects as keys and the type of role as values, e.g. 'Main'
         """
         return self._animeography
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def mangaography(self):
         """Manga appearance dict for this character, with :class:`myanimelist.manga.Manga` objects as keys and the type of role as values, e.g. 'Main'
         """
         return self._mangaography
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def num_favorites(self):
         """Number of users who have favourited this character.
         """
         return self._num_favorites
 
-    @property
     @loadable(u'load_favorites')
     def favorites(self):
         """List of users who have favourited this character.
         """
         return self._favorites
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def picture(self):
         """URL of primary picture for this character.
         """
         return self._picture
 
-    @property
     @loadable(u'load_pictures')
     def pictures(self):
         """List of picture URLs for this character.
         """
         return self._pictures
 
-    @property
     @loadable(u'load_clubs')
     def clubs(self):
         """List of clubs relevant to this character.
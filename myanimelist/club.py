@@ -25,12 +25,10 @@ class Club(Base):
         # TODO
         pass
 
-    @property
     @loadable(u'load')
     def name(self):
         return self._name
 
-    @property
     @loadable(u'load')
     def num_members(self):
         return self._num_members
@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Coalesces concurrent identical requests to MAL into one."""
+import sys
+import threading
+
+
+class _Call(object):
+    """A call in progress, and its outcome once it's done.
+    """
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.done = threading.Event()
+        self.result = None
+        self.exc_info = None
+
+
+class SingleFlight(object):
+    """Runs at most one call per key at a time. Callers arriving while a call for their key is in progress
+    wait for it and share its result, or its exception.
+    A call made again for its own key, further down the thread running it, runs on its own rather than waiting on itself.
+    """
+
+    def __init__(self):
+        """Creates a new instance of SingleFlight.
+
+        :rtype: :class:`.SingleFlight`
+        :return: The desired call group.
+
+        """
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """Calls func(*args, **kwargs), unless a call for the given key is already in progress,
+        in which case its outcome is shared instead.
+
+        :type key: object
+        :param key: A hashable key identifying the call.
+
+        :type func: function
+        :param func: The function to call.
+
+        :return: The result of the call.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            reentrant = not leader and call.thread is threading.current_thread()
+            if leader:
+                call = self._calls[key] = _Call()
+            elif not reentrant:
+                self.coalesced += 1
+
+        if reentrant:
+            # the call in progress is this thread's own, so waiting for it would never end.
+            return func(*args, **kwargs)
+        if not leader:
+            call.done.wait()
+            if call.exc_info is not None:
+                raise call.exc_info[0], call.exc_info[1], call.exc_info[2]
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except:
+            call.exc_info = sys.exc_info()
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
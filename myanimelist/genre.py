@@ -1,7 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-from base import Base, MalformedPageError, InvalidBaseError, loadable
+from base import Interned, MalformedPageError, InvalidBaseError, loadable
 
 
 class MalformedGenrePageError(MalformedPageError):
@@ -12,7 +12,12 @@ class InvalidGenreError(InvalidBaseError):
     pass
 
 
-class Genre(Base):
+class Genre(Interned):
+    """The type of media this is a genre of, 'anime' or 'manga', which number their genres separately.
+    Genres of either type are told apart by their class, so anime genre 41 never equals manga genre 41.
+    """
+    media_type = None
+
     def __init__(self, session, genre_id):
         super(Genre, self).__init__(session)
         self.id = genre_id
@@ -20,11 +25,18 @@ class Genre(Base):
             raise InvalidGenreError(self.id)
         self._name = None
 
-    def load(self):
-        # TODO
-        pass
-
-    @property
     @loadable(u'load')
     def name(self):
         return self._name
+
+
+class AnimeGenre(Genre):
+    """A genre of anime.
+    """
+    media_type = u'anime'
+
+
+class MangaGenre(Genre):
+    """A genre of manga.
+    """
+    media_type = u'manga'
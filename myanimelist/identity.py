@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Keeps one object per MAL resource in a session, so that every part of a program shares its loaded attributes."""
+import collections
+import threading
+import weakref
+
+
+class IdentityMap(object):
+    """Maps each MAL resource, by type and ID, to the one object a session hands out for it.
+
+    Objects are held by weak reference, so they're let go once nothing else uses them,
+    save for the most recently requested ones, which are held strongly so that they survive between uses.
+    """
+
+    def __init__(self, max_recent=1000):
+        """Creates a new instance of IdentityMap.
+
+        :type max_recent: int
+        :param max_recent: The number of most recently requested objects to keep alive. 0 keeps none.
+
+        :rtype: :class:`.IdentityMap`
+        :return: The desired identity map.
+
+        """
+        self.max_recent = max_recent
+        self.hits = 0
+        self._objects = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, cls, session, key):
+        """Returns the object for the given resource, creating it with cls(session, key) if there isn't one.
+
+        :type cls: type
+        :param cls: The resource's class, e.g. :class:`myanimelist.anime.Anime`
+
+        :type session: :class:`myanimelist.session.Session`
+        :param session: The session to create the object in.
+
+        :type key: object
+        :param key: The resource's ID, e.g. an anime's ID or a user's username.
+
+        :rtype: :class:`myanimelist.base.Base`
+        :return: The resource's object.
+
+        """
+        identity = (cls, key)
+        with self._lock:
+            obj = self._objects.get(identity)
+            if obj is None:
+                obj = cls(session, key)
+                self._objects[identity] = obj
+            else:
+                self.hits += 1
+            if self.max_recent:
+                self._recent.pop(identity, None)
+                self._recent[identity] = obj
+                while len(self._recent) > self.max_recent:
+                    self._recent.popitem(last=False)
+        return obj
+
+    def clear(self):
+        """Forgets every object, so that later requests create new ones.
+        """
+        with self._lock:
+            self._objects.clear()
+            self._recent.clear()
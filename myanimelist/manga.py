@@ -20,6 +20,8 @@ class InvalidMangaError(media.InvalidMediaError):
 class Manga(media.Media):
     """Primary interface to manga resources on MAL.
     """
+    __slots__ = ('_volumes', '_chapters', '_published', '_authors', '_serialization')
+
     _status_terms = [
         u'Unknown',
         u'Publishing',
@@ -48,17 +50,22 @@ class Manga(media.Media):
         self._authors = None
         self._serialization = None
 
-    def parse_serialization(self, manga_page):
+    def parse_serialization(self, manga_page, labels=None):
         """Parse the DOM and returns manga serialization.
 
         :type manga_page: :class:`bs4.BeautifulSoup`
         :param manga_page: MAL manga page's DOM
 
+        :type labels: dict
+        :param labels: The page's sidebar fields, as indexed by :func:`myanimelist.utilities.sidebar_labels`.
+            Built from manga_page if omitted.
+
         :return: publication obj
         """
         result = None
-        info_panel_first = manga_page.find(u'div', {'id': 'content'}).find(u'table').find(u'td')
-        serialization_tag = info_panel_first.find(text=u'Serialization:').parent.parent
+        if labels is None:
+            labels = utilities.sidebar_labels(manga_page)
+        serialization_tag = labels[u'Serialization']
         publication_link = serialization_tag.find('a')
         if publication_link:
             link_parts = publication_link.get('href').split('mid=')
@@ -66,8 +73,7 @@ class Manga(media.Media):
             # e.g. link_parts
             # [u'/manga/magazine/1/Big_Comic_Original']
             pub_id = int(link_parts[0].split('/')[-2])
-            pub_dict = {'name': publication_link.text}
-            result = self.session.publication(pub_id).set(pub_dict)
+            result = self.session.publication(pub_id, name=publication_link.text)
         return result
 
     def parse_sidebar(self, manga_page, manga_page_original=None):
@@ -84,6 +90,8 @@ class Manga(media.Media):
 
         :raises: :class:`.InvalidMangaError`, :class:`.MalformedMangaPageError`
         """
+        if manga_page_original is None:
+            manga_page_original = manga_page
         # if MAL says the series doesn't exist, raise an InvalidMangaError.
         error_tag = manga_page.find(u'div', {'class': 'badresult'})
         if error_tag:
@@ -99,12 +107,11 @@ class Manga(media.Media):
                 raise
 
         # otherwise, begin parsing.
-        manga_info = super(Manga, self).parse_sidebar(manga_page, manga_page_original)
-
-        info_panel_first = manga_page.find(u'div', {'id': 'content'}).find(u'table').find(u'td')
+        labels = utilities.sidebar_labels(manga_page_original)
+        manga_info = super(Manga, self).parse_sidebar(manga_page, manga_page_original, labels)
 
         try:
-            volumes_tag = info_panel_first.find(text=u'Volumes:').parent.parent
+            volumes_tag = labels[u'Volumes']
             utilities.extract_tags(volumes_tag.find_all(u'span', {'class': 'dark_text'}))
             manga_info[u'volumes'] = int(volumes_tag.text.strip()) if volumes_tag.text.strip() != 'Unknown' else None
         except:
@@ -112,7 +119,7 @@ class Manga(media.Media):
                 raise
 
         try:
-            chapters_tag = info_panel_first.find(text=u'Chapters:').parent.parent
+            chapters_tag = labels[u'Chapters']
             utilities.extract_tags(chapters_tag.find_all(u'span', {'class': 'dark_text'}))
             manga_info[u'chapters'] = int(chapters_tag.text.strip()) if chapters_tag.text.strip() != 'Unknown' else None
         except:
@@ -120,7 +127,7 @@ class Manga(media.Media):
                 raise
 
         try:
-            published_tag = info_panel_first.find(text=u'Published:').parent.parent
+            published_tag = labels[u'Published']
             utilities.extract_tags(published_tag.find_all(u'span', {'class': 'dark_text'}))
             published_parts = published_tag.text.strip().split(u' to ')
             if len(published_parts) == 1:
@@ -153,7 +160,7 @@ class Manga(media.Media):
                 raise
 
         try:
-            authors_tag = info_panel_first.find(text=u'Authors:').parent.parent
+            authors_tag = labels[u'Authors']
             utilities.extract_tags(authors_tag.find_all(u'span', {'class': 'dark_text'}))
             manga_info[u'authors'] = {}
             for author_link in authors_tag.find_all('a'):
@@ -167,29 +174,26 @@ class Manga(media.Media):
                 raise
 
         try:
-            manga_info[u'serialization'] = self.parse_serialization(manga_page)
+            manga_info[u'serialization'] = self.parse_serialization(manga_page, labels)
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         return manga_info
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def volumes(self):
         """The number of volumes in this manga.
         """
         return self._volumes
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def chapters(self):
         """The number of chapters in this manga.
         """
         return self._chapters
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def published(self):
         """A tuple(2) containing up to two :class:`datetime.date` objects representing the start and end dates of this manga's publishing.
 
@@ -203,15 +207,13 @@ class Manga(media.Media):
         """
         return self._published
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def authors(self):
         """An author dict with :class:`myanimelist.person.Person` objects of the authors as keys, and strings describing the duties of these authors as values.
         """
         return self._authors
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def serialization(self):
         """The :class:`myanimelist.publication.Publication` involved in the first serialization of this manga.
         """
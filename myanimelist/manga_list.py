@@ -2,11 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import media_list
+from manga import Manga
 
 
 class MangaList(media_list.MediaList):
     __id_attribute = "username"
 
+    _user_status_terms = media_list.user_status_table(u"read")
+    _media_status_terms = Manga._status_terms
+
     def __init__(self, session, user_name):
         super(MangaList, self).__init__(session, user_name)
 
@@ -18,6 +22,10 @@ class MangaList(media_list.MediaList):
     def verb(self):
         return "read"
 
+    @property
+    def series_type_terms(self):
+        return {1: u'Manga', 2: u'Novel', 3: u'One-shot', 4: u'Doujinshi', 5: u'Manhwa', 6: u'Manhua', 7: u'OEL'}
+
     def parse_entry_media_attributes(self, soup):
         attributes = super(MangaList, self).parse_entry_media_attributes(soup)
 
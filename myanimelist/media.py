@@ -31,6 +31,12 @@ class Media(Base):
     """
     __metaclass__ = abc.ABCMeta
 
+    __slots__ = ('id', '_title', '_picture', '_alternative_titles', '_type', '_status', '_genres', '_score', '_rank',
+                 '_popularity', '_members', '_favorites', '_popular_tags', '_synopsis', '_related', '_characters',
+                 '_score_stats', '_status_stats')
+
+    _sections = (u'sidebar', u'synopsis', u'related')
+
     @abc.abstractproperty
     def _status_terms(self):
         """
@@ -64,8 +70,8 @@ class Media(Base):
 
         """
         media_type = cls.__name__.lower()
-        p = session.session.get(u'http://myanimelist.net/' + media_type + '.php?o=9&c[]=a&c[]=d&cv=2&w=1').text
-        soup = utilities.get_clean_dom(p)
+        p = session.fetch(u'http://myanimelist.net/' + media_type + '.php?o=9&c[]=a&c[]=d&cv=2&w=1').text
+        soup = utilities.get_clean_dom(p, session.parser_for(u'other'), u'other')
         latest_entry = soup.find(u"div", {u"class": u"hoverinfo"})
         if not latest_entry:
             raise MalformedMediaPageError(0, p, u"No media entries found on recently-added page")
@@ -106,40 +112,53 @@ class Media(Base):
         self._score_stats = None
         self._status_stats = None
 
-    def parse_genres(self, media_page):
+    def parse_genres(self, media_page, labels=None):
         """Parse the DOM and returns media genres in the sidebar.
 
         :type media_page: :class:`bs4.BeautifulSoup`
         :param media_page: MAL media page's DOM
 
+        :type labels: dict
+        :param labels: The page's sidebar fields, as indexed by :func:`myanimelist.utilities.sidebar_labels`.
+            Built from media_page if omitted.
+
         :rtype: list
-        :return: media genres.
+        :return: media genres, named by their links' text, e.g. 'Slice of Life' rather than the URL's 'Slice_of_Life'.
         """
-        info_panel = media_page.select('div#content table td')[0]
-        genres_tag = info_panel.find(text=u'Genres:').parent.parent
+        if labels is None:
+            labels = utilities.sidebar_labels(media_page)
+        genres_tag = labels[u'Genres']
         # utilities.extract_tags(genres_tag.find_all(u'span', {'class': 'dark_text'}))
         genres = []
         for genre_link in genres_tag.find_all('a'):
             # genre_link e.g: '/anime/genre/29/Space'
             link_parts = genre_link.get('href').split('/')
             genre_id = int(link_parts[-2])
-            genre_text = link_parts[-1]
-            genre = self.session.genre(genre_id).set({'name': genre_text})
-            genres.append(genre)
+            genres.append(self.session.genre(genre_id, self.__class__.__name__.lower(), name=genre_link.text))
         return genres
 
-    def parse_sidebar(self, media_page, media_page_original=None):
+    def parse_sidebar(self, media_page, media_page_original=None, labels=None):
         """Parses the DOM and returns media attributes in the sidebar.
 
         :type media_page: :class:`bs4.BeautifulSoup`
         :param media_page: MAL media page's DOM
 
+        :type media_page_original: :class:`bs4.BeautifulSoup`
+        :param media_page_original: MAL media page's DOM, for the current page layout. Defaults to media_page.
+
+        :type labels: dict
+        :param labels: The page's sidebar fields, as indexed by :func:`myanimelist.utilities.sidebar_labels`.
+            Built from media_page_original if omitted. Subclasses parsing fields of their own build it once
+            and pass it in, so that one pass over the page's labels serves both their fields and these.
+
         :rtype: dict
         :return: media attributes.
 
         :raises: InvalidMediaError, MalformedMediaPageError
 
         """
+        if media_page_original is None:
+            media_page_original = media_page
         media_info = {}
 
         # if MAL says the series doesn't exist, raise an InvalidMediaError.
@@ -147,6 +166,9 @@ class Media(Base):
         if error_tag:
             raise InvalidMediaError(self.id)
 
+        if labels is None:
+            labels = utilities.sidebar_labels(media_page_original)
+
         try:
             title_tag = media_page.find(u'div', {'id': 'contentWrapper'}).find(u'h1')
             if not title_tag.find(u'div'):
@@ -198,25 +220,26 @@ class Media(Base):
 
         try:
             try:
-                type_tag = info_panel_first.find(text=u'Type:').parent.parent
+                type_tag = labels[u'Type']
                 utilities.extract_tags(type_tag.find_all(u'span', {'class': 'dark_text'}))
                 media_info[u'type'] = type_tag.text.strip()
-            except AttributeError:
-                type_tag = [x for x in info_panel_first.find_all('div') if 'Type:' in x.text][0]
+            except KeyError:
+                # the older layout, whose labels hold their values too.
+                type_tag = utilities.sidebar_field(labels, u'Type')
                 media_info[u'type'] = type_tag.text.split(':')[-1].strip()
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            status_tag = [x for x in media_page.find_all('span')if 'Status:' in x.text][0].parent
+            status_tag = labels[u'Status']
             media_info[u'status'] = status_tag.text.split(':')[1].strip()
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            media_info[u'genres'] = self.parse_genres(media_page_original)
+            media_info[u'genres'] = self.parse_genres(media_page_original, labels)
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
@@ -247,54 +270,50 @@ class Media(Base):
 
         try:
             try:
-                rank_tag = info_panel_first.find(text=u'Ranked:').parent.parent
+                rank_tag = labels[u'Ranked']
                 utilities.extract_tags(rank_tag.find_all())
                 media_info[u'rank'] = int(rank_tag.text.strip()[1:].replace(u',', ''))
-            except AttributeError:
-                rank_tag = filter(lambda x: 'Ranked:' in x.text, media_page_original.find_all('div', {'class':'spaceit'}))
-                media_info[u'rank'] = int(rank_tag[0].text.split('#')[-1].strip())
-
+            except KeyError:
+                rank_tag = utilities.sidebar_field(labels, u'Ranked')
+                # the footnote marker after the rank.
+                utilities.extract_tags(rank_tag.find_all(u'sup'))
+                media_info[u'rank'] = int(rank_tag.text.split('#')[-1].strip().replace(u',', ''))
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            try :
-                popularity_tag = info_panel_first.find(text=u'Popularity:').parent.parent
+            try:
+                popularity_tag = labels[u'Popularity']
                 utilities.extract_tags(popularity_tag.find_all())
                 media_info[u'popularity'] = int(popularity_tag.text.strip()[1:].replace(u',', ''))
-            except AttributeError :
-                rank_tag = filter(lambda x: 'Popularity' in x.text,
-                                  media_page_original.find_all('span', {'class':'dark_text'}))[0].parent
-                media_info[u'popularity'] = int(rank_tag.text.split('#')[-1].strip())
+            except KeyError:
+                popularity_tag = utilities.sidebar_field(labels, u'Popularity')
+                media_info[u'popularity'] = int(popularity_tag.text.split('#')[-1].strip().replace(u',', ''))
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            try :
-                members_tag = info_panel_first.find(text=u'Members:').parent.parent
+            try:
+                members_tag = labels[u'Members']
                 utilities.extract_tags(members_tag.find_all())
                 media_info[u'members'] = int(members_tag.text.strip().replace(u',', ''))
-            except AttributeError :
-                members_tag = filter(lambda x: 'Members' in x.text,
-                                  media_page_original.find_all('span', {'class':'dark_text'}))[0].parent
+            except KeyError:
+                members_tag = utilities.sidebar_field(labels, u'Members')
                 media_info[u'members'] = int(members_tag.text.split(':')[-1].strip().replace(u',', ''))
-
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
 
         try:
-            try :
-                favorites_tag = info_panel_first.find(text=u'Favorites:').parent.parent
+            try:
+                favorites_tag = labels[u'Favorites']
                 utilities.extract_tags(favorites_tag.find_all())
                 media_info[u'favorites'] = int(favorites_tag.text.strip().replace(u',', ''))
-            except AttributeError :
-                favorites_tag = filter(lambda x: 'Favorites' in x.text,
-                                  media_page_original.find_all('span', {'class':'dark_text'}))[0].parent
-                media_info[u'favorites'] = int(favorites_tag.text.split(':')[-1].strip().replace(u',', ''))                
-            
+            except KeyError:
+                favorites_tag = utilities.sidebar_field(labels, u'Favorites')
+                media_info[u'favorites'] = int(favorites_tag.text.split(':')[-1].strip().replace(u',', ''))
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
@@ -310,7 +329,7 @@ class Media(Base):
                     num_people = int(re.match(r'(?P<people>[0-9]+) people', tag_link.get('title')).group('people'))
                     media_info[u'popular_tags'][tag] = num_people
             except AttributeError:
-                tags_tag = media_page_original.find('span',text='Genres:').parent
+                tags_tag = labels[u'Genres']
                 media_info[u'popular_tags'] = {}
                 for tag_link in tags_tag.find_all('a'):
                     tag = self.session.tag(tag_link.text.lower())
@@ -405,19 +424,83 @@ class Media(Base):
             result = rs_tag.text
         return result
 
+    def parse_related(self, media_page, media_page_original=None):
+        """Parses the DOM and returns related media.
+        Leaves the DOM as it is, so the other sections can be parsed from it afterwards.
+
+        :type media_page: :class:`bs4.BeautifulSoup`
+        :param media_page: MAL media page's DOM
+
+        :type media_page_original: :class:`bs4.BeautifulSoup`
+        :param media_page_original: MAL media page's DOM, for the current page layout. Defaults to media_page.
+
+        :rtype: dict
+        :return: related media, keyed by relation type.
+
+        """
+        if media_page_original is None:
+            media_page_original = media_page
+        related_title = media_page.find(u'h2', text=u'Related ' + self.__class__.__name__)
+        if not related_title:
+            # check once again using a single function if the first method found none
+            return self.parse_related_media(media_page_original)
+        related_elt = related_title.parent
+        if related_elt.find(u'table', {u'class': u'anime_detail_related_anime'}) is not None:
+            # the current layout lists related media in a table, rather than as links following their relation.
+            return self.parse_related_media(related_elt)
+        related = {}
+        for link in related_elt.find_all(u'a'):
+            if link.find_parent(u'h2') is not None:
+                # links in the section headers, e.g. to edit them.
+                continue
+            href = link.get(u'href').replace(u'http://myanimelist.net', '')
+            if not re.match(r'/(anime|manga)', href):
+                break
+            curr_elt = link.previous_sibling
+            if curr_elt is None:
+                # we've reached the end of the list.
+                break
+            related_type = None
+            while True:
+                if not curr_elt:
+                    raise MalformedAnimePageError(self.id, related_elt,
+                                                  message="Prematurely reached end of related anime listing")
+                if isinstance(curr_elt, bs4.NavigableString):
+                    type_match = re.match(u'(?P<type>[a-zA-Z\ \-]+):', curr_elt)
+                    if type_match:
+                        related_type = type_match.group(u'type')
+                        break
+                curr_elt = curr_elt.previous_sibling
+            title = link.text
+            # parse link: may be manga or anime.
+            href_parts = href.split(u'/')
+            # sometimes links on MAL are broken, of the form /anime//
+            if href_parts[2] == '':
+                continue
+            # of the form: /(anime|manga)/1/Cowboy_Bebop
+            obj_id = int(href_parts[2])
+            new_obj = getattr(self.session, href_parts[1])(obj_id).set({'title': title})
+            if related_type not in related:
+                related[related_type] = [new_obj]
+            else:
+                related[related_type].append(new_obj)
+        return related
+
     def parse(self, media_page, media_page_original=None):
         """Parses the DOM and returns media attributes in the main-content area.
 
         :type media_page: :class:`bs4.BeautifulSoup`
         :param media_page: MAL media page's DOM
 
-        :type media_page: :class:`bs4.BeautifulSoup`
-        :param media_page: MAL media page's DOM unclean
+        :type media_page_original: :class:`bs4.BeautifulSoup`
+        :param media_page_original: MAL media page's DOM, for the current page layout. Defaults to media_page.
 
         :rtype: dict
         :return: media attributes.
 
         """
+        if media_page_original is None:
+            media_page_original = media_page
         media_info = self.parse_sidebar(media_page, media_page_original)
 
         try:
@@ -427,50 +510,7 @@ class Media(Base):
                 raise
 
         try:
-            related_title = media_page.find(u'h2', text=u'Related ' + self.__class__.__name__)
-            if related_title:
-                related_elt = related_title.parent
-                utilities.extract_tags(related_elt.find_all(u'h2'))
-                related = {}
-                for link in related_elt.find_all(u'a'):
-                    href = link.get(u'href').replace(u'http://myanimelist.net', '')
-                    if not re.match(r'/(anime|manga)', href):
-                        break
-                    curr_elt = link.previous_sibling
-                    if curr_elt is None:
-                        # we've reached the end of the list.
-                        break
-                    related_type = None
-                    while True:
-                        if not curr_elt:
-                            raise MalformedAnimePageError(self.id, related_elt,
-                                                          message="Prematurely reached end of related anime listing")
-                        if isinstance(curr_elt, bs4.NavigableString):
-                            type_match = re.match(u'(?P<type>[a-zA-Z\ \-]+):', curr_elt)
-                            if type_match:
-                                related_type = type_match.group(u'type')
-                                break
-                        curr_elt = curr_elt.previous_sibling
-                    title = link.text
-                    # parse link: may be manga or anime.
-                    href_parts = href.split(u'/')
-                    # sometimes links on MAL are broken, of the form /anime//
-                    if href_parts[2] == '':
-                        continue
-                    # of the form: /(anime|manga)/1/Cowboy_Bebop
-                    obj_id = int(href_parts[2])
-                    new_obj = getattr(self.session, href_parts[1])(obj_id).set({'title': title})
-                    if related_type not in related:
-                        related[related_type] = [new_obj]
-                    else:
-                        related[related_type].append(new_obj)
-                media_info[u'related'] = related
-            else:
-                media_info[u'related'] = None
-
-            # check once again using a single function if the first method found none
-            if media_info[u'related'] is None:
-                media_info[u'related'] = self.parse_related_media(media_page_original)
+            media_info[u'related'] = self.parse_related(media_page, media_page_original)
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
@@ -577,10 +617,15 @@ class Media(Base):
         :type character_page: :class:`bs4.BeautifulSoup`
         :param character_page: MAL character page's DOM
 
+        :type character_page_original: :class:`bs4.BeautifulSoup`
+        :param character_page_original: MAL character page's DOM, for the current page layout. Defaults to character_page.
+
         :rtype: dict
         :return: character attributes.
 
         """
+        if character_page_original is None:
+            character_page_original = character_page
         media_info = self.parse_sidebar(character_page, character_page_original)
 
         try:
@@ -633,12 +678,64 @@ class Media(Base):
         :return: current media object.
 
         """
-        media_page = self.session.session.get(
-            u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(self.id)).text
-        media_page_original = bs4.BeautifulSoup(media_page,'lxml')
-        self.set(self.parse(utilities.get_clean_dom(media_page), media_page_original))
+        def parse_media_page(response):
+            # one tree serves both the old-layout and the current-layout lookups.
+            return self.parse(utilities.get_clean_dom(response.text, self.session.parser_for(u'media'), u'media'))
+
+        response = self.session.fetch(
+            u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(self.id))
+        self.set(self.session.parse_response(response, parse_media_page))
+        self.parsed_all_sections()
         return self
 
+    def fetch_page(self):
+        """Fetches the MAL media page, for load_section().
+
+        :rtype: :class:`myanimelist.transport.Response`
+        :return: the media page's response.
+
+        """
+        return self.session.fetch(u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(self.id))
+
+    def parse_page(self, response):
+        """Parses the MAL media page, for load_section().
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: the media page's response.
+
+        :rtype: :class:`bs4.BeautifulSoup`
+        :return: the media page's DOM.
+
+        """
+        media_page = utilities.get_clean_dom(response.text, self.session.parser_for(u'media'), u'media')
+        if media_page.find(u'div', {'class': 'badresult'}):
+            # raises the error for this media type, whichever section was asked for.
+            self.parse_sidebar(media_page)
+        return media_page
+
+    def parse_section(self, section, media_page):
+        """Parses one section of the media page: the sidebar, the synopsis, or the related media.
+
+        :type section: str
+        :param section: 'sidebar', 'synopsis' or 'related'.
+
+        :type media_page: :class:`bs4.BeautifulSoup`
+        :param media_page: MAL media page's DOM
+
+        :rtype: dict
+        :return: the section's media attributes.
+
+        """
+        if section == u'sidebar':
+            return self.parse_sidebar(media_page)
+        media_info = {}
+        try:
+            media_info[section] = getattr(self, u'parse_' + section)(media_page)
+        except:
+            if not self.session.suppress_parse_exceptions:
+                raise
+        return media_info
+
     def load_stats(self):
         """Fetches the MAL media statistics page and sets the current media's statistics attributes.
 
@@ -646,9 +743,9 @@ class Media(Base):
         :return: current media object.
 
         """
-        stats_page = self.session.session.get(u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(
+        stats_page = self.session.fetch(u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(
             self.id) + u'/' + utilities.urlencode(self.title) + u'/stats').text
-        self.set(self.parse_stats(utilities.get_clean_dom(stats_page)))
+        self.set(self.parse_stats(utilities.get_clean_dom(stats_page, self.session.parser_for(u'stats'), u'stats')))
         return self
 
     def load_characters(self):
@@ -660,125 +757,108 @@ class Media(Base):
         """
         character_page_url = u'http://myanimelist.net/' + self.__class__.__name__.lower() + u'/' + str(
                 self.id) + u'/' + utilities.urlencode(self.title) + u'/characters'
-        characters_page = self.session.session.get(character_page_url).text
-        characters_page_original = bs4.BeautifulSoup(characters_page,'lxml') 
-        self.set(self.parse_characters(utilities.get_clean_dom(characters_page), characters_page_original))
+        characters_page = self.session.fetch(character_page_url).text
+        self.set(self.parse_characters(
+            utilities.get_clean_dom(characters_page, self.session.parser_for(u'characters'), u'characters')))
         return self
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def title(self):
         """Media's title.
         """
         return self._title
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def picture(self):
         """URL of media's primary pictures.
         """
         return self._picture
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def alternative_titles(self):
         """Alternative titles dict, with types of titles, e.g. 'Japanese', 'English', or 'Synonyms' as keys, and lists of said alternative titles as values.
         """
         return self._alternative_titles
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def type(self):
         """Type of this media, e.g. 'TV' or 'Manga' or 'Movie'
         """
         return self._type
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def status(self):
         """Publication status, e.g. 'Finished Airing'
         """
         return self._status
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def genres(self):
         """A list of :class:`myanimelist.genre.Genre` objects associated with this media.
         """
         return self._genres
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def score(self):
         """A tuple(2) containing an instance of decimal.Decimal storing the aggregate score, weighted or non-weighted, and an int storing the number of ratings
 
         """
         return self._score
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def rank(self):
         """Score rank.
         """
         return self._rank
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def popularity(self):
         """Popularity rank.
         """
         return self._popularity
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def members(self):
         """Number of members.
         """
         return self._members
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def favorites(self):
         """Number of users who favourited this media.
         """
         return self._favorites
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def popular_tags(self):
         """Tags dict with :class:`myanimelist.tag.Tag` objects as keys, and the number of tags as values.
         """
         return self._popular_tags
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'synopsis')
     def synopsis(self):
         """Media synopsis.
         """
         return self._synopsis
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'related')
     def related(self):
         """Related media dict, with strings of relation types, e.g. 'Sequel' as keys, and lists containing instances of :class:`.Media` subclasses as values.
         """
         return self._related
 
-    @property
     @loadable(u'load_characters')
     def characters(self):
         """Character dict, with :class:`myanimelist.character.Character` objects as keys, and a dict with attributes of this role, e.g. 'role': 'Main' as values.
         """
         return self._characters
 
-    @property
     @loadable(u'load_stats')
     def status_stats(self):
         """Status statistics dict, with strings of statuses, e.g. 'on_hold' as keys, and an int number of users as values.
         """
         return self._status_stats
 
-    @property
     @loadable(u'load_stats')
     def score_stats(self):
         """Score statistics dict, with int scores from 1-10 as keys, and an int number of users as values.
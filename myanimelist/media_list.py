@@ -5,9 +5,11 @@ import abc
 import collections
 import decimal
 import datetime
+import io
 import urllib
 
 import bs4
+import lxml.etree
 
 import utilities
 from base import Base, MalformedPageError, InvalidBaseError, loadable
@@ -21,11 +23,81 @@ class InvalidMediaListError(InvalidBaseError):
     pass
 
 
+class XMLElement(object):
+    """Wraps an lxml element in the subset of bs4's API that the list parsers use: find(), children, name and text.
+    """
+
+    def __init__(self, element):
+        self.element = element
+
+    @property
+    def name(self):
+        return self.element.tag
+
+    @property
+    def text(self):
+        return u''.join(self.element.itertext())
+
+    @property
+    def children(self):
+        for child in self.element:
+            yield XMLElement(child)
+
+    def find(self, name):
+        child = self.element.find(name)
+        return XMLElement(child) if child is not None else None
+
+
+def user_status_table(verb):
+    """
+      Given a list verb ala "watch", return a dict with MAL's user status ints as keys and status texts as values.
+    """
+    verb = verb.capitalize()
+    return {
+        1: verb + u'ing',
+        2: u'Completed',
+        3: u'On-Hold',
+        4: u'Dropped',
+        6: u'Plan to ' + verb
+    }
+
+
+class XMLField(unicode):
+    """The text of a list row's field, which is also its own .text, so that rows answer find(name).text as bs4 does.
+    """
+
+    @property
+    def text(self):
+        return self
+
+
+class XMLRow(object):
+    """Wraps a list row's lxml element in the part of bs4's API that the row parsers use: find(name).text, and name.
+    Reads the text of every field in one pass, so that looking fields up allocates nothing.
+    """
+
+    def __init__(self, element):
+        self.name = element.tag
+        self.fields = {}
+        for child in element:
+            text = child.text if len(child) == 0 else u''.join(child.itertext())
+            self.fields[child.tag] = XMLField(text or u'')
+
+    def find(self, name):
+        return self.fields.get(name)
+
+
 class MediaList(Base, collections.Mapping):
     __metaclass__ = abc.ABCMeta
 
     __id_attribute = "username"
 
+    # subclasses build these once, and rows are looked up in them directly:
+    # user status texts keyed by status ints, ala user_status_table("watch"),
+    _user_status_terms = {}
+    # and the media's status texts indexed by status ints, ala Anime._status_terms.
+    _media_status_terms = []
+
     def __getitem__(self, media):
         return self.list[media]
 
@@ -60,13 +132,12 @@ class MediaList(Base, collections.Mapping):
     # a list with status ints as indices and status texts as values.
     @property
     def user_status_terms(self):
-        statuses = collections.defaultdict(lambda: u'Unknown')
-        statuses[1] = self.verb.capitalize() + u'ing'
-        statuses[2] = u'Completed'
-        statuses[3] = u'On-Hold'
-        statuses[4] = u'Dropped'
-        statuses[6] = u'Plan to ' + self.verb.capitalize()
-        return statuses
+        return collections.defaultdict(lambda: u'Unknown', self._user_status_terms)
+
+    # a dict with MAL's series type ints as keys and type texts, ala "TV", as values.
+    @property
+    def series_type_terms(self):
+        return {}
 
     def parse_entry_media_attributes(self, soup):
         """
@@ -94,9 +165,6 @@ class MediaList(Base, collections.Mapping):
                 if not self.session.suppress_parse_exceptions:
                     raise
 
-        # look up the given media type's status terms.
-        status_terms = getattr(self.session, self.type)(1)._status_terms
-
         try:
             row_info['id'] = int(soup.find('series_' + self.type + 'db_id').text)
         except:
@@ -110,7 +178,7 @@ class MediaList(Base, collections.Mapping):
                 raise
 
         try:
-            row_info['status'] = status_terms[int(soup.find('series_status').text)]
+            row_info['status'] = self._media_status_terms[int(soup.find('series_status').text)]
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
@@ -155,7 +223,7 @@ class MediaList(Base, collections.Mapping):
                 raise
 
         try:
-            entry_info[u'status'] = self.user_status_terms[int(soup.find(u'my_status').text)]
+            entry_info[u'status'] = self._user_status_terms.get(int(soup.find(u'my_status').text), u'Unknown')
         except:
             if not self.session.suppress_parse_exceptions:
                 raise
@@ -255,18 +323,72 @@ class MediaList(Base, collections.Mapping):
 
         return list_info
 
+    def parse_entries(self, xml, statuses=None, types=None):
+        """
+          Given:
+            xml: the raw bytes of a media list's XML
+            statuses: user status texts to keep rows with, ala "Completed". Defaults to every status.
+            types: series type texts to keep rows with, ala "TV". Defaults to every type.
+
+          Yield a tuple for every kept row, as it's read:
+            (media object, dict of this row's parseable attributes)
+          Rows are discarded once parsed, so memory use doesn't grow with the size of the list.
+          Sets this list's stats, which come before any rows.
+        """
+        if statuses is not None:
+            statuses = set(str(k) for k, v in self.user_status_terms.items() if v in statuses)
+        if types is not None:
+            types = set(str(k) for k, v in self.series_type_terms.items() if v in types)
+
+        root = None
+        try:
+            for event, element in lxml.etree.iterparse(io.BytesIO(xml), events=('start', 'end')):
+                if root is None:
+                    root = element
+                    if root.tag != 'myanimelist':
+                        raise MalformedMediaListPageError(self.username, xml, message="Could not find root XML element in " +
+                                                                                      self.type + " list")
+                if event != 'end':
+                    continue
+                if element.tag == 'error':
+                    raise InvalidMediaListError(self.username,
+                                                message=u"Invalid username when fetching " + self.type + " list")
+                elif element.tag == 'myinfo':
+                    self.set({u'stats': self.parse_stats(XMLElement(element))})
+                elif element.tag == self.type:
+                    if ((statuses is None or element.findtext('my_status') in statuses) and
+                            (types is None or element.findtext('series_type') in types)):
+                        yield self.parse_entry(XMLRow(element))
+                else:
+                    continue
+                # drop rows once parsed, along with the references lxml's root keeps to them.
+                element.clear()
+                while element.getprevious() is not None:
+                    del root[0]
+        except lxml.etree.XMLSyntaxError as e:
+            raise MalformedMediaListPageError(self.username, xml,
+                                              message=u"Could not parse " + self.type + " list: " + unicode(e))
+
+    def url(self):
+        return u'http://myanimelist.net/malappinfo.php?' + urllib.urlencode(
+            {'u': self.username, 'status': 'all', 'type': self.type})
+
     def load(self):
-        media_list = self.session.session.get(u'http://myanimelist.net/malappinfo.php?' + urllib.urlencode(
-            {'u': self.username, 'status': 'all', 'type': self.type})).text
-        self.set(self.parse(media_list))
+        response = self.session.fetch(self.url())
+        self.set(self.session.parse_response(response, lambda r: self.parse(r.text)))
         return self
 
-    @property
+    def iter_entries(self, statuses=None, types=None):
+        """
+          Fetches this media list and yields its rows as they're parsed, without keeping the whole list in memory.
+          See parse_entries() for the arguments and rows yielded.
+        """
+        return self.parse_entries(self.session.fetch(self.url()).content, statuses=statuses, types=types)
+
     @loadable(u'load')
     def list(self):
         return self._list
 
-    @property
     @loadable(u'load')
     def stats(self):
         return self._stats
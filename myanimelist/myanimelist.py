@@ -4,11 +4,13 @@
 import httplib
 
 # causes httplib to return the partial response from a server in case the read fails to be complete.
+# the response is marked as incomplete, so that callers may retry the request.
 def patch_http_response_read(func):
     def inner(*args):
         try:
             return func(*args)
         except httplib.IncompleteRead, e:
+            args[0].incomplete = True
             return e.partial
 
     return inner
@@ -20,6 +20,8 @@ class InvalidPersonError(InvalidBaseError):
 class Person(Base):
     """Class for person."""
 
+    __slots__ = ('id', '_name', '_voice_acting_roles', '_anime_staff_positions', '_published_manga')
+
     def __init__(self, session, person_id):
         """init person object given the session and person id."""
         super(Person, self).__init__(session)
@@ -39,8 +41,8 @@ class Person(Base):
         :return: Current person object.
 
         """
-        person = self.session.session.get(u'http://myanimelist.net/people/' + str(self.id)).text
-        self.set(self.parse(utilities.get_clean_dom(person)))
+        person = self.session.fetch(u'http://myanimelist.net/people/' + str(self.id)).text
+        self.set(self.parse(utilities.get_clean_dom(person, self.session.parser_for(u'other'), u'other')))
         return self
 
     def load_pictures(self):
@@ -50,10 +52,10 @@ class Person(Base):
         :return: Current person object.
 
         """
-        person = self.session.session.get(
+        person = self.session.fetch(
             u'http://myanimelist.net/person/' + str(self.id) + u'/' + utilities.urlencode(
                 self.name) + u'/pictures').text
-        self.set(self.parse_pictures(utilities.get_clean_dom(person)))
+        self.set(self.parse_pictures(utilities.get_clean_dom(person, self.session.parser_for(u'other'), u'other')))
         return self
 
     def parse(self, person_page):
@@ -237,19 +239,16 @@ class Person(Base):
         # TODO
         pass
 
-    @property
     @loadable(u'load')
     def name(self):
         """name of the person."""
         return self._name
 
-    @property
     @loadable(u'load')
     def voice_acting_roles(self):
         """voice acting role done by this person."""
         return self._voice_acting_roles
 
-    @property
     @loadable(u'load')
     def anime_staff_positions(self):
         """Position of this person on anime production."""
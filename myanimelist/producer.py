@@ -1,7 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-from base import Base, MalformedPageError, InvalidBaseError, loadable
+from base import Interned, MalformedPageError, InvalidBaseError, loadable
 
 
 class MalformedProducerPageError(MalformedPageError):
@@ -12,7 +12,7 @@ class InvalidProducerError(InvalidBaseError):
     pass
 
 
-class Producer(Base):
+class Producer(Interned):
     def __init__(self, session, producer_id):
         super(Producer, self).__init__(session)
         self.id = producer_id
@@ -20,11 +20,6 @@ class Producer(Base):
             raise InvalidProducerError(self.id)
         self._name = None
 
-    def load(self):
-        # TODO
-        pass
-
-    @property
     @loadable(u'load')
     def name(self):
         return self._name
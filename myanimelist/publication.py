@@ -1,7 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-from base import Base, MalformedPageError, InvalidBaseError, loadable
+from base import Interned, MalformedPageError, InvalidBaseError, loadable
 
 
 class MalformedPublicationPageError(MalformedPageError):
@@ -12,7 +12,7 @@ class InvalidPublicationError(InvalidBaseError):
     pass
 
 
-class Publication(Base):
+class Publication(Interned):
     def __init__(self, session, publication_id):
         super(Publication, self).__init__(session)
         self.id = publication_id
@@ -20,11 +20,6 @@ class Publication(Base):
             raise InvalidPublicationError(self.id)
         self._name = None
 
-    def load(self):
-        # TODO
-        pass
-
-    @property
     @loadable(u'load')
     def name(self):
         return self._name
@@ -0,0 +1,236 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Retries failed requests to MAL, and fails fast while MAL is down."""
+import random
+import threading
+import time
+
+import requests
+
+import utilities
+from throttle import is_block_page
+from transport import Transport, TransportError
+
+
+class CircuitOpenError(TransportError):
+    """Indicates that a request wasn't sent because too many recent requests to the same resource family failed.
+    """
+
+    def __init__(self, family, message=None):
+        super(CircuitOpenError, self).__init__(message=message)
+        self.family = family
+
+    def __str__(self):
+        return "\n".join([
+            super(CircuitOpenError, self).__str__(),
+            "Family: " + self.family
+        ])
+
+
+class RetriesExhaustedError(TransportError):
+    """Indicates that every attempt at a request got back a response that can't be parsed,
+    e.g. one cut short, a block page or a retryable HTTP status.
+    """
+
+    def __init__(self, url, response, message=None):
+        super(RetriesExhaustedError, self).__init__(message=message)
+        self.url = url
+        self.response = response
+
+    def __str__(self):
+        return "\n".join([
+            super(RetriesExhaustedError, self).__str__(),
+            "URL: " + self.url,
+            "Status: " + unicode(self.response.status_code)
+        ])
+
+
+class RetryPolicy(object):
+    """Describes how failed GET requests are retried, and when to stop sending them altogether.
+    """
+
+    def __init__(self, attempts=3, backoff=0.5, max_backoff=30.0, statuses=(429, 500, 502, 503, 504),
+                 failure_threshold=5, reset_timeout=60.0):
+        """Creates a new instance of RetryPolicy.
+
+        :type attempts: int
+        :param attempts: The number of times to try a request before giving up.
+
+        :type backoff: float
+        :param backoff: The base delay in seconds between attempts, doubled after every attempt.
+
+        :type max_backoff: float
+        :param max_backoff: The longest delay in seconds between attempts.
+
+        :type statuses: tuple
+        :param statuses: HTTP status codes to retry on.
+
+        :type failure_threshold: int
+        :param failure_threshold: The number of consecutive failures in a resource family after which its circuit opens. None never opens it.
+
+        :type reset_timeout: float
+        :param reset_timeout: How long in seconds an open circuit fails fast before letting a trial request through.
+
+        :rtype: :class:`.RetryPolicy`
+        :return: The desired policy.
+
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    def delay(self, attempt):
+        """The time to wait before retrying, with full jitter.
+
+        :type attempt: int
+        :param attempt: The number of attempts already made, less one.
+
+        :rtype: float
+        :return: The delay in seconds.
+
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker(object):
+    """Fails requests fast after a run of consecutive failures, until a trial request succeeds again.
+    """
+
+    def __init__(self, family, failure_threshold=5, reset_timeout=60.0):
+        """Creates a new instance of CircuitBreaker.
+
+        :type family: str
+        :param family: The resource family this breaker guards.
+
+        :type failure_threshold: int
+        :param failure_threshold: The number of consecutive failures after which the circuit opens.
+
+        :type reset_timeout: float
+        :param reset_timeout: How long in seconds the open circuit fails fast before letting a trial request through.
+
+        :rtype: :class:`.CircuitBreaker`
+        :return: The desired circuit breaker.
+
+        """
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def open(self):
+        """Whether requests are currently being failed fast.
+        """
+        return self.opened_at is not None
+
+    def allow(self):
+        """Checks that a request may be sent.
+
+        :raises: :class:`.CircuitOpenError`
+
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if not self._trial and time.time() - self.opened_at >= self.reset_timeout:
+                # half-open: let a single request through to see whether MAL has recovered.
+                self._trial = True
+                return
+        raise CircuitOpenError(self.family, message=u"Too many recent requests failed")
+
+    def succeeded(self):
+        """Records a successful request, closing the circuit.
+        """
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def failed(self):
+        """Records a failed request, opening the circuit if too many have failed in a row.
+        """
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+                self._trial = False
+
+
+class RetryingTransport(Transport):
+    """Retries failed GET requests made through another transport, with a circuit breaker per resource family.
+
+    Connection errors, retryable HTTP statuses, responses cut short and block pages are all retried.
+    If every attempt fails, the last error is raised, or if the last attempt got a response,
+    :class:`.RetriesExhaustedError` is, rather than handing the response on to be parsed.
+    """
+
+    def __init__(self, transport, policy=None):
+        """Creates a new instance of RetryingTransport.
+
+        :type transport: :class:`myanimelist.transport.Transport`
+        :param transport: The transport to send requests through.
+
+        :type policy: :class:`.RetryPolicy`
+        :param policy: How to retry failed requests. Defaults to :class:`.RetryPolicy`'s defaults.
+
+        """
+        self.transport = transport
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url):
+        """The circuit breaker guarding requests to the given URL.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: :class:`.CircuitBreaker`
+        :return: The breaker for this URL's resource family, or None if circuit breaking is disabled.
+
+        """
+        if self.policy.failure_threshold is None:
+            return None
+        family = utilities.resource_family(url)
+        with self._lock:
+            if family not in self.breakers:
+                self.breakers[family] = CircuitBreaker(family, failure_threshold=self.policy.failure_threshold,
+                                                       reset_timeout=self.policy.reset_timeout)
+            return self.breakers[family]
+
+    def get(self, url, headers=None):
+        breaker = self.breaker(url)
+        for attempt in xrange(self.policy.attempts):
+            if attempt > 0:
+                time.sleep(self.policy.delay(attempt - 1))
+            if breaker is not None:
+                breaker.allow()
+            error, response = None, None
+            try:
+                response = self.transport.get(url, headers=headers)
+            except requests.RequestException as e:
+                error = e
+            except Exception:
+                # not worth retrying, but it's still a failure, and mustn't leave a trial request outstanding.
+                if breaker is not None:
+                    breaker.failed()
+                raise
+            if (error is None and response.status_code not in self.policy.statuses and not response.incomplete
+                    and not is_block_page(response)):
+                if breaker is not None:
+                    breaker.succeeded()
+                return response
+            if breaker is not None:
+                breaker.failed()
+        if error is not None:
+            raise error
+        raise RetriesExhaustedError(url, response, message=u"Every attempt at the request failed")
+
+    def post(self, url, data=None):
+        return self.transport.post(url, data=data)
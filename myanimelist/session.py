@@ -1,6 +1,11 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import collections
+import functools
+import threading
+
+import bs4
 import requests
 
 import anime
@@ -15,7 +20,15 @@ import publication
 import producer
 import anime_list
 import manga_list
+import catalog
 from base import Error
+from cache import CachingTransport, ParsedAttributeCache
+from coalesce import SingleFlight
+from identity import IdentityMap
+from retry import RetryingTransport
+from throttle import AdaptiveTransport, ThrottledTransport
+from transport import HTTPTransport
+from workers import WorkerPool, as_completed
 
 
 class UnauthorizedError(Error):
@@ -56,7 +69,16 @@ class Session(object):
     """Class to handle requests to MAL. Handles login, setting HTTP headers, etc.
     """
 
-    def __init__(self, username=None, password=None, user_agent="iMAL-iOS"):
+    """The BeautifulSoup tree builder each type of page, as given to :func:`myanimelist.utilities.get_clean_dom`,
+    is parsed with unless a session is given one. lxml is only to be used for those whose parsed attributes have been
+    checked against html.parser's on pages recorded off MAL, as tests/recorded_pages_tests.py does; until then,
+    every type stays with html.parser.
+    """
+    DEFAULT_PARSERS = collections.defaultdict(lambda: u'html.parser')
+
+    def __init__(self, username=None, password=None, user_agent="iMAL-iOS", transport=None, cache=None,
+                 rate_limiter=None, concurrency=None, retry=None, coalesce=True, pool_connections=10, pool_maxsize=10,
+                 keep_alive=True, parser=None, keep_recent=1000, keep_pages=10):
         """Creates a new instance of Session.
 
         :type username: str
@@ -68,16 +90,88 @@ class Session(object):
         :type user_agent: str
         :param user_agent: A user-agent to send to MAL in requests. If you have a user-agent assigned to you by Incapsula, pass it in here.
 
+        :type transport: :class:`myanimelist.transport.Transport`
+        :param transport: The transport to fetch pages through. Defaults to fetching live from MAL over HTTP.
+
+        :type cache: :class:`myanimelist.cache.ResponseCache`
+        :param cache: A cache to serve unexpired responses from, and to store fetched responses in. May be omitted.
+
+        :type rate_limiter: :class:`myanimelist.throttle.RateLimiter`
+        :param rate_limiter: A rate limiter to hold back requests to MAL with. May be omitted.
+
+        :type concurrency: :class:`myanimelist.throttle.ConcurrencyController`
+        :param concurrency: A controller that adaptively limits the number of requests in flight to MAL. May be omitted.
+
+        :type retry: :class:`myanimelist.retry.RetryPolicy`
+        :param retry: How to retry failed requests to MAL. If omitted, failed requests aren't retried.
+
+        :type coalesce: bool
+        :param coalesce: Whether concurrent requests for the same URL should share a single fetch and parse.
+
+        :type pool_connections: int
+        :param pool_connections: The number of hosts to keep connection pools for.
+
+        :type pool_maxsize: int
+        :param pool_maxsize: The most connections to keep open to each host. Raise this alongside the number of threads making requests.
+
+        :type keep_alive: bool
+        :param keep_alive: Whether to reuse connections to MAL between requests.
+
+        :type parser: str
+        :param parser: The BeautifulSoup tree builder to parse every page with, e.g. 'lxml', 'html.parser' or 'html5lib'.
+            If omitted, each type of page is parsed with its DEFAULT_PARSERS entry.
+
+        :type keep_recent: int
+        :param keep_recent: The number of most recently requested resources to keep alive. Others are let go once unused.
+
+        :type keep_pages: int
+        :param keep_pages: The number of pages to keep parsed for resources that have only had some of their sections
+            parsed, as by :func:`myanimelist.base.Base.load_section`. The least recently kept are let go first.
+
         :rtype: :class:`.Session`
         :return: The desired session.
 
         """
+        if parser is not None and bs4.builder.builder_registry.lookup(parser) is None:
+            raise Error(u"No BeautifulSoup tree builder named " + parser + u" is installed")
         self.username = username
         self.password = password
+        self.parser = parser
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': user_agent
         })
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool_maxsize = pool_maxsize
+        self.custom_transport = transport is not None
+        self.transport = transport if transport is not None else HTTPTransport(self.session)
+        self.concurrency = concurrency
+        if self.concurrency is not None:
+            self.transport = AdaptiveTransport(self.transport, self.concurrency)
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is not None:
+            self.transport = ThrottledTransport(self.transport, self.rate_limiter)
+        self.retry = retry
+        if self.retry is not None:
+            self.transport = RetryingTransport(self.transport, self.retry)
+        self.cache = cache
+        self.parsed_cache = None
+        if self.cache is not None:
+            self.transport = CachingTransport(self.transport, self.cache)
+            self.parsed_cache = ParsedAttributeCache()
+        self.fetch_flights = None
+        self.parse_flights = None
+        if coalesce:
+            self.fetch_flights = SingleFlight()
+            self.parse_flights = SingleFlight()
+        self.identity_map = IdentityMap(max_recent=keep_recent)
+        self.keep_pages = keep_pages
+        self.kept_pages = collections.OrderedDict()
+        self._pages_lock = threading.Lock()
 
         """Suppresses any Malformed*PageError exceptions raised during parsing.
 
@@ -97,7 +191,7 @@ class Session(object):
             return False
 
         panel_url = u'http://myanimelist.net/panel.php'
-        panel = self.session.get(panel_url)
+        panel = self.fetch(panel_url)
 
         if 'Logout' in panel.content:
             return True
@@ -122,149 +216,312 @@ class Session(object):
             'sublogin': 'Login'
         }
         self.session.headers.update(mal_headers)
-        r = self.session.post(u'http://myanimelist.net/login.php', data=mal_payload)
+        r = self.transport.post(u'http://myanimelist.net/login.php', data=mal_payload)
         return self
 
+    def warm(self, connections=None, url=u'http://myanimelist.net/'):
+        """Opens connections to MAL up front, so that the first requests made don't have to,
+        by sending a HEAD request for the given URL over each.
+
+        The HEAD requests go straight to this session's connection pool, around its transport, so they'd slip past
+        any rate limiter or concurrency controller, and a custom transport's connections aren't this pool's anyway.
+        So nothing is sent unless pages are fetched over HTTP by the default transport, with neither of those set.
+
+        :type connections: int
+        :param connections: The number of connections to open. Defaults to the size of the connection pool.
+
+        :type url: str
+        :param url: The URL to request on each connection.
+
+        :rtype: int
+        :return: The number of requests that succeeded, and so connections opened.
+
+        """
+        if self.custom_transport or self.rate_limiter is not None or self.concurrency is not None:
+            return 0
+        connections = connections if connections is not None else self.pool_maxsize
+        workers = WorkerPool(size=connections)
+        try:
+            # streamed, so that each response holds on to its connection until all have been sent,
+            # rather than handing it back for the next request to reuse.
+            futures = [workers.submit(self.session.head, url, stream=True) for _ in xrange(connections)]
+            responses = [future.result() for future in futures if future.exception() is None]
+            for response in responses:
+                # reading the (empty) body hands the connection back to the pool, where closing would drop it.
+                response.content
+            return len(responses)
+        finally:
+            workers.shutdown(wait=False)
+
+    def fetch(self, url):
+        """Fetches a page from MAL through this session's transport.
+
+        :type url: str
+        :param url: The URL to fetch.
+
+        :rtype: :class:`myanimelist.transport.Response`
+        :return: The response.
+
+        """
+        if self.fetch_flights is None:
+            return self.transport.get(url)
+        return self.fetch_flights.do(url, self.transport.get, url)
+
+    def parser_for(self, page_type):
+        """The BeautifulSoup tree builder to parse the given type of page with.
+
+        :type page_type: str
+        :param page_type: The type of page, e.g. 'media' or 'profile'.
+
+        :rtype: str
+        :return: The tree builder's name, e.g. 'lxml'.
+
+        """
+        if self.parser is not None:
+            return self.parser
+        return self.DEFAULT_PARSERS[page_type]
+
+    def keep_page(self, resource, page):
+        """Keeps a page on a resource for its other sections to be parsed out of,
+        letting go of the page kept longest if more than keep_pages are now kept.
+
+        :type resource: :class:`myanimelist.base.Base`
+        :param resource: The resource the page belongs to.
+
+        :type page: list
+        :param page: The page's response, its DOM, or None if it hasn't been parsed yet, and the lock it's parsed under.
+
+        """
+        with self._pages_lock:
+            resource._page = page
+            self.kept_pages.pop(resource, None)
+            self.kept_pages[resource] = page
+            while len(self.kept_pages) > self.keep_pages:
+                kept, kept_page = self.kept_pages.popitem(last=False)
+                if kept._page is kept_page:
+                    kept._page = None
+
+    def release_page(self, resource):
+        """Lets go of any page kept on a resource, e.g. once every section has been parsed out of it.
+
+        :type resource: :class:`myanimelist.base.Base`
+        :param resource: The resource the page belongs to.
+
+        """
+        with self._pages_lock:
+            resource._page = None
+            self.kept_pages.pop(resource, None)
+
+    def parse_response(self, response, parser, key=None):
+        """Parses a response, reusing the attributes parsed before if the response is unchanged since.
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: The response to parse.
+
+        :type parser: function
+        :param parser: A function that takes a response and returns a dict of parsed attributes.
+
+        :type key: str
+        :param key: Tells apart parsers that parse different attributes out of the same response, e.g. a section's name.
+
+        :rtype: dict
+        :return: The parsed attributes.
+
+        """
+        if self.parsed_cache is not None:
+            parse = functools.partial(self.parsed_cache.parse, parser=parser, key=key)
+        else:
+            parse = parser
+        if self.parse_flights is None:
+            return parse(response)
+        # callers sharing a coalesced fetch share the same response object, and so its parse.
+        return self.parse_flights.do((id(response), key), parse, response)
+
+    def load_many(self, resources, loaders=(u'load',), workers=8):
+        """Loads many resources at once on a pool of threads, yielding each as soon as it's done.
+        Requests still go through this session's transport, so its rate limits and concurrency limits apply.
+
+        :type resources: list
+        :param resources: MAL resources belonging to this session, e.g. [session.anime(1), session.user(u'shaldengeki')]
+
+        :type loaders: list
+        :param loaders: Names of the loaders to run on each resource, in order, e.g. ['load', 'load_stats'].
+
+        :type workers: int
+        :param workers: The number of resources to load at once.
+
+        :rtype: generator
+        :return: A generator of tuple(2)s of (resource, errors), in the order loading finishes. errors is a dict with the loaders that raised as keys, and their exceptions as values.
+
+        """
+        def load(resource):
+            errors = {}
+            for loader in loaders:
+                try:
+                    getattr(resource, loader)()
+                except Exception as e:
+                    errors[loader] = e
+            return resource, errors
+
+        pool = WorkerPool(size=workers)
+        try:
+            for future in as_completed([pool.submit(load, resource) for resource in resources]):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=False)
+
     def anime(self, anime_id):
-        """Creates an instance of myanimelist.Anime with the given ID.
+        """Returns this session's instance of myanimelist.Anime with the given ID, creating it on first request.
 
         :type anime_id: int
         :param anime_id: The desired anime's ID.
 
         :rtype: :class:`myanimelist.anime.Anime`
-        :return: A new Anime instance with the given ID.
+        :return: The Anime instance with the given ID.
 
         """
-        return anime.Anime(self, anime_id)
+        return self.identity_map.get(anime.Anime, self, anime_id)
 
     def anime_list(self, username):
-        """Creates an instance of myanimelist.AnimeList belonging to the given username.
+        """Returns this session's instance of myanimelist.AnimeList belonging to the given username, creating it on first request.
 
         :type username: str
         :param username: The username to whom the desired anime list belongs.
 
         :rtype: :class:`myanimelist.anime_list.AnimeList`
-        :return: A new AnimeList instance belonging to the given username.
+        :return: The AnimeList instance belonging to the given username.
 
         """
-        return anime_list.AnimeList(self, username)
+        return self.identity_map.get(anime_list.AnimeList, self, username)
 
     def character(self, character_id):
-        """Creates an instance of myanimelist.Character with the given ID.
+        """Returns this session's instance of myanimelist.Character with the given ID, creating it on first request.
 
         :type character_id: int
         :param character_id: The desired character's ID.
 
         :rtype: :class:`myanimelist.character.Character`
-        :return: A new Character instance with the given ID.
+        :return: The Character instance with the given ID.
 
         """
-        return character.Character(self, character_id)
+        return self.identity_map.get(character.Character, self, character_id)
 
     def club(self, club_id):
-        """Creates an instance of myanimelist.Club with the given ID.
+        """Returns this session's instance of myanimelist.Club with the given ID, creating it on first request.
 
         :type club_id: int
         :param club_id: The desired club's ID.
 
         :rtype: :class:`myanimelist.club.Club`
-        :return: A new Club instance with the given ID.
+        :return: The Club instance with the given ID.
 
         """
-        return club.Club(self, club_id)
+        return self.identity_map.get(club.Club, self, club_id)
 
-    def genre(self, genre_id):
-        """Creates an instance of myanimelist.Genre with the given ID.
+    def genre(self, genre_id, media_type=u'anime', name=None):
+        """Returns the process-wide instance of myanimelist.Genre with the given ID, shared by every session.
 
         :type genre_id: int
         :param genre_id: The desired genre's ID.
 
+        :type media_type: str
+        :param media_type: 'anime' or 'manga', which number their genres separately.
+
+        :type name: str
+        :param name: A name to give the genre if it has none yet. May be omitted.
+
         :rtype: :class:`myanimelist.genre.Genre`
-        :return: A new Genre instance with the given ID.
+        :return: The Genre instance with the given ID.
 
         """
-        return genre.Genre(self, genre_id)
+        return catalog.GENRES[media_type].get(genre_id, name)
 
     def manga(self, manga_id):
-        """Creates an instance of myanimelist.Manga with the given ID.
+        """Returns this session's instance of myanimelist.Manga with the given ID, creating it on first request.
 
         :type manga_id: int
         :param manga_id: The desired manga's ID.
 
         :rtype: :class:`myanimelist.manga.Manga`
-        :return: A new Manga instance with the given ID.
+        :return: The Manga instance with the given ID.
 
         """
-        return manga.Manga(self, manga_id)
+        return self.identity_map.get(manga.Manga, self, manga_id)
 
     def manga_list(self, username):
-        """Creates an instance of myanimelist.MangaList belonging to the given username.
+        """Returns this session's instance of myanimelist.MangaList belonging to the given username, creating it on first request.
 
         :type username: str
         :param username: The username to whom the desired manga list belongs.
 
         :rtype: :class:`myanimelist.manga_list.MangaList`
-        :return: A new MangaList instance belonging to the given username.
+        :return: The MangaList instance belonging to the given username.
 
         """
-        return manga_list.MangaList(self, username)
+        return self.identity_map.get(manga_list.MangaList, self, username)
 
     def person(self, person_id):
-        """Creates an instance of myanimelist.Person with the given ID.
+        """Returns this session's instance of myanimelist.Person with the given ID, creating it on first request.
 
         :type person_id: int
         :param person_id: The desired person's ID.
 
         :rtype: :class:`myanimelist.person.Person`
-        :return: A new Person instance with the given ID.
+        :return: The Person instance with the given ID.
 
         """
-        return person.Person(self, person_id)
+        return self.identity_map.get(person.Person, self, person_id)
 
-    def producer(self, producer_id):
-        """Creates an instance of myanimelist.Producer with the given ID.
+    def producer(self, producer_id, name=None):
+        """Returns the process-wide instance of myanimelist.Producer with the given ID, shared by every session.
 
         :type producer_id: int
         :param producer_id: The desired producer's ID.
 
+        :type name: str
+        :param name: A name to give the producer if it has none yet. May be omitted.
+
         :rtype: :class:`myanimelist.producer.Producer`
-        :return: A new Producer instance with the given ID.
+        :return: The Producer instance with the given ID.
 
         """
-        return producer.Producer(self, producer_id)
+        return catalog.PRODUCERS.get(producer_id, name)
 
-    def publication(self, publication_id):
-        """Creates an instance of myanimelist.Publication with the given ID.
+    def publication(self, publication_id, name=None):
+        """Returns the process-wide instance of myanimelist.Publication with the given ID, shared by every session.
 
         :type publication_id: int
         :param publication_id: The desired publication's ID.
 
+        :type name: str
+        :param name: A name to give the publication if it has none yet. May be omitted.
+
         :rtype: :class:`myanimelist.publication.Publication`
-        :return: A new Publication instance with the given ID.
+        :return: The Publication instance with the given ID.
 
         """
-        return publication.Publication(self, publication_id)
+        return catalog.PUBLICATIONS.get(publication_id, name)
 
     def tag(self, tag_id):
-        """Creates an instance of myanimelist.Tag with the given ID.
+        """Returns this session's instance of myanimelist.Tag with the given ID, creating it on first request.
 
         :type tag_id: int
         :param tag_id: The desired tag's ID.
 
         :rtype: :class:`myanimelist.tag.Tag`
-        :return: A new Tag instance with the given ID.
+        :return: The Tag instance with the given ID.
 
         """
-        return tag.Tag(self, tag_id)
+        return self.identity_map.get(tag.Tag, self, tag_id)
 
     def user(self, username):
-        """Creates an instance of myanimelist.User with the given username
+        """Returns this session's instance of myanimelist.User with the given username, creating it on first request.
 
         :type username: str
         :param username: The desired user's username.
 
         :rtype: :class:`myanimelist.user.User`
-        :return: A new User instance with the given username.
+        :return: The User instance with the given username.
 
         """
-        return user.User(self, username)
+        return self.identity_map.get(user.User, self, username)
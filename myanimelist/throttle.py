@@ -0,0 +1,355 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Limits the rate at which a session sends requests to MAL."""
+import collections
+import os
+import threading
+import time
+
+import requests
+
+import utilities
+from transport import Transport
+
+
+class TokenBucket(object):
+    """A token bucket allowing a steady number of requests per second, with bursts of up to a given size.
+
+    Thread-safe. If given a lock file, the bucket's state is kept in that file, so that every process
+    using the same file shares a single budget. That needs flock(), so on platforms without it, e.g. Windows,
+    each process keeps a budget of its own instead.
+    """
+
+    def __init__(self, rate, burst=1, lock_path=None):
+        """Creates a new instance of TokenBucket.
+
+        :type rate: float
+        :param rate: The number of requests allowed per second.
+
+        :type burst: int
+        :param burst: The number of requests that may be sent back-to-back after the bucket has been idle.
+
+        :type lock_path: str
+        :param lock_path: A file to keep this bucket's state in, shared across processes. May be omitted.
+
+        :rtype: :class:`.TokenBucket`
+        :return: The desired bucket.
+
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.lock_path = lock_path
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.time()
+
+    def _take(self, tokens, updated):
+        """Refills the bucket up to now and tries to take a token from it.
+
+        :rtype: tuple
+        :return: A tuple(3) of the remaining tokens, the time they were computed at, and how long to wait before trying again.
+
+        """
+        now = time.time()
+        tokens = min(float(self.burst), tokens + max(now - updated, 0) * self.rate)
+        if tokens >= 1:
+            return tokens - 1, now, 0
+        return tokens, now, (1 - tokens) / self.rate
+
+    def _take_shared(self):
+        """Takes a token from the bucket kept in the lock file, as _take() does.
+
+        :rtype: float
+        :return: How long to wait before trying again, or None if the file can't be locked on this platform.
+
+        """
+        try:
+            import fcntl
+        except ImportError:
+            return None
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            state = os.read(fd, 64).split()
+            if len(state) == 2:
+                tokens, updated = float(state[0]), float(state[1])
+            else:
+                tokens, updated = float(self.burst), time.time()
+            tokens, updated, wait = self._take(tokens, updated)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, repr(tokens) + ' ' + repr(updated))
+            return wait
+        finally:
+            os.close(fd)
+
+    def try_acquire(self):
+        """Takes a token from the bucket if one is available.
+
+        :rtype: float
+        :return: 0 if a token was taken, otherwise the number of seconds until one is available.
+
+        """
+        with self._lock:
+            if self.lock_path is not None:
+                wait = self._take_shared()
+                if wait is not None:
+                    return wait
+            self._tokens, self._updated, wait = self._take(self._tokens, self._updated)
+            return wait
+
+    def acquire(self):
+        """Blocks until a token can be taken from the bucket, then takes it.
+        """
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class RateLimiter(object):
+    """Enforces a rate limit for each family of MAL resource, as given by :func:`myanimelist.utilities.resource_family`.
+    """
+
+    def __init__(self, default=None, families=None):
+        """Creates a new instance of RateLimiter.
+
+        :type default: :class:`.TokenBucket`
+        :param default: The bucket shared by resource families without a bucket of their own. If omitted, they're unlimited.
+
+        :type families: dict
+        :param families: A dict with resource families, e.g. 'profile' or 'list', as keys, and :class:`.TokenBucket` objects as values.
+
+        :rtype: :class:`.RateLimiter`
+        :return: The desired rate limiter.
+
+        """
+        self.default = default
+        self.families = families if families is not None else {}
+
+    def bucket(self, url):
+        """The bucket that requests to the given URL draw from.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: :class:`.TokenBucket`
+        :return: The bucket for this URL's resource family, or None if it's unlimited.
+
+        """
+        return self.families.get(utilities.resource_family(url), self.default)
+
+    def acquire(self, url):
+        """Blocks until a request to the given URL is allowed.
+
+        :type url: str
+        :param url: The URL about to be requested.
+
+        """
+        bucket = self.bucket(url)
+        if bucket is not None:
+            bucket.acquire()
+
+
+class ThrottledTransport(Transport):
+    """Holds back requests made through another transport until a :class:`.RateLimiter` allows them.
+    """
+
+    def __init__(self, transport, limiter):
+        """Creates a new instance of ThrottledTransport.
+
+        :type transport: :class:`myanimelist.transport.Transport`
+        :param transport: The transport to send requests through.
+
+        :type limiter: :class:`.RateLimiter`
+        :param limiter: The rate limiter to enforce.
+
+        """
+        self.transport = transport
+        self.limiter = limiter
+
+    def get(self, url, headers=None):
+        self.limiter.acquire(url)
+        return self.transport.get(url, headers=headers)
+
+    def post(self, url, data=None):
+        self.limiter.acquire(url)
+        return self.transport.post(url, data=data)
+
+
+def is_block_page(response):
+    """Checks whether a response is MAL (or Incapsula, its CDN) turning us away.
+
+    :type response: :class:`myanimelist.transport.Response`
+    :param response: The response to check.
+
+    :rtype: str
+    :return: The reason the response was blocked, e.g. 'http_429' or 'incapsula', or None if it wasn't.
+
+    """
+    if response.status_code in (429, 503):
+        return u'http_' + str(response.status_code)
+    if '_Incapsula_Resource' in response.content or 'Incapsula incident ID' in response.content:
+        return u'incapsula'
+    return None
+
+
+class ConcurrencyController(object):
+    """Limits the number of requests in flight, tuning the limit with additive-increase / multiplicative-decrease.
+
+    The window grows by one request per window's worth of successful requests, for as long as latency stays
+    within a tolerance of the best latency seen. It's cut sharply whenever MAL blocks a request, a connection fails
+    or a response is cut short.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=32, decrease=0.5, latency_tolerance=2.0, history=100):
+        """Creates a new instance of ConcurrencyController.
+
+        :type initial: int
+        :param initial: The initial number of requests allowed in flight.
+
+        :type minimum: int
+        :param minimum: The smallest the window may shrink to.
+
+        :type maximum: int
+        :param maximum: The largest the window may grow to.
+
+        :type decrease: float
+        :param decrease: The factor to multiply the window by when a request is blocked or fails.
+
+        :type latency_tolerance: float
+        :param latency_tolerance: How many times the best latency seen a request may take before the window stops growing.
+
+        :type history: int
+        :param history: The number of recent window changes to keep in :attr:`changes`.
+
+        :rtype: :class:`.ConcurrencyController`
+        :return: The desired controller.
+
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+
+        """A list of recent window changes, as tuple(4)s of (time, old window, new window, reason).
+        """
+        self.changes = collections.deque(maxlen=history)
+
+        """A dict with reasons the window changed, e.g. 'increase' or 'http_503', as keys, and counts as values.
+        """
+        self.reasons = collections.Counter()
+
+        self._window = float(initial)
+        self._latency = None
+        self._best_latency = None
+        # bumped on every cut, so requests sent before a cut can't cut the window again.
+        self._epoch = 0
+        self._condition = threading.Condition()
+
+    @property
+    def window(self):
+        """The number of requests currently allowed in flight.
+        """
+        return int(self._window)
+
+    def acquire(self):
+        """Blocks until another request may be sent.
+
+        :rtype: int
+        :return: A ticket to pass to :meth:`release` once the request completes.
+
+        """
+        with self._condition:
+            while self.in_flight >= self.window:
+                self._condition.wait()
+            self.in_flight += 1
+            return self._epoch
+
+    def release(self, ticket, latency, failure=None):
+        """Records the outcome of a request, adjusting the window.
+
+        :type ticket: int
+        :param ticket: The ticket returned by :meth:`acquire`.
+
+        :type latency: float
+        :param latency: How long the request took, in seconds.
+
+        :type failure: str
+        :param failure: Why the request was blocked or failed, e.g. 'http_429'. None if it succeeded.
+
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if failure is not None:
+                if ticket == self._epoch:
+                    self._epoch += 1
+                    self._resize(max(float(self.minimum), self._window * self.decrease), failure)
+            else:
+                self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+                if self._best_latency is None or self._latency < self._best_latency:
+                    self._best_latency = self._latency
+                if self._latency <= self._best_latency * self.latency_tolerance:
+                    self._resize(min(float(self.maximum), self._window + 1.0 / self.window), u'increase')
+            self._condition.notify_all()
+
+    def _resize(self, window, reason):
+        if int(window) != self.window:
+            self.changes.append((time.time(), self.window, int(window), reason))
+            self.reasons[reason] += 1
+        self._window = window
+
+
+class AdaptiveTransport(Transport):
+    """Sends requests through another transport no faster than a :class:`.ConcurrencyController` allows.
+    """
+
+    def __init__(self, transport, controller):
+        """Creates a new instance of AdaptiveTransport.
+
+        :type transport: :class:`myanimelist.transport.Transport`
+        :param transport: The transport to send requests through.
+
+        :type controller: :class:`.ConcurrencyController`
+        :param controller: The controller to limit requests in flight with.
+
+        """
+        self.transport = transport
+        self.controller = controller
+
+    def _send(self, method, *args, **kwargs):
+        ticket = self.controller.acquire()
+        start = time.time()
+        failure = None
+        try:
+            response = method(*args, **kwargs)
+            failure = is_block_page(response)
+            if failure is None and response.incomplete:
+                # a connection reset partway through a body doesn't raise, but marks the response incomplete.
+                failure = u'incomplete'
+            return response
+        except requests.Timeout:
+            # before ConnectionError, which connect timeouts are too.
+            failure = u'timeout'
+            raise
+        except requests.ConnectionError:
+            failure = u'connection_error'
+            raise
+        except requests.RequestException:
+            # e.g. a chunked body cut short by a reset connection.
+            failure = u'request_error'
+            raise
+        except Exception:
+            # not a sample of MAL's latency either way, but mustn't be taken for a good one.
+            failure = u'error'
+            raise
+        finally:
+            self.controller.release(ticket, time.time() - start, failure=failure)
+
+    def get(self, url, headers=None):
+        return self._send(self.transport.get, url, headers=headers)
+
+    def post(self, url, data=None):
+        return self._send(self.transport.post, url, data=data)
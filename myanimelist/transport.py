@@ -0,0 +1,316 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Transports used by :class:`myanimelist.session.Session` to talk to MAL."""
+import abc
+import cgi
+import hashlib
+import json
+import os
+import re
+
+import requests
+
+from base import Error
+
+
+class TransportError(Error):
+    """Indicates that a transport could not fulfil a request.
+    """
+    pass
+
+
+class MissingRecordingError(TransportError):
+    """Indicates that a replaying transport has no recording for the requested URL.
+    """
+
+    def __init__(self, url, message=None):
+        super(MissingRecordingError, self).__init__(message=message)
+        self.url = url
+
+    def __str__(self):
+        return "\n".join([
+            super(MissingRecordingError, self).__str__(),
+            "URL: " + self.url
+        ])
+
+
+# a charset declared by a <meta> tag or an XML declaration.
+DECLARED_CHARSET = re.compile(r"""(?:charset|encoding)=["']?(?P<charset>[A-Za-z0-9_\-]+)""")
+
+
+def declared_encoding(content):
+    """Finds the encoding a page declares for itself, without looking at its content.
+
+    :type content: str
+    :param content: The raw page.
+
+    :rtype: str
+    :return: The encoding declared in the page's XML declaration or <meta> tags, or None if it declares none.
+
+    """
+    match = DECLARED_CHARSET.search(content, 0, 2048)
+    return match.group(u'charset').lower() if match else None
+
+
+def header_encoding(headers):
+    """Finds the encoding given by a Content-Type header.
+    Unlike requests, doesn't assume ISO-8859-1 for text types that don't give one.
+
+    :type headers: dict
+    :param headers: The response headers.
+
+    :rtype: str
+    :return: The header's charset, or None if it gives none.
+
+    """
+    content_type = requests.structures.CaseInsensitiveDict(headers).get(u'content-type', u'')
+    charset = cgi.parse_header(content_type)[1].get(u'charset')
+    return charset.strip(u'"\'').lower() if charset else None
+
+
+class Response(object):
+    """A transport-independent HTTP response.
+    """
+
+    def __init__(self, url, status_code=200, headers=None, content='', encoding=None):
+        """Creates a new instance of Response.
+
+        :type url: str
+        :param url: The URL that was requested.
+
+        :type status_code: int
+        :param status_code: The HTTP status code of the response.
+
+        :type headers: dict
+        :param headers: The response headers.
+
+        :type content: str
+        :param content: The raw response body.
+
+        :type encoding: str
+        :param encoding: The encoding of the response body, if known. Otherwise, the encoding the body declares is used, or UTF-8.
+
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.encoding = encoding
+
+        """Whether this response was served from a cache rather than fetched from MAL.
+        """
+        self.from_cache = False
+
+        """Whether MAL reported this cached response unchanged when it was revalidated.
+        """
+        self.not_modified = False
+
+        """Whether the connection was cut before the whole body was read.
+        """
+        self.incomplete = False
+        self._text = None
+
+    @property
+    def text(self):
+        """The response body, decoded to unicode.
+        """
+        if self._text is None:
+            if self.encoding is None:
+                # MAL serves UTF-8; never guess at the encoding from the body.
+                self.encoding = declared_encoding(self.content) or u'utf-8'
+            try:
+                self._text = self.content.decode(self.encoding, u'replace')
+            except LookupError:
+                self.encoding = u'utf-8'
+                self._text = self.content.decode(self.encoding, u'replace')
+        return self._text
+
+
+class Transport(object):
+    """Abstract base class for transports. Fetches URLs on behalf of a session.
+    """
+    __metaclass__ = abc.ABCMeta
+
+    @abc.abstractmethod
+    def get(self, url, headers=None):
+        """Fetches the given URL.
+
+        :type url: str
+        :param url: The URL to fetch.
+
+        :type headers: dict
+        :param headers: Extra request headers.
+
+        :rtype: :class:`.Response`
+        :return: The response.
+
+        """
+        pass
+
+    @abc.abstractmethod
+    def post(self, url, data=None):
+        """POSTs the given data to the given URL.
+
+        :type url: str
+        :param url: The URL to POST to.
+
+        :type data: dict
+        :param data: The form data to send.
+
+        :rtype: :class:`.Response`
+        :return: The response.
+
+        """
+        pass
+
+
+def body_cut_short(r):
+    """Checks whether the connection was cut before a response's whole body was read.
+    Neither requests nor urllib3 raise when a sized body ends early,
+    so the bytes read are checked against its Content-Length.
+
+    :type r: :class:`requests.Response`
+    :param r: The response, with its body read.
+
+    :rtype: bool
+    :return: Whether the body is shorter than its Content-Length.
+
+    """
+    request = getattr(r, 'request', None)
+    if r.status_code in (204, 304) or (request is not None and request.method == 'HEAD'):
+        return False
+    try:
+        expected = int(r.headers[u'content-length'])
+    except (KeyError, ValueError):
+        return False
+    if r.headers.get(u'content-encoding', u'identity').lower() in (u'', u'identity'):
+        received = len(r.content)
+    else:
+        # the length counts the encoded bytes, which content holds decoded.
+        received = r.raw.tell() if hasattr(r.raw, 'tell') else expected
+    return received < expected
+
+
+class HTTPTransport(Transport):
+    """Fetches pages live from MAL over HTTP.
+    """
+
+    def __init__(self, session=None):
+        """Creates a new instance of HTTPTransport.
+
+        :type session: :class:`requests.Session`
+        :param session: The requests session to issue requests through. A new one is created if omitted.
+
+        """
+        self.session = session if session is not None else requests.Session()
+
+    def _response(self, r):
+        response = Response(r.url, status_code=r.status_code, headers=r.headers, content=r.content,
+                            encoding=header_encoding(r.headers))
+        # the httplib patch in myanimelist.myanimelist only catches unsized reads cut short.
+        response.incomplete = (getattr(getattr(r.raw, '_original_response', None), 'incomplete', False)
+                               or body_cut_short(r))
+        return response
+
+    def get(self, url, headers=None):
+        return self._response(self.session.get(url, headers=headers))
+
+    def post(self, url, data=None):
+        return self._response(self.session.post(url, data=data))
+
+
+class ReplayTransport(Transport):
+    """Replays responses previously recorded to a directory on disk.
+
+    If given another transport to record from, requests missing from the directory are fetched through it and recorded.
+    Otherwise, requesting a URL with no recording raises :class:`.MissingRecordingError`.
+    """
+
+    def __init__(self, directory, record_from=None):
+        """Creates a new instance of ReplayTransport.
+
+        :type directory: str
+        :param directory: The directory that recordings are stored in.
+
+        :type record_from: :class:`.Transport`
+        :param record_from: A transport to fetch and record missing responses through. May be omitted.
+
+        """
+        self.directory = directory
+        self.record_from = record_from
+        if self.record_from is not None and not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode(u'utf-8')).hexdigest())
+
+    def urls(self):
+        """Lists the URLs with recorded responses.
+
+        :rtype: list
+        :return: The recorded URLs, sorted.
+
+        """
+        urls = []
+        for name in os.listdir(self.directory):
+            if name.endswith(u'.json'):
+                with open(os.path.join(self.directory, name), 'rb') as meta_file:
+                    urls.append(json.load(meta_file)[u'url'])
+        return sorted(urls)
+
+    def load(self, url):
+        """Reads the recorded response for the given URL.
+
+        :type url: str
+        :param url: The URL to look up.
+
+        :rtype: :class:`.Response`
+        :return: The recorded response, or None if there is none.
+
+        """
+        path = self._path(url)
+        try:
+            with open(path + u'.json', 'rb') as meta_file:
+                meta = json.load(meta_file)
+            with open(path + u'.body', 'rb') as body_file:
+                content = body_file.read()
+        except IOError:
+            return None
+        return Response(meta[u'url'], status_code=meta[u'status_code'], headers=meta[u'headers'], content=content,
+                        encoding=meta[u'encoding'])
+
+    def save(self, url, response):
+        """Records a response for the given URL.
+
+        :type url: str
+        :param url: The URL that was requested.
+
+        :type response: :class:`.Response`
+        :param response: The response to record.
+
+        """
+        path = self._path(url)
+        with open(path + u'.body', 'wb') as body_file:
+            body_file.write(response.content)
+        with open(path + u'.json', 'wb') as meta_file:
+            json.dump({
+                u'url': url,
+                u'status_code': response.status_code,
+                u'headers': dict(response.headers),
+                u'encoding': response.encoding
+            }, meta_file, indent=2, sort_keys=True)
+
+    def get(self, url, headers=None):
+        response = self.load(url)
+        if response is not None:
+            return response
+        if self.record_from is None:
+            raise MissingRecordingError(url, message=u"No recorded response")
+        response = self.record_from.get(url, headers=headers)
+        self.save(url, response)
+        return response
+
+    def post(self, url, data=None):
+        if self.record_from is None:
+            raise TransportError(message=u"Cannot POST while replaying recorded responses")
+        return self.record_from.post(url, data=data)
@@ -26,8 +26,16 @@ class InvalidUserError(InvalidBaseError):
 class User(Base):
     """Primary interface to user resources on MAL."""
 
+    __slots__ = ('username', '_id', '_picture', '_website', '_access_rank', '_last_list_updates', '_about', '_reviews',
+                 '_recommendations', '_clubs', '_friends', '_anime_stats', '_manga_stats', '_favorite_anime',
+                 '_favorite_manga', '_favorite_characters', '_favorite_people', '_last_online', '_gender', '_birthday',
+                 '_location', '_join_date', '_num_forum_posts', '_num_reviews', '_num_recommendations',
+                 '_num_blog_posts', '_num_clubs', '_num_comments', '_anime_list_views', '_manga_list_views')
+
     _id_attribute = "username"
 
+    _sections = (u'sidebar', u'profile', u'favorites', u'stats', u'updates')
+
     @staticmethod
     def find_username_from_user_id(session, user_id):
         """Look up a MAL username's user ID.
@@ -43,9 +51,9 @@ class User(Base):
         :rtype: str
         :return: The given user's username.
         """
-        comments_page = session.session.get(
+        comments_page = session.fetch(
             u'http://myanimelist.net/comments.php?' + urllib.urlencode({'id': int(user_id)})).text
-        comments_page = bs4.BeautifulSoup(comments_page, 'lxml')
+        comments_page = bs4.BeautifulSoup(comments_page, session.parser_for(u'profile'))
         username_elt = comments_page.find('h1')
         if "'s Comments" not in username_elt.text:
             raise InvalidUserError(user_id,
@@ -67,6 +75,7 @@ class User(Base):
         self.username = username
         if not isinstance(self.username, unicode) or len(self.username) < 1:
             raise InvalidUserError(self.username)
+        self._id = None
         self._picture = None
         self._website = None
         self._access_rank = None
@@ -381,17 +390,39 @@ class User(Base):
 
         """
         user_info = self.parse_sidebar(user_page)
-        user_info[u'access_rank'] = self._parse_access_rank(user_page)
-        user_info[u'website'] = self._parse_user_website(user_page)
-        # parse favorite
-        user_info[u'favorite_anime'] = self._parse_favorite(user_page, 'anime')
-        user_info[u'favorite_manga'] = self._parse_favorite(user_page, 'manga')
-        user_info[u'favorite_characters'] = self._parse_favorite(user_page, 'characters')
-        user_info[u'favorite_people'] = self._parse_favorite(user_page, 'people')
-        # parse stats
-        user_info[u'anime_stats'] = self._parse_stats(user_page, 'anime')
-        user_info[u'manga_stats'] = self._parse_stats(user_page, 'manga')
-        user_info[u'last_list_updates'] = self._parse_last_list_updates(user_page)
+        for section in self._sections[1:]:
+            user_info.update(self.parse_section(section, user_page))
+        return user_info
+
+    def parse_section(self, section, user_page):
+        """Parse one section of the user page: the sidebar, the profile links, favorites, stats, or last list updates.
+
+        :type section: str
+        :param section: 'sidebar', 'profile', 'favorites', 'stats' or 'updates'.
+
+        :type user_page: :class:`bs4.BeautifulSoup`
+        :param user_page: MAL user page's DOM
+
+        :rtype: dict
+        :return: the section's user attributes.
+
+        """
+        if section == u'sidebar':
+            return self.parse_sidebar(user_page)
+        user_info = {}
+        if section == u'profile':
+            user_info[u'access_rank'] = self._parse_access_rank(user_page)
+            user_info[u'website'] = self._parse_user_website(user_page)
+        elif section == u'favorites':
+            user_info[u'favorite_anime'] = self._parse_favorite(user_page, 'anime')
+            user_info[u'favorite_manga'] = self._parse_favorite(user_page, 'manga')
+            user_info[u'favorite_characters'] = self._parse_favorite(user_page, 'characters')
+            user_info[u'favorite_people'] = self._parse_favorite(user_page, 'people')
+        elif section == u'stats':
+            user_info[u'anime_stats'] = self._parse_stats(user_page, 'anime')
+            user_info[u'manga_stats'] = self._parse_stats(user_page, 'manga')
+        elif section == u'updates':
+            user_info[u'last_list_updates'] = self._parse_last_list_updates(user_page)
         return user_info
 
     def parse_reviews(self, reviews_page):
@@ -500,7 +531,8 @@ class User(Base):
                     except AttributeError:
                         # sometime reviw_elt cant produce attribute error
                         # one of the solution is to reparse the tag
-                        review_info[u'text'] = BeautifulSoup(str(review_elt), "lxml").text.strip()
+                        review_info[u'text'] = BeautifulSoup(str(review_elt),
+                                                             self.session.parser_for(u'profile')).text.strip()
 
                     user_info[u'reviews'][media] = review_info
         except:
@@ -647,11 +679,38 @@ class User(Base):
         :return: Current user object.
 
         """
-        user_profile = self.session.session.get(
+        user_profile = self.session.fetch(
             u'http://myanimelist.net/profile/' + utilities.urlencode(self.username)).text
-        self.set(self.parse(utilities.get_clean_dom(user_profile)))
+        self.set(self.parse(utilities.get_clean_dom(user_profile, self.session.parser_for(u'profile'), u'profile')))
+        self.parsed_all_sections()
         return self
 
+    def fetch_page(self):
+        """Fetches the MAL user page, for load_section().
+
+        :rtype: :class:`myanimelist.transport.Response`
+        :return: the user page's response.
+
+        """
+        return self.session.fetch(u'http://myanimelist.net/profile/' + utilities.urlencode(self.username))
+
+    def parse_page(self, response):
+        """Parses the MAL user page, for load_section().
+
+        :type response: :class:`myanimelist.transport.Response`
+        :param response: the user page's response.
+
+        :rtype: :class:`bs4.BeautifulSoup`
+        :return: the user page's DOM.
+
+        :raises: :class:`.InvalidUserError`
+
+        """
+        user_page = utilities.get_clean_dom(response.text, self.session.parser_for(u'profile'), u'profile')
+        if user_page.find(u'div', {u'class': u'badresult'}):
+            raise InvalidUserError(self.username)
+        return user_page
+
     def load_reviews(self):
         """Fetche the MAL user reviews page and sets the current user's reviews attributes.
 
@@ -665,13 +724,13 @@ class User(Base):
         while True:
             user_reviews = (self
                             .session
-                            .session
-                            .get(u'http://myanimelist.net/profile/' +
-                                 utilities.urlencode(self.username) +
-                                 u'/reviews&' +
-                                 urllib.urlencode({u'p': page}))
+                            .fetch(u'http://myanimelist.net/profile/' +
+                                   utilities.urlencode(self.username) +
+                                   u'/reviews&' +
+                                   urllib.urlencode({u'p': page}))
                             .text)
-            parse_result = self.parse_reviews(utilities.get_clean_dom(user_reviews))
+            parse_result = self.parse_reviews(
+                utilities.get_clean_dom(user_reviews, self.session.parser_for(u'profile'), u'profile'))
             if page == 0:
                 # only set attributes once the first time around.
                 self.set(parse_result)
@@ -693,11 +752,12 @@ class User(Base):
         :return: Current user object.
 
         """
-        user_recommendations = self.session.session.get(
+        user_recommendations = self.session.fetch(
             u'http://myanimelist.net/profile/' +
             utilities.urlencode(self.username) +
             u'/recommendations').text
-        self.set(self.parse_recommendations(utilities.get_clean_dom(user_recommendations)))
+        self.set(self.parse_recommendations(
+            utilities.get_clean_dom(user_recommendations, self.session.parser_for(u'profile'), u'profile')))
         return self
 
     def load_clubs(self):
@@ -707,11 +767,11 @@ class User(Base):
         :return: Current user object.
 
         """
-        user_clubs = self.session.session.get(
+        user_clubs = self.session.fetch(
             u'http://myanimelist.net/profile/' +
             utilities.urlencode(self.username) +
             u'/clubs').text
-        self.set(self.parse_clubs(utilities.get_clean_dom(user_clubs)))
+        self.set(self.parse_clubs(utilities.get_clean_dom(user_clubs, self.session.parser_for(u'profile'), u'profile')))
         return self
 
     def load_friends(self):
@@ -721,38 +781,34 @@ class User(Base):
         :return: Current user object.
 
         """
-        user_friends = self.session.session.get(
+        user_friends = self.session.fetch(
             u'http://myanimelist.net/profile/' +
             utilities.urlencode(self.username) + u'/friends').text
-        self.set(self.parse_friends(utilities.get_clean_dom(user_friends)))
+        self.set(self.parse_friends(
+            utilities.get_clean_dom(user_friends, self.session.parser_for(u'profile'), u'profile')))
         return self
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def id(self):
         """User ID."""
         return self._id
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def picture(self):
         """User picture."""
         return self._picture
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'favorites')
     def favorite_anime(self):
         """A list of :class:`myanimelist.anime.Anime` objects contain user's favorite anime."""
         return self._favorite_anime
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'favorites')
     def favorite_manga(self):
         """A list of :class:`myanimelist.manga.Manga` objects containing user's favorite manga."""
         return self._favorite_manga
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'favorites')
     def favorite_characters(self):
         """
         user favorite characters.
@@ -762,80 +818,67 @@ class User(Base):
         """
         return self._favorite_characters
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'favorites')
     def favorite_people(self):
         """A list of :class:`myanimelist.person.Person` objects contain user's favorite people."""
         return self._favorite_people
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def last_online(self):
         """A :class:`datetime.datetime` object marking when this user was active on MAL."""
         return self._last_online
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def gender(self):
         """user gender."""
         return self._gender
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def birthday(self):
         """A :class:`datetime.datetime` object marking this user's birthday."""
         return self._birthday
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def location(self):
         """User location."""
         return self._location
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'profile')
     def website(self):
         """User website."""
         return self._website
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def join_date(self):
         """A :class:`datetime.datetime` object marking when this user joined MAL."""
         return self._join_date
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'profile')
     def access_rank(self):
         """User access rank on MAL."""
         return self._access_rank
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def anime_list_views(self):
         """DEPRECATED! The number of times this user's anime list has been viewed."""
         return self._anime_list_views
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def manga_list_views(self):
         """The number of times this user's manga list has been viewed."""
         return self._manga_list_views
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def num_comments(self):
         """DEPRECATED! The number of comments this user has made."""
         return self._num_comments
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def num_forum_posts(self):
         """The number of forum posts this user has made."""
         return self._num_forum_posts
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'updates')
     def last_list_updates(self):
         """
         A dict of this user's last list updates.
@@ -847,25 +890,21 @@ class User(Base):
         """
         return self._last_list_updates
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'sidebar')
     def about(self):
         """User self-bio."""
         return self._about
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'stats')
     def anime_stats(self):
         """A dict of this user's anime stats, with keys as strings, and values as numerics."""
         return self._anime_stats
 
-    @property
-    @loadable(u'load')
+    @loadable(u'load_section', u'stats')
     def manga_stats(self):
         """A dict of this user's manga stats, with keys as strings, and values as numerics."""
         return self._manga_stats
 
-    @property
     @loadable(u'load_reviews')
     def reviews(self):
         """A dict of this user's reviews.
@@ -894,7 +933,6 @@ class User(Base):
         """
         return self._reviews
 
-    @property
     @loadable(u'load_recommendations')
     def recommendations(self):
         """A dict of this user's recommendations.
@@ -913,13 +951,11 @@ class User(Base):
         """
         return self._recommendations
 
-    @property
     @loadable(u'load_clubs')
     def clubs(self):
         """A list of :class:`myanimelist.club.Club` objects containing user's club memberships."""
         return self._clubs
 
-    @property
     @loadable(u'load_friends')
     def friends(self):
         """A dict of this user's friends.
@@ -1,54 +1,142 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
+import collections
 import datetime
 import re
+import threading
 import urllib
+import urlparse
 
 import bs4
 
 
-def fix_bad_html(html):
-    """
-      Fixes for various DOM errors that MAL commits.
-      Yes, I know this is a cardinal sin, but there's really no elegant way to fix this.
-    """
-    # on anime list pages, sometimes tds won't be properly opened.
-    html = re.sub(r'[\s]td class=', "<td class=", html)
-    # on anime list pages, if the user doesn't specify progress, MAL will try to close a span it didn't open.
+# on anime list pages, sometimes tds won't be properly opened.
+UNOPENED_TD = re.compile(r'[\s]td class=')
+
+# on anime list pages, if the user doesn't specify progress, MAL will try to close a span it didn't open.
+ANIME_LIST_CLOSING_SPAN = re.compile(r'(?P<count>[0-9\-]+)</span>/(?P<total>[0-9\-]+)</a></span></td>')
+
+# on manga character pages, sometimes the character info column will have an extra </div>.
+MANGA_CHARACTER_DOUBLE_CLOSED_DIV_PICTURE = re.compile(
+    r"""<td (?P<td_tag>[^>]+)>\n\t\t\t<div (?P<div_tag>[^>]+)><a (?P<a_tag>[^>]+)><img (?P<img_tag>[^>]+)></a></div>\n\t\t\t</div>\n\t\t\t</td>""")
+MANGA_CHARACTER_DOUBLE_CLOSED_DIV_CHARACTER = re.compile(
+    r"""<a href="/character/(?P<char_link>[^"]+)">(?P<char_name>[^<]+)</a>\n\t\t\t<div class="spaceit_pad"><small>(?P<role>[A-Za-z ]+)</small></div>\n\t\t\t</div>""")
+
+
+def fix_unopened_td(html):
+    return UNOPENED_TD.sub("<td class=", html)
+
+
+def fix_anime_list_closing_span(html):
     def anime_list_closing_span(match):
         return match.group(u'count') + '/' + match.group(u'total') + '</td>'
 
-    html = re.sub(r'(?P<count>[0-9\-]+)</span>/(?P<total>[0-9\-]+)</a></span></td>', anime_list_closing_span, html)
+    return ANIME_LIST_CLOSING_SPAN.sub(anime_list_closing_span, html)
+
 
+def fix_licensing_company_div(html):
     # on anime info pages, under rating, there's an extra </div> by the "licensing company" note.
-    html = html.replace('<small>L</small></sup><small> represents licensing company</small></div>',
+    return html.replace('<small>L</small></sup><small> represents licensing company</small></div>',
                         '<small>L</small></sup><small> represents licensing company</small>')
 
-    # on manga character pages, sometimes the character info column will have an extra </div>.
+
+def fix_manga_character_double_closed_divs(html):
     def manga_character_double_closed_div_picture(match):
         return "<td " + match.group(u'td_tag') + ">\n\t\t\t<div " + match.group(u'div_tag') + "><a " + match.group(
             u'a_tag') + "><img " + match.group(u'img_tag') + "></a></div>\n\t\t\t</td>"
 
-    html = re.sub(
-        r"""<td (?P<td_tag>[^>]+)>\n\t\t\t<div (?P<div_tag>[^>]+)><a (?P<a_tag>[^>]+)><img (?P<img_tag>[^>]+)></a></div>\n\t\t\t</div>\n\t\t\t</td>""",
-        manga_character_double_closed_div_picture, html)
+    html = MANGA_CHARACTER_DOUBLE_CLOSED_DIV_PICTURE.sub(manga_character_double_closed_div_picture, html)
 
     def manga_character_double_closed_div_character(match):
         return """<a href="/character/""" + match.group(u'char_link') + """">""" + match.group(
             u'char_name') + """</a>\n\t\t\t<div class="spaceit_pad"><small>""" + match.group(
             u'role') + """</small></div>"""
 
-    html = re.sub(
-        r"""<a href="/character/(?P<char_link>[^"]+)">(?P<char_name>[^<]+)</a>\n\t\t\t<div class="spaceit_pad"><small>(?P<role>[A-Za-z ]+)</small></div>\n\t\t\t</div>""",
-        manga_character_double_closed_div_character, html)
+    return MANGA_CHARACTER_DOUBLE_CLOSED_DIV_CHARACTER.sub(manga_character_double_closed_div_character, html)
+
+
+"""The fixups to run on each type of page, as lists of tuple(2)s of (trigger, fixup).
+A fixup only runs if its trigger text appears in the page.
+"""
+FIXUPS = collections.OrderedDict([
+    (u'list', [(u'td class=', fix_unopened_td), (u'</span>/', fix_anime_list_closing_span)]),
+    (u'media', [(u'represents licensing company</small></div>', fix_licensing_company_div)]),
+    # characters and stats pages carry the media's sidebar too, which parse_sidebar() reads.
+    (u'characters', [(u'represents licensing company</small></div>', fix_licensing_company_div),
+                     (u'\n\t\t\t</div>', fix_manga_character_double_closed_divs)]),
+    (u'stats', [(u'represents licensing company</small></div>', fix_licensing_company_div)]),
+    (u'profile', [])
+])
+
+
+def every_fixup():
+    """
+      Return every fixup in FIXUPS once, in order, for pages whose type hasn't been checked against the fixes.
+    """
+    fixups = []
+    for page_fixups in FIXUPS.itervalues():
+        for fixup in page_fixups:
+            if fixup not in fixups:
+                fixups.append(fixup)
+    return fixups
+
+
+# character, person and other pages haven't been checked against pages recorded off MAL,
+# so run every fix, as all pages used to.
+FIXUPS[u'character'] = every_fixup()
+FIXUPS[u'other'] = FIXUPS[u'character']
+
+
+def region_strainer(ids=(), classes=()):
+    """
+      Given ids and classes of the regions of a MAL page that a parser uses,
+      return a bs4.SoupStrainer that keeps only the elements with those ids or classes, and their descendants.
+    """
+    ids = frozenset(ids)
+    classes = frozenset(classes)
+
+    def in_region(name, attrs):
+        if attrs.get(u'id') in ids:
+            return True
+        tag_classes = attrs.get(u'class') or u''
+        if not isinstance(tag_classes, list):
+            tag_classes = tag_classes.split()
+        return any(tag_class in classes for tag_class in tag_classes)
+
+    return bs4.SoupStrainer(in_region)
+
+
+"""The regions of each type of page that its parsers use. Every page type without an entry is parsed whole.
+Everything the media parsers look at is under #contentWrapper, save MAL's "no such resource" notice.
+Only page types whose parsed attributes are checked against whole pages' have an entry, on pages recorded off MAL
+by tests/recorded_pages_tests.py; profile and character pages are parsed whole until they are.
+"""
+REGIONS = {
+    u'media': region_strainer(ids=[u'contentWrapper'], classes=[u'badresult'])
+}
+
+
+def fix_bad_html(html, page_type=None):
+    """
+      Fixes for various DOM errors that MAL commits.
+      Yes, I know this is a cardinal sin, but there's really no elegant way to fix this.
+      Only the fixes for the given type of page, e.g. "media" or "profile", are run. If omitted, every fix is run.
+    """
+    fixups = FIXUPS[page_type] if page_type is not None else every_fixup()
+    for trigger, fixup in fixups:
+        if trigger in html:
+            html = fixup(html)
     return html
 
 
-def get_clean_dom(html):
+def get_clean_dom(html, parser="html.parser", page_type=None):
     """
-      Given raw HTML from a MAL page, return a BeautifulSoup object with cleaned HTML.
+      Given raw HTML from a MAL page, return a BeautifulSoup object with cleaned HTML,
+      built by the given BeautifulSoup tree builder.
+      If given the type of page, e.g. "media" or "profile", only that type's fixes are run,
+      and if the type has an entry in REGIONS, only the regions of the page that its parsers use are built.
     """
-    return bs4.BeautifulSoup(fix_bad_html(html), "html.parser")
+    return bs4.BeautifulSoup(fix_bad_html(html, page_type), parser, parse_only=REGIONS.get(page_type))
 
 
 def urlencode(url):
@@ -58,114 +146,159 @@ def urlencode(url):
     return urllib.urlencode({'': url.encode(u'utf-8').replace(' ', '_')})[1:].replace('%2F', '/')
 
 
+def resource_family(url):
+    """
+      Given a MAL url, return the family of resource it points to:
+      "list", "profile", "stats", "characters", "media" or "other".
+    """
+    path = urlparse.urlsplit(url).path
+    if path.endswith(u'/malappinfo.php'):
+        return u'list'
+    if path.startswith(u'/profile/') or path.endswith(u'/comments.php'):
+        return u'profile'
+    if path.startswith(u'/anime/') or path.startswith(u'/manga/'):
+        if path.endswith(u'/stats'):
+            return u'stats'
+        if path.endswith(u'/characters'):
+            return u'characters'
+        return u'media'
+    return u'other'
+
+
 def extract_tags(tags):
     map(lambda x: x.extract(), tags)
 
 
-def parse_profile_date(text, suppress=False):
+def sidebar_labels(media_page):
+    """
+      Given a MAL media page's DOM, return a dict indexing its labelled sidebar fields, e.g. "Episodes:" or "Status:",
+      keyed by label without its colon, e.g. u"Episodes", with the tag holding the label and its value.
+      Built in one pass over the page's dark_text labels; the first field with a given label wins.
+    """
+    labels = {}
+    for label in media_page.find_all(u'span', {u'class': u'dark_text'}):
+        labels.setdefault(label.get_text().strip().rstrip(u':'), label.parent)
+    return labels
+
+
+def sidebar_field(labels, name):
+    """
+      Given a sidebar label index from sidebar_labels(), return the field whose label starts with name, e.g. u"Ranked",
+      for layouts whose labels run on into their values, e.g. "Ranked: #22", so aren't indexed under the name alone.
+      Returns None if there's no such field.
+    """
+    for label, field in labels.iteritems():
+        if label.startswith(name):
+            return field
+    return None
+
+
+# dates on profile and list pages that mean "no date".
+NO_DATE = frozenset([u"Unknown", u"?", u"Not available"])
+
+# relative dates, e.g. "5 minutes ago" or "Yesterday, 3:04 PM".
+AGO_DATE = re.compile(r'(?P<count>[0-9]+) (?P<unit>second|minute|hour)(s)? ago')
+DAY_DATE = re.compile(r'(?P<day>Today|Yesterday), (?P<hour>[0-9]+):(?P<minute>[0-9]+) (?P<am>[APM]+)')
+
+# dates on list pages, e.g. "2010-04-00", where a 00 month or day means it is unknown.
+LIST_DATE = re.compile(r'(?P<year>[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})$')
+
+# the formats of every other absolute date, in the order they're tried, keyed by whether the date starts with a digit
+# and whether it has a time. A date only ever matches formats of its own shape, so only those are tried.
+DATE_FORMATS = {
+    (True, True): [('%m-%d-%y, %I:%M %p', False)],
+    (False, True): [('%b %d, %Y %I:%M %p', False)],
+    (True, False): [('%m-%d-%y', True), ('%Y-%m-%d', True), ('%Y-%m-00', True), ('%Y-00-00', True), ('%Y', True)],
+    (False, False): [('%B %d, %Y', True), ('%b %d, %Y', True), ('%b %Y', True)]
+}
+
+# the number of absolute dates to remember the parse of.
+DATE_CACHE_SIZE = 10000
+_date_cache = collections.OrderedDict()
+_date_cache_lock = threading.Lock()
+
+
+def _parse_absolute_date(text):
+    """
+      Parses a MAL date that doesn't depend on the current time, returning None if it's in no known format.
+    """
+    list_match = LIST_DATE.match(text)
+    if list_match:
+        year, month, day = int(list_match.group(u'year')), int(list_match.group(u'month')), int(
+            list_match.group(u'day'))
+        if month == 0:
+            if day != 0:
+                return None
+            month = 1
+        if day == 0:
+            day = 1
+        try:
+            return datetime.date(year, month, day)
+        except ValueError:
+            return None
+
+    for date_format, date_only in DATE_FORMATS[(text[:1].isdigit(), u':' in text)]:
+        try:
+            parsed = datetime.datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+        return parsed.date() if date_only else parsed
+    return None
+
+
+def parse_profile_date(text, suppress=False, now=None):
     """
       Parses a MAL date on a profile page.
       May raise ValueError if a malformed date is found.
       If text is "Unknown" or "?" or "Not available" then returns None.
       Otherwise, returns a datetime.date object.
+      Relative dates, e.g. "5 minutes ago" or "Today, 3:04 PM", are taken relative to now, which defaults to the current time.
+      Absolute dates are remembered, so that a date that's been parsed before is returned without parsing it again.
     """
     try:
-        if text == u"Unknown" or text == u"?" or text == u"Not available":
+        if text in NO_DATE:
             return None
+
+        with _date_cache_lock:
+            if text in _date_cache:
+                parsed = _date_cache.pop(text)
+                _date_cache[text] = parsed
+                return parsed
+
+        if now is None:
+            now = datetime.datetime.now()
         if text == u"Now":
-            return datetime.datetime.now()
-
-        seconds_match = re.match(r'(?P<seconds>[0-9]+) second(s)? ago', text)
-        if seconds_match:
-            return datetime.datetime.now() - datetime.timedelta(seconds=int(seconds_match.group(u'seconds')))
-
-        minutes_match = re.match(r'(?P<minutes>[0-9]+) minute(s)? ago', text)
-        if minutes_match:
-            return datetime.datetime.now() - datetime.timedelta(minutes=int(minutes_match.group(u'minutes')))
-
-        hours_match = re.match(r'(?P<hours>[0-9]+) hour(s)? ago', text)
-        if hours_match:
-            return datetime.datetime.now() - datetime.timedelta(hours=int(hours_match.group(u'hours')))
-
-        today_match = re.match(r'Today, (?P<hour>[0-9]+):(?P<minute>[0-9]+) (?P<am>[APM]+)', text)
-        if today_match:
-            hour = int(today_match.group(u'hour'))
-            minute = int(today_match.group(u'minute'))
-            am = today_match.group(u'am')
-            if am == u'PM' and hour < 12:
-                hour += 12
-            today = datetime.date.today()
-            return datetime.datetime(year=today.year, month=today.month, day=today.day, hour=hour, minute=minute,
-                                     second=0)
-
-        yesterday_match = re.match(r'Yesterday, (?P<hour>[0-9]+):(?P<minute>[0-9]+) (?P<am>[APM]+)', text)
-        if yesterday_match:
-            hour = int(yesterday_match.group(u'hour'))
-            minute = int(yesterday_match.group(u'minute'))
-            am = yesterday_match.group(u'am')
-            if am == u'PM' and hour < 12:
+            return now
+
+        ago_match = AGO_DATE.match(text)
+        if ago_match:
+            return now - datetime.timedelta(**{ago_match.group(u'unit') + u's': int(ago_match.group(u'count'))})
+
+        day_match = DAY_DATE.match(text)
+        if day_match:
+            hour = int(day_match.group(u'hour'))
+            minute = int(day_match.group(u'minute'))
+            if day_match.group(u'am') == u'PM' and hour < 12:
                 hour += 12
-            yesterday = datetime.date.today() - datetime.timedelta(days=1)
-            return datetime.datetime(year=yesterday.year, month=yesterday.month, day=yesterday.day, hour=hour,
-                                     minute=minute, second=0)
+            day = now.date()
+            if day_match.group(u'day') == u'Yesterday':
+                day -= datetime.timedelta(days=1)
+            return datetime.datetime(year=day.year, month=day.month, day=day.day, hour=hour, minute=minute, second=0)
 
-        # see if it's datetime
-        try:
-            return datetime.datetime.strptime(text, '%m-%d-%y, %I:%M %p')
-        except ValueError:
-            pass
-        try:
+        if u':' in text and not text[:1].isdigit():
             # this format dont have year so change it with current year
             # if not default year will be used(1990 or something)
-            parsed_datetime = datetime.datetime.strptime(text, '%b %d, %I:%M %p')
-            current_year = int(datetime.date.today().strftime("%Y"))
-            return parsed_datetime.replace(year=current_year)
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%b %d, %Y %I:%M %p')
-        except ValueError:
-            pass
+            try:
+                return datetime.datetime.strptime(text, '%b %d, %I:%M %p').replace(year=now.year)
+            except ValueError:
+                pass
 
-        # see if it's a date.
-        try:
-            return datetime.datetime.strptime(text, '%m-%d-%y').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%Y-%m-%d').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%Y-%m-00').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%Y-00-00').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%B %d, %Y').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%b %d, %Y').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%Y').date()
-        except ValueError:
-            pass
-        try:
-            return datetime.datetime.strptime(text, '%b %d, %Y').date()
-        except ValueError:
-            pass
-        # see if it's a month/year pairing.
-        try:
-            return datetime.datetime.strptime(text, '%b %Y').date()
-        except ValueError:
-            pass
-                
+        parsed = _parse_absolute_date(text)
+        with _date_cache_lock:
+            _date_cache[text] = parsed
+            while len(_date_cache) > DATE_CACHE_SIZE:
+                _date_cache.popitem(last=False)
+        return parsed
     except:
         if suppress:
             return None
@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Runs work for a session on a bounded pool of threads."""
+import Queue
+import sys
+import threading
+
+
+class Future(object):
+    """The eventual outcome of a call submitted to a :class:`.WorkerPool`.
+    Not a concurrent.futures.Future, so APIs that require one, e.g. asyncio.wrap_future, won't take it.
+    """
+
+    def __init__(self):
+        """Creates a new instance of Future.
+
+        :rtype: :class:`.Future`
+        :return: A future that isn't done yet.
+
+        """
+        self._done = threading.Event()
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        """Whether the call has finished.
+
+        :rtype: bool
+        :return: True if the call has returned or raised.
+
+        """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """Waits for the call to finish, then returns its result or re-raises its exception.
+
+        :type timeout: float
+        :param timeout: How long to wait, in seconds. Waits forever if omitted.
+
+        :return: The result of the call.
+
+        """
+        if not self._done.wait(timeout):
+            raise RuntimeError(u"Timed out waiting for a result")
+        if self._exc_info is not None:
+            raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+        return self._result
+
+    def exception(self, timeout=None):
+        """Waits for the call to finish, then returns the exception it raised.
+
+        :type timeout: float
+        :param timeout: How long to wait, in seconds. Waits forever if omitted.
+
+        :rtype: Exception
+        :return: The exception raised by the call, or None if it returned.
+
+        """
+        if not self._done.wait(timeout):
+            raise RuntimeError(u"Timed out waiting for a result")
+        return self._exc_info[1] if self._exc_info is not None else None
+
+    def add_done_callback(self, callback):
+        """Arranges for a function to be called with this future once it's done.
+        If it's already done, the function is called immediately.
+
+        :type callback: function
+        :param callback: A function taking this future.
+
+        """
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def set_exc_info(self, exc_info):
+        self._exc_info = exc_info
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class WorkerPool(object):
+    """A fixed number of daemon threads running submitted calls in the order they were submitted.
+    """
+
+    def __init__(self, size=8):
+        """Creates a new instance of WorkerPool. Threads are started on first use.
+
+        :type size: int
+        :param size: The number of calls to run at once.
+
+        :rtype: :class:`.WorkerPool`
+        :return: The desired pool.
+
+        """
+        self.size = size
+        self._queue = Queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func, args, kwargs = item
+            try:
+                result = func(*args, **kwargs)
+            except:
+                future.set_exc_info(sys.exc_info())
+            else:
+                future.set_result(result)
+
+    def submit(self, func, *args, **kwargs):
+        """Schedules func(*args, **kwargs) to run on the pool.
+
+        :type func: function
+        :param func: The function to call.
+
+        :rtype: :class:`.Future`
+        :return: The outcome of the call.
+
+        """
+        with self._lock:
+            if len(self._threads) < self.size:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def shutdown(self, wait=True):
+        """Stops the pool's threads once every call submitted so far has run.
+
+        :type wait: bool
+        :param wait: Whether to block until the threads have stopped.
+
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+def as_completed(futures):
+    """Yields futures as they finish, whichever order that is in.
+
+    :type futures: list
+    :param futures: A list of :class:`.Future` objects.
+
+    :rtype: generator
+    :return: A generator of the given futures, each yielded once it's done.
+
+    """
+    finished = Queue.Queue()
+    for future in futures:
+        future.add_done_callback(finished.put)
+    for _ in xrange(len(futures)):
+        yield finished.get()
@@ -18,6 +18,7 @@ config = {
     'install_requires': ['beautifulsoup4', 'requests', 'pytz', 'lxml'],
     'tests_require': ['nose'],
     'packages': [NAME],
+    'package_data': {NAME: ['catalog.json']},
 }
 
 setup(**config)
@@ -3,9 +3,18 @@
 
 from unittest import TestCase
 import datetime
+import decimal
+import os
+import threading
+
+import bs4
 
 import myanimelist.session
 import myanimelist.anime
+import myanimelist.base
+import myanimelist.utilities
+from tests.coalesce_tests import CountingFlights, GatedTransport, TIMEOUT
+from tests.transport_tests import StaticTransport
 
 
 class testAnimeClass(TestCase):
@@ -392,3 +401,294 @@ class testAnimeClass(TestCase):
         self.assertIn(self.adventure_tag, self.spicy_wolf.popular_tags)
         self.assertEquals(len(self.non_tagged_anime.popular_tags), 1)
 
+
+def fixture(name):
+    with open(os.path.join(os.path.dirname(__file__), u'fixtures', name)) as fixture_file:
+        return fixture_file.read()
+
+
+class testAnimePageClass(TestCase):
+    """Parses hand-written anime pages modelled on MAL's, so runs without MAL."""
+
+    def setUp(self):
+        self.soups = 0
+        self.original_init = bs4.BeautifulSoup.__init__
+        test = self
+
+        def counting_init(soup, *args, **kwargs):
+            test.soups += 1
+            test.original_init(soup, *args, **kwargs)
+
+        bs4.BeautifulSoup.__init__ = counting_init
+
+    def tearDown(self):
+        bs4.BeautifulSoup.__init__ = self.original_init
+
+    def testLoad(self):
+        session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html')))
+        bebop = session.anime(1).load()
+        self.assertEqual(self.soups, 1)
+        self.assertEqual(bebop.title, u'Cowboy Bebop')
+        self.assertEqual(bebop.alternative_titles[u'English'], [u'Cowboy Bebop'])
+        self.assertEqual(bebop.type, u'TV')
+        self.assertEqual(bebop.episodes, 26)
+        self.assertEqual(bebop.status, u'Finished Airing')
+        self.assertEqual(bebop.aired, (datetime.date(1998, 4, 3), datetime.date(1999, 4, 24)))
+        self.assertEqual(bebop.producers, [session.producer(23), session.producer(14)])
+        self.assertIn(session.genre(29), bebop.genres)
+        self.assertEqual(bebop.duration, datetime.timedelta(minutes=24))
+        self.assertEqual(bebop.rating, u'R - 17+ (violence & profanity)')
+        self.assertEqual(bebop.score, (decimal.Decimal(u'8.83'), 409212))
+        self.assertEqual((bebop.rank, bebop.popularity, bebop.members, bebop.favorites), (22, 39, 807451, 43127))
+        self.assertTrue(bebop.synopsis.startswith(u'In the year 2071'))
+
+    def testLoadKeepsCatalogNames(self):
+        # interned genres are shared by every session, so a page's link text mustn't rename them.
+        renamed = fixture(u'anime_1.html').replace('>Space</a>', '>Outer Space</a>')
+        self.assertNotEqual(renamed, fixture(u'anime_1.html'))
+        session = myanimelist.session.Session(transport=StaticTransport(renamed))
+        self.assertIn(session.genre(29), session.anime(1).genres)
+        self.assertEqual(session.genre(29).name, u'Space')
+
+    def testLoadSections(self):
+        transport = StaticTransport(fixture(u'anime_1.html'))
+        session = myanimelist.session.Session(transport=transport)
+        bebop = session.anime(1)
+        self.assertEqual((bebop.title, bebop.episodes), (u'Cowboy Bebop', 26))
+        self.assertIsNone(bebop._synopsis)
+        self.assertTrue(bebop.synopsis.startswith(u'In the year 2071'))
+        self.assertEqual(bebop.related, {u'Adaptation': [session.manga(173)], u'Side story': [session.anime(5)]})
+        self.assertEqual(session.anime(5).title, u'Cowboy Bebop: Tengoku no Tobira')
+        self.assertEqual((len(transport.requests), self.soups), (1, 1))
+        # every section has been parsed, so the page is let go.
+        self.assertIsNone(bebop._page)
+        self.assertEqual(len(session.kept_pages), 0)
+
+    def testKeptPagesBounded(self):
+        transport = StaticTransport(fixture(u'anime_1.html'))
+        session = myanimelist.session.Session(transport=transport, keep_pages=1)
+        bebop, movie = session.anime(1), session.anime(5)
+        self.assertEqual((bebop.title, movie.title), (u'Cowboy Bebop', u'Cowboy Bebop'))
+        self.assertIsNone(bebop._page)
+        self.assertIsNotNone(movie._page)
+        # the page bebop's was let go for is fetched again, rather than parsed from one kept without bound.
+        self.assertTrue(bebop.synopsis.startswith(u'In the year 2071'))
+        self.assertEqual((len(transport.requests), self.soups), (3, 3))
+
+    def testSectionsParsedThroughSession(self):
+        session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html')))
+        keys = []
+        parse_response = session.parse_response
+
+        def recording_parse_response(response, parser, key=None):
+            keys.append(key)
+            return parse_response(response, parser, key)
+
+        session.parse_response = recording_parse_response
+        bebop = session.anime(1)
+        self.assertEqual((bebop.title, bebop.episodes), (u'Cowboy Bebop', 26))
+        self.assertTrue(bebop.synopsis.startswith(u'In the year 2071'))
+        self.assertEqual(keys, [u'sidebar', u'synopsis'])
+
+    def testLoadDropsKeptPage(self):
+        session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html')))
+        bebop = session.anime(1)
+        self.assertEqual(bebop.title, u'Cowboy Bebop')
+        self.assertIsNotNone(bebop._page)
+        bebop.load()
+        self.assertIsNone(bebop._page)
+        self.assertEqual(bebop._parsed_sections, (u'sidebar', u'synopsis', u'related'))
+
+    def testConcurrentSections(self):
+        session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html')))
+        bebop = session.anime(1)
+        threads = [threading.Thread(target=bebop.load_section, args=(section,))
+                   for section in [u'sidebar', u'synopsis', u'related'] * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(sorted(bebop._parsed_sections), [u'related', u'sidebar', u'synopsis'])
+        self.assertIsNone(bebop._page)
+        # sections parsed at once, out of one DOM the sidebar's parser edits, come out as a serial load's do.
+        loaded = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html'))).anime(1).load()
+        for attribute in [u'title', u'type', u'episodes', u'rank', u'popularity', u'members', u'favorites', u'score',
+                          u'genres', u'producers', u'synopsis', u'related']:
+            self.assertEqual(getattr(bebop, attribute), getattr(loaded, attribute))
+
+    def testConcurrentSectionsShareOnePage(self):
+        # without coalesced fetches, threads finding no page kept still fetch and build it once between them.
+        transport = GatedTransport(fixture(u'anime_1.html'))
+        session = myanimelist.session.Session(transport=transport, coalesce=False)
+        bebop = session.anime(1)
+        page_loads = myanimelist.base._page_loads
+        myanimelist.base._page_loads = CountingFlights(1)
+        try:
+            threads = [threading.Thread(target=bebop.load_section, args=(section,))
+                       for section in [u'sidebar', u'synopsis']]
+            for thread in threads:
+                thread.start()
+            self.assertTrue(myanimelist.base._page_loads.joined.wait(TIMEOUT))
+            transport.gate.set()
+            for thread in threads:
+                thread.join(TIMEOUT)
+                self.assertFalse(thread.is_alive())
+        finally:
+            myanimelist.base._page_loads = page_loads
+        self.assertEqual((len(transport.requests), self.soups), (1, 1))
+
+    def testSectionsMatchLoad(self):
+        loaded = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html'))).anime(1).load()
+        lazy = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html'))).anime(1)
+        for attribute in [u'title', u'rank', u'genres', u'aired', u'producers', u'synopsis', u'related']:
+            self.assertEqual(getattr(lazy, attribute), getattr(loaded, attribute))
+
+    def testOlderLayoutSidebar(self):
+        # the older layout's labels hold their values too, rather than being followed by them.
+        older = fixture(u'anime_1.html').decode(u'utf-8')
+        for label, value in [(u'Type:', u'\n<a href="http://myanimelist.net/topanime.php?type=tv">TV</a>'),
+                             (u'Ranked:', u'\n#22<sup><small>2</small></sup>'), (u'Popularity:', u'\n#39'),
+                             (u'Members:', u'\n807,451'), (u'Favorites:', u'\n43,127')]:
+            older = older.replace(u'<span class="dark_text">' + label + u'</span>' + value,
+                                  u'<span class="dark_text">' + label + value + u'</span>')
+        bebop = myanimelist.session.Session(transport=StaticTransport(older.encode(u'utf-8'))).anime(1).load()
+        self.assertEqual((bebop.type, bebop.rank, bebop.popularity, bebop.members, bebop.favorites),
+                         (u'TV', 22, 39, 807451, 43127))
+
+    def testParserEngines(self):
+        for engine in [u'html.parser', u'lxml']:
+            session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1.html')), parser=engine)
+            bebop = session.anime(1).load()
+            self.assertEqual((bebop.title, bebop.episodes, bebop.rank), (u'Cowboy Bebop', 26, 22))
+
+    def testCharactersPageSidebar(self):
+        # a licensed anime's sidebar, with the stray </div> MAL leaves after its licensing note.
+        licensed = fixture(u'anime_1_characters.html').decode(u'utf-8').replace(
+            u'title="Sunrise">Sunrise</a>\n</div>',
+            u'title="Sunrise">Sunrise</a><sup><small>L</small></sup>\n'
+            u'<sup><small>L</small></sup><small> represents licensing company</small></div>\n</div>')
+        self.assertNotIn(u'licensing company</small></div>', myanimelist.utilities.fix_bad_html(licensed, u'characters'))
+        session = myanimelist.session.Session()
+        sidebar = session.anime(1).parse_sidebar(myanimelist.utilities.get_clean_dom(licensed, page_type=u'characters'))
+        self.assertEqual(sidebar[u'producers'], [session.producer(23), session.producer(14)])
+        self.assertEqual(sidebar[u'rating'], u'R - 17+ (violence & profanity)')
+
+    def testLoadCharacters(self):
+        session = myanimelist.session.Session(transport=StaticTransport(fixture(u'anime_1_characters.html')))
+        bebop = session.anime(1).set({u'title': u'Cowboy Bebop'})
+        bebop.load_characters()
+        self.assertEqual(self.soups, 1)
+        self.assertEqual(bebop.characters[session.character(1)][u'role'], u'Main')
+        self.assertEqual(bebop.voice_actors[session.person(11)][u'character'], session.character(1))
+        self.assertEqual(bebop.staff[session.person(40009)], set([u'Director', u'Storyboard']))
+
+
+class testAnimeSlotsClass(TestCase):
+    def testAttributesInSlots(self):
+        bebop = myanimelist.session.Session().anime(1).set({u'title': u'Cowboy Bebop', u'episodes': 26})
+        self.assertEqual((bebop.title, bebop.episodes), (u'Cowboy Bebop', 26))
+        self.assertEqual(vars(bebop), {})
+
+    def testUndeclaredAttributes(self):
+        bebop = myanimelist.session.Session().anime(1).set({u'not_on_most_pages': 1})
+        self.assertEqual(vars(bebop), {u'_not_on_most_pages': 1})
+
+
+class testAnimeLoadableClass(TestCase):
+    def setUp(self):
+        self.loads = myanimelist.base.Loadable._loads
+
+    def tearDown(self):
+        myanimelist.base.Loadable._loads = self.loads
+
+    def testLoadsOnce(self):
+        loads = []
+        bebop = myanimelist.session.Session().anime(1)
+        bebop.load_section = lambda section: loads.append(section) or bebop.set({u'title': u'Cowboy Bebop'})
+        self.assertEqual(bebop.title, u'Cowboy Bebop')
+        self.assertEqual(bebop.title, u'Cowboy Bebop')
+        self.assertEqual(loads, [u'sidebar'])
+
+    def testReadOnly(self):
+        bebop = myanimelist.session.Session().anime(1)
+        with self.assertRaises(AttributeError):
+            bebop.title = u'Cowboy Bebop'
+        self.assertEqual(myanimelist.anime.Anime.title.__doc__, myanimelist.anime.Anime.title.func.__doc__)
+
+    def testWrappedInProperty(self):
+        class PropertyAnime(myanimelist.anime.Anime):
+            @property
+            @myanimelist.base.loadable(u'load_section', u'sidebar')
+            def title(self):
+                return self._title.upper()
+
+        bebop = PropertyAnime(myanimelist.session.Session(), 1)
+        bebop.load_section = lambda section: bebop.set({u'title': u'Cowboy Bebop'})
+        self.assertEqual(bebop.title, u'COWBOY BEBOP')
+
+    def gated_anime(self, error=None):
+        bebop = myanimelist.session.Session().anime(1)
+        bebop.loads = []
+        bebop.started = threading.Event()
+        bebop.gate = threading.Event()
+
+        def load_section(section):
+            bebop.loads.append(section)
+            bebop.started.set()
+            bebop.gate.wait(TIMEOUT)
+            if error is not None:
+                raise error
+            return bebop.set({u'title': u'Cowboy Bebop'})
+
+        bebop.load_section = load_section
+        return bebop
+
+    def read_concurrently(self, bebop, count):
+        results = []
+
+        def worker():
+            try:
+                results.append(bebop.title)
+            except Exception as e:
+                results.append(e)
+
+        myanimelist.base.Loadable._loads = CountingFlights(count - 1)
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        threads[0].start()
+        self.assertTrue(bebop.started.wait(TIMEOUT))
+        for thread in threads[1:]:
+            thread.start()
+        self.assertTrue(myanimelist.base.Loadable._loads.joined.wait(TIMEOUT))
+        bebop.gate.set()
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assertFalse(thread.is_alive())
+        return results
+
+    def testConcurrentReadsLoadOnce(self):
+        bebop = self.gated_anime()
+        self.assertEqual(self.read_concurrently(bebop, 4), [u'Cowboy Bebop'] * 4)
+        self.assertEqual(bebop.loads, [u'sidebar'])
+
+    def testFailuresReachEveryReader(self):
+        bebop = self.gated_anime(error=ValueError(u'MAL is down'))
+        results = self.read_concurrently(bebop, 3)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(bebop.loads, [u'sidebar'])
+
+    def testLoaderReadsOwnAttributes(self):
+        bebop = myanimelist.session.Session().anime(1)
+        loads = []
+
+        def load_section(section):
+            loads.append(section)
+            if len(loads) > 1:
+                return bebop.set({u'title': u'Cowboy Bebop'})
+            # reads an attribute of the section it's loading, which would wait on itself if it were coalesced.
+            return bebop.set({u'episodes': len(bebop.title)})
+
+        bebop.load_section = load_section
+        self.assertEqual(bebop.episodes, 12)
+        self.assertEqual(loads, [u'sidebar', u'sidebar'])
@@ -0,0 +1,92 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import BaseHTTPServer
+import SocketServer
+import threading
+import urlparse
+
+import myanimelist.async_session
+import myanimelist.media_list
+
+
+LIST_XML = """<?xml version="1.0" encoding="UTF-8" ?>
+<myanimelist>
+  <myinfo><user_id>64611</user_id><user_name>shaldengeki</user_name><user_watching>1</user_watching></myinfo>
+  <anime>
+    <series_animedb_id>1</series_animedb_id><series_title>Cowboy Bebop</series_title>
+    <series_episodes>26</series_episodes><series_status>2</series_status>
+    <series_start>1998-04-03</series_start><series_end>1999-04-24</series_end>
+    <series_image>http://cdn.myanimelist.net/images/anime/4/19644.jpg</series_image>
+    <my_start_date>0000-00-00</my_start_date><my_finish_date>0000-00-00</my_finish_date>
+    <my_score>9</my_score><my_status>1</my_status><my_watched_episodes>5</my_watched_episodes>
+    <my_rewatching>0</my_rewatching><my_rewatching_ep>0</my_rewatching_ep><my_last_updated>1400000000</my_last_updated>
+  </anime>
+</myanimelist>"""
+
+
+class StubMALHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Stands in for MAL as an HTTP proxy, serving a single user's anime list and 404ing everything else."""
+
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        query = urlparse.parse_qs(url.query)
+        if url.path == u'/malappinfo.php' and query.get(u'u') == [u'shaldengeki']:
+            status, body = 200, LIST_XML
+        else:
+            status, body = 404, '<html><body>404 Not Found</body></html>'
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubMALServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class testAsyncSessionClass(TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.server = StubMALServer(('127.0.0.1', 0), StubMALHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @classmethod
+    def tearDownClass(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def setUp(self):
+        self.session = myanimelist.async_session.AsyncSession(workers=4)
+        self.session.session.proxies = {'http': 'http://127.0.0.1:%d' % self.server.server_address[1]}
+
+    def tearDown(self):
+        self.session.close()
+
+    def testFetchAsync(self):
+        future = self.session.fetch_async(u'http://myanimelist.net/malappinfo.php?u=shaldengeki&status=all&type=anime')
+        response = future.result(timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, LIST_XML)
+
+    def testLoadReusesParsers(self):
+        shal_list = self.session.load(self.session.anime_list(u'shaldengeki')).result(timeout=5)
+        self.assertEqual(shal_list[self.session.anime(1)][u'score'], 9)
+        self.assertEqual(shal_list.stats[u'watching'], 1)
+
+    def testManyInFlight(self):
+        futures = [self.session.load(self.session.anime_list(u'shaldengeki')) for _ in range(12)]
+        lists = [future.result(timeout=5) for future in futures]
+        self.assertTrue(all(len(shal_list) == 1 for shal_list in lists))
+
+    def testLoaderErrorsRaiseFromFuture(self):
+        future = self.session.load(self.session.anime_list(u'nobody-here'))
+        self.assertIsInstance(future.exception(timeout=5), myanimelist.media_list.MalformedMediaListPageError)
+        self.assertRaises(myanimelist.media_list.MalformedMediaListPageError, future.result)
@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import errno
+import gc
+import os
+import shutil
+import tempfile
+import weakref
+
+import myanimelist.session
+import myanimelist.cache
+import myanimelist.transport
+import myanimelist.utilities
+from tests.transport_tests import StaticTransport, TruncatingServer
+
+
+class testCacheClass(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.bebop_url = u'http://myanimelist.net/anime/1'
+        self.live = StaticTransport('<html><body>Cowboy Bebop</body></html>')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testResourceFamily(self):
+        self.assertEqual(myanimelist.utilities.resource_family(self.bebop_url), u'media')
+        self.assertEqual(myanimelist.utilities.resource_family(u'http://myanimelist.net/manga/1/Monster/stats'),
+                         u'stats')
+        self.assertEqual(
+            myanimelist.utilities.resource_family(u'http://myanimelist.net/anime/1/Cowboy_Bebop/characters'),
+            u'characters')
+        self.assertEqual(
+            myanimelist.utilities.resource_family(u'http://myanimelist.net/malappinfo.php?u=shal&type=anime'),
+            u'list')
+        self.assertEqual(myanimelist.utilities.resource_family(u'http://myanimelist.net/profile/shaldengeki'),
+                         u'profile')
+        self.assertEqual(myanimelist.utilities.resource_family(u'http://myanimelist.net/character/1'), u'other')
+
+    def testWarmLoadSkipsTransport(self):
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        session = myanimelist.session.Session(transport=self.live, cache=cache)
+        self.assertEqual(session.fetch(self.bebop_url).text, u'<html><body>Cowboy Bebop</body></html>')
+        self.assertEqual(session.fetch(self.bebop_url).text, u'<html><body>Cowboy Bebop</body></html>')
+        self.assertEqual(len(self.live.requests), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+        # the cache persists across instances.
+        reopened = myanimelist.cache.ResponseCache(self.directory)
+        session = myanimelist.session.Session(transport=self.live, cache=reopened)
+        session.fetch(self.bebop_url)
+        self.assertEqual(len(self.live.requests), 1)
+        self.assertEqual(reopened.size, len(self.live.content))
+
+    def testExpiredEntryRefetched(self):
+        cache = myanimelist.cache.ResponseCache(self.directory, ttls={u'media': -1})
+        session = myanimelist.session.Session(transport=self.live, cache=cache)
+        session.fetch(self.bebop_url)
+        session.fetch(self.bebop_url)
+        self.assertEqual(len(self.live.requests), 2)
+        self.assertEqual(cache.hits, 0)
+
+    def testUncachedFamily(self):
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        session = myanimelist.session.Session(transport=self.live, cache=cache)
+        session.fetch(u'http://myanimelist.net/anime.php?o=9')
+        self.assertIsNone(cache.get(u'http://myanimelist.net/anime.php?o=9'))
+        # nor looked up, so not counted as a miss.
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def testEviction(self):
+        cache = myanimelist.cache.ResponseCache(self.directory, max_size=len(self.live.content) * 2)
+        session = myanimelist.session.Session(transport=self.live, cache=cache)
+        for anime_id in range(1, 4):
+            session.fetch(u'http://myanimelist.net/anime/' + str(anime_id))
+        self.assertEqual(cache.size, len(self.live.content) * 2)
+        self.assertIsNone(cache.get(u'http://myanimelist.net/anime/1'))
+        self.assertIsNotNone(cache.get(u'http://myanimelist.net/anime/3'))
+
+    def testTouchKeepsEntry(self):
+        cache = myanimelist.cache.ResponseCache(self.directory, max_size=len(self.live.content) * 2)
+        for anime_id in range(1, 3):
+            cache.store(u'http://myanimelist.net/anime/' + str(anime_id), self.live.get(self.bebop_url))
+        cache.touch(u'http://myanimelist.net/anime/1')
+        cache.store(u'http://myanimelist.net/anime/3', self.live.get(self.bebop_url))
+        self.assertIsNotNone(cache.get(u'http://myanimelist.net/anime/1'))
+        self.assertIsNone(cache.get(u'http://myanimelist.net/anime/2'))
+
+    def testWritesLeaveNoTemporaryFiles(self):
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        cache.store(self.bebop_url, self.live.get(self.bebop_url))
+        cache.store(self.bebop_url, self.live.get(self.bebop_url))
+        cache.touch(self.bebop_url)
+        self.assertEqual(sorted(os.path.splitext(filename)[1] for filename in os.listdir(self.directory)),
+                         [u'.body', u'.json'])
+        self.assertEqual(cache.get(self.bebop_url)[0].content, self.live.content)
+
+    def testTruncatedBodyNotCached(self):
+        server = TruncatingServer()
+        try:
+            cache = myanimelist.cache.ResponseCache(self.directory)
+            session = myanimelist.session.Session(cache=cache)
+            self.assertTrue(session.fetch(server.url).incomplete)
+            response = session.fetch(server.url)
+            self.assertFalse(response.from_cache)
+            self.assertEqual(server.requests, 2)
+            self.assertIsNone(cache.get(server.url))
+        finally:
+            server.close()
+
+    def testFailedWriteLeavesNoTemporaryFile(self):
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        fdopen = myanimelist.cache.os.fdopen
+
+        def full_disk(handle, mode):
+            os.close(handle)
+            raise IOError(errno.ENOSPC, u'No space left on device')
+
+        myanimelist.cache.os.fdopen = full_disk
+        try:
+            with self.assertRaises(IOError):
+                cache.store(self.bebop_url, self.live.get(self.bebop_url))
+        finally:
+            myanimelist.cache.os.fdopen = fdopen
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def testStaleTemporaryFilesSwept(self):
+        stale = os.path.join(self.directory, u'stale.tmp')
+        fresh = os.path.join(self.directory, u'fresh.tmp')
+        for path in (stale, fresh):
+            open(path, 'wb').close()
+        os.utime(stale, (0, 0))
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        self.assertEqual(os.listdir(self.directory), [u'fresh.tmp'])
+        self.assertEqual(cache.size, 0)
+
+    def testBlockPageNotCached(self):
+        cache = myanimelist.cache.ResponseCache(self.directory)
+        challenge = StaticTransport('<html><body><iframe src="/_Incapsula_Resource?CWUDNSAI=1"></iframe></body></html>')
+        transport = myanimelist.cache.CachingTransport(challenge, cache)
+        transport.get(self.bebop_url)
+        response = transport.get(self.bebop_url)
+        self.assertFalse(response.from_cache)
+        self.assertEqual(len(challenge.requests), 2)
+        self.assertIsNone(cache.get(self.bebop_url))
+
+
+class ConditionalTransport(StaticTransport):
+    """Serves a fixed body with an ETag, replying 304 Not Modified to matching conditional requests."""
+
+    def get(self, url, headers=None):
+        self.requests.append(url)
+        if headers and headers.get(u'If-None-Match') == u'"v1"':
+            return myanimelist.transport.Response(url, status_code=304, headers={u'ETag': u'"v1"'})
+        return myanimelist.transport.Response(url, headers={u'ETag': u'"v1"'}, content=self.content,
+                                              encoding=u'utf-8')
+
+
+class testRevalidationClass(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.list_xml = """<?xml version="1.0" encoding="UTF-8" ?>
+<myanimelist>
+  <myinfo><user_id>64611</user_id><user_name>shaldengeki</user_name><user_watching>1</user_watching></myinfo>
+  <anime>
+    <series_animedb_id>1</series_animedb_id><series_title>Cowboy Bebop</series_title>
+    <series_episodes>26</series_episodes><series_status>2</series_status>
+    <series_start>1998-04-03</series_start><series_end>1999-04-24</series_end>
+    <series_image>http://cdn.myanimelist.net/images/anime/4/19644.jpg</series_image>
+    <my_start_date>0000-00-00</my_start_date><my_finish_date>0000-00-00</my_finish_date>
+    <my_score>9</my_score><my_status>1</my_status><my_watched_episodes>5</my_watched_episodes>
+    <my_rewatching>0</my_rewatching><my_rewatching_ep>0</my_rewatching_ep><my_last_updated>1400000000</my_last_updated>
+  </anime>
+</myanimelist>"""
+        self.live = ConditionalTransport(self.list_xml)
+        cache = myanimelist.cache.ResponseCache(self.directory, ttls={u'list': 0})
+        self.session = myanimelist.session.Session(transport=self.live, cache=cache)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testNotModifiedReusesBody(self):
+        url = u'http://myanimelist.net/malappinfo.php?u=shaldengeki&status=all&type=anime'
+        self.assertFalse(self.session.fetch(url).not_modified)
+        response = self.session.fetch(url)
+        self.assertTrue(response.not_modified)
+        self.assertEqual(response.content, self.list_xml)
+        self.assertEqual(self.session.transport.revalidations, 1)
+
+    def testNotModifiedReusesParsedAttributes(self):
+        first = self.session.anime_list(u'shaldengeki').load()
+        second = self.session.anime_list(u'shaldengeki').load()
+        self.assertEqual(len(self.live.requests), 2)
+        self.assertEqual(self.session.parsed_cache.hits, 1)
+        self.assertEqual(first.list, second.list)
+        self.assertEqual(second[self.session.anime(1)][u'score'], 9)
+        self.assertEqual(second.stats[u'watching'], 1)
+
+    def testParsedAttributesDontKeepResources(self):
+        cache = myanimelist.cache.ResponseCache(self.directory, ttls={u'list': 0})
+        session = myanimelist.session.Session(transport=self.live, cache=cache, keep_recent=0)
+        bebop = weakref.ref(session.anime_list(u'shaldengeki').load().list.keys()[0])
+        gc.collect()
+        self.assertIsNone(bebop())
+        # the anime the remembered parse pointed to is gone, so the list is parsed again to make it anew.
+        second = session.anime_list(u'shaldengeki').load()
+        self.assertEqual(session.parsed_cache.hits, 0)
+        self.assertEqual(second[session.anime(1)][u'score'], 9)
+        self.assertEqual(session.anime(1).title, u'Cowboy Bebop')
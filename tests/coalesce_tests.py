@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import threading
+
+import myanimelist.session
+import myanimelist.coalesce
+from tests.transport_tests import StaticTransport
+
+# how long to wait on other threads before failing, rather than hanging the suite.
+TIMEOUT = 5
+
+
+class CountingFlights(myanimelist.coalesce.SingleFlight):
+    """Signals once a given number of callers have joined calls already in progress."""
+
+    def __init__(self, expected):
+        self.expected = expected
+        self.joined = threading.Event()
+        super(CountingFlights, self).__init__()
+
+    @property
+    def coalesced(self):
+        return self._coalesced
+
+    @coalesced.setter
+    def coalesced(self, value):
+        self._coalesced = value
+        if value >= self.expected:
+            self.joined.set()
+
+
+class GatedTransport(StaticTransport):
+    """Holds every request until released, so that concurrent callers pile up behind it."""
+
+    def __init__(self, content, error=None):
+        super(GatedTransport, self).__init__(content)
+        self.error = error
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def get(self, url, headers=None):
+        self.started.set()
+        self.gate.wait(TIMEOUT)
+        if self.error is not None:
+            raise self.error
+        return super(GatedTransport, self).get(url, headers=headers)
+
+
+class testCoalesceClass(TestCase):
+    def setUp(self):
+        self.url = u'http://myanimelist.net/anime/1'
+
+    def run_concurrently(self, func, count):
+        results = []
+
+        def worker():
+            try:
+                results.append(func())
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def join(self, threads):
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assertFalse(thread.is_alive())
+
+    def testConcurrentFetchesShareOneRequest(self):
+        live = GatedTransport('<html></html>')
+        session = myanimelist.session.Session(transport=live)
+        session.fetch_flights = CountingFlights(4)
+        first, results = self.run_concurrently(lambda: session.fetch(self.url), 1)
+        self.assertTrue(live.started.wait(TIMEOUT))
+        rest, _ = self.run_concurrently(lambda: session.fetch(self.url), 4)
+        self.assertTrue(session.fetch_flights.joined.wait(TIMEOUT))
+        live.gate.set()
+        self.join(first + rest)
+        self.assertEqual(len(live.requests), 1)
+        self.assertEqual(session.fetch_flights.coalesced, 4)
+
+    def testErrorsReachEveryCaller(self):
+        flights = CountingFlights(2)
+        gate = threading.Event()
+
+        def fail():
+            gate.wait(TIMEOUT)
+            raise ValueError(u'MAL is down')
+
+        threads, results = self.run_concurrently(lambda: flights.do(self.url, fail), 3)
+        self.assertTrue(flights.joined.wait(TIMEOUT))
+        gate.set()
+        self.join(threads)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def testReentrantCallsRun(self):
+        flights = myanimelist.coalesce.SingleFlight()
+        calls = []
+
+        def outer():
+            calls.append(u'outer')
+            return flights.do(self.url, lambda: calls.append(u'inner') or u'done')
+
+        self.assertEqual(flights.do(self.url, outer), u'done')
+        self.assertEqual(calls, [u'outer', u'inner'])
+        self.assertEqual(flights.coalesced, 0)
+
+    def testSequentialFetchesNotCoalesced(self):
+        live = StaticTransport('<html></html>')
+        session = myanimelist.session.Session(transport=live)
+        session.fetch(self.url)
+        session.fetch(self.url)
+        self.assertEqual(len(live.requests), 2)
+
+    def testCoalescingDisabled(self):
+        live = StaticTransport('<html></html>')
+        session = myanimelist.session.Session(transport=live, coalesce=False)
+        self.assertIsNone(session.fetch_flights)
+        self.assertIsNone(session.parse_flights)
+
+    def testConcurrentParsesShareOneParse(self):
+        session = myanimelist.session.Session(transport=StaticTransport('<html></html>'))
+        response = session.fetch(self.url)
+        session.parse_flights = CountingFlights(2)
+        gate = threading.Event()
+        parses = []
+
+        def parser(r):
+            parses.append(r)
+            gate.wait(TIMEOUT)
+            return {u'title': u'Cowboy Bebop'}
+
+        threads, results = self.run_concurrently(lambda: session.parse_response(response, parser), 3)
+        self.assertTrue(session.parse_flights.joined.wait(TIMEOUT))
+        gate.set()
+        self.join(threads)
+        self.assertEqual(len(parses), 1)
+        self.assertEqual(results, [{u'title': u'Cowboy Bebop'}] * 3)
@@ -14,7 +14,7 @@ class testMangaClass(TestCase):
         self.session = myanimelist.session.Session()
 
         self.monster = self.session.manga(1)
-        self.mystery = self.session.genre(7)
+        self.mystery = self.session.genre(7, u'manga')
         self.mystery_tag = self.session.tag(u'mystery')
         self.urasawa = self.session.person(1867)
         self.original = self.session.publication(1)
@@ -22,7 +22,7 @@ class testMangaClass(TestCase):
         self.monster_side_story = self.session.manga(10968)
 
         self.holic = self.session.manga(10)
-        self.supernatural = self.session.genre(37)
+        self.supernatural = self.session.genre(37, u'manga')
         self.supernatural_tag = self.session.tag(u'supernatural')
         self.clamp = self.session.person(1877)
         self.bessatsu = self.session.publication(450)
@@ -30,21 +30,21 @@ class testMangaClass(TestCase):
         self.holic_sequel = self.session.manga(46010)
 
         self.naruto = self.session.manga(11)
-        self.shounen = self.session.genre(27)
+        self.shounen = self.session.genre(27, u'manga')
         self.action_tag = self.session.tag(u'action')
         self.kishimoto = self.session.person(1879)
         self.shonen_jump_weekly = self.session.publication(83)
         self.ebizou = self.session.character(31825)
 
         self.tomoyo_after = self.session.manga(3941)
-        self.drama = self.session.genre(8)
+        self.drama = self.session.genre(8, u'manga')
         self.romance_tag = self.session.tag(u'romance')
         self.sumiyoshi = self.session.person(3830)
         self.dragon_age = self.session.publication(98)
         self.kanako = self.session.character(21227)
 
         self.judos = self.session.manga(79819)
-        self.action = self.session.genre(1)
+        self.action = self.session.genre(1, u'manga')
         self.kondou = self.session.person(18765)
 
         self.invalid_manga = self.session.manga(457384754)
@@ -5,6 +5,7 @@ from unittest import TestCase
 
 import myanimelist.session
 import myanimelist.media_list
+from tests.transport_tests import StaticTransport
 
 
 class testMediaListClass(TestCase):
@@ -15,3 +16,102 @@ class testMediaListClass(TestCase):
     def testCannotInstantiateMediaList(self):
         with self.assertRaises(TypeError):
             myanimelist.media_list.MediaList(self.session, "test_username")
+
+
+def anime_list_xml(rows):
+    entries = []
+    for anime_id, series_type, status in rows:
+        entries.append("""  <anime>
+    <series_animedb_id>%d</series_animedb_id><series_title>Anime %d</series_title><series_type>%d</series_type>
+    <series_episodes>12</series_episodes><series_status>2</series_status>
+    <series_start>2010-01-01</series_start><series_end>2010-03-31</series_end>
+    <series_image>http://cdn.myanimelist.net/images/anime/1/%d.jpg</series_image>
+    <my_start_date>0000-00-00</my_start_date><my_finish_date>0000-00-00</my_finish_date>
+    <my_score>7</my_score><my_status>%d</my_status><my_watched_episodes>3</my_watched_episodes>
+    <my_rewatching>0</my_rewatching><my_rewatching_ep>0</my_rewatching_ep><my_last_updated>1400000000</my_last_updated>
+  </anime>""" % (anime_id, anime_id, series_type, anime_id, status))
+    return """<?xml version="1.0" encoding="UTF-8" ?>
+<myanimelist>
+  <myinfo><user_id>64611</user_id><user_name>shaldengeki</user_name><user_watching>2</user_watching><user_completed>1</user_completed></myinfo>
+%s
+</myanimelist>""" % '\n'.join(entries)
+
+
+class testIterEntriesClass(TestCase):
+    def setUp(self):
+        self.xml = anime_list_xml([(1, 1, 1), (5, 3, 2), (6, 1, 1)])
+        self.live = StaticTransport(self.xml)
+        self.session = myanimelist.session.Session(transport=self.live)
+
+    def testMatchesParse(self):
+        shal_list = self.session.anime_list(u'shaldengeki')
+        streamed = dict(shal_list.iter_entries())
+        self.assertEqual(streamed, shal_list.parse(self.xml)[u'list'])
+        self.assertEqual(shal_list.stats[u'watching'], 2)
+
+    def testStreams(self):
+        entries = self.session.anime_list(u'shaldengeki').iter_entries()
+        anime, entry = next(entries)
+        self.assertEqual(anime, self.session.anime(1))
+        self.assertEqual(anime.title, u'Anime 1')
+        self.assertEqual(entry[u'score'], 7)
+        self.assertEqual(entry[u'status'], u'Watching')
+
+    def testFilters(self):
+        shal_list = self.session.anime_list(u'shaldengeki')
+        self.assertEqual([anime.id for anime, _ in shal_list.iter_entries(statuses=[u'Watching'])], [1, 6])
+        self.assertEqual([anime.id for anime, _ in shal_list.iter_entries(types=[u'Movie'])], [5])
+        self.assertEqual([anime.id for anime, _ in shal_list.iter_entries(statuses=[u'Watching'], types=[u'Movie'])],
+                         [])
+
+    def testCreatesOnlyRowMedia(self):
+        created = []
+        anime = self.session.anime
+        self.session.anime = lambda anime_id: created.append(anime_id) or anime(anime_id)
+        try:
+            list(self.session.anime_list(u'shaldengeki').iter_entries())
+        finally:
+            del self.session.anime
+        self.assertEqual(created, [1, 5, 6])
+
+    def testStatusTerms(self):
+        shal_list = self.session.anime_list(u'shaldengeki')
+        self.assertEqual(shal_list.user_status_terms[6], u'Plan to Watch')
+        self.assertEqual(shal_list.user_status_terms[5], u'Unknown')
+        self.assertEqual(self.session.manga_list(u'shaldengeki').user_status_terms[1], u'Reading')
+        self.assertEqual(dict(shal_list.iter_entries())[self.session.anime(5)][u'status'], u'Completed')
+
+    def testDiscardsParsedRows(self):
+        xml = anime_list_xml([(i, 1, 1) for i in range(1, 201)])
+        shal_list = myanimelist.session.Session(transport=StaticTransport(xml)).anime_list(u'shaldengeki')
+        rows = []
+        xml_row = myanimelist.media_list.XMLRow
+
+        class RecordingRow(xml_row):
+            def __init__(self, element):
+                rows.append(element)
+                xml_row.__init__(self, element)
+
+        myanimelist.media_list.XMLRow = RecordingRow
+        try:
+            entries = shal_list.parse_entries(xml)
+            for _ in range(150):
+                next(entries)
+        finally:
+            myanimelist.media_list.XMLRow = xml_row
+        # rows parsed before the one just yielded are emptied, and all but the latest of them taken out of the document,
+        self.assertEqual([len(row) for row in rows[:-1]], [0] * 149)
+        self.assertEqual([row.getparent() for row in rows[:-2]], [None] * 148)
+        # which so holds no more than those two and the rows not yet read.
+        self.assertLessEqual(len(rows[-1].getparent()), 200 - 148)
+
+    def testInvalidUsername(self):
+        session = myanimelist.session.Session(transport=StaticTransport(
+            '<?xml version="1.0" encoding="UTF-8" ?><myanimelist><error>Invalid username</error></myanimelist>'))
+        with self.assertRaises(myanimelist.media_list.InvalidMediaListError):
+            list(session.anime_list(u'nobody-here').iter_entries())
+
+    def testMalformedList(self):
+        session = myanimelist.session.Session(transport=StaticTransport('<html><body>404</body></html>'))
+        with self.assertRaises(myanimelist.media_list.MalformedMediaListPageError):
+            list(session.anime_list(u'shaldengeki').iter_entries())
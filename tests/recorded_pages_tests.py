@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Checks that the ways python-mal can parse a page agree on pages recorded off MAL with ReplayTransport.
+
+The pages under tests/fixtures are hand-written, so can't show this. Set MAL_RECORDINGS to a directory of
+recordings, e.g. one made by ``Session(transport=ReplayTransport('recordings', record_from=HTTPTransport()))``,
+to run these tests; without one, they're skipped.
+"""
+
+from unittest import TestCase
+import os
+import re
+
+import bs4
+from nose.plugins.skip import SkipTest
+
+import myanimelist.session
+import myanimelist.transport
+import myanimelist.utilities
+
+# recorded anime and manga pages, and their character pages, by URL path.
+MEDIA_PAGE = re.compile(r'^/(?P<type>anime|manga)/(?P<id>[0-9]+)/?$')
+CHARACTERS_PAGE = re.compile(r'^/(?P<type>anime|manga)/(?P<id>[0-9]+)/[^/]+/characters$')
+
+
+def recordings():
+    """Opens the recordings directory given by MAL_RECORDINGS, skipping the calling test if there is none.
+
+    :rtype: :class:`myanimelist.transport.ReplayTransport`
+    :return: A transport replaying the recordings.
+
+    """
+    directory = os.environ.get(u'MAL_RECORDINGS')
+    if not directory or not os.path.isdir(directory):
+        raise SkipTest(u'Set MAL_RECORDINGS to a directory of pages recorded off MAL to run this.')
+    return myanimelist.transport.ReplayTransport(directory)
+
+
+def recorded_pages(transport, pattern):
+    """Lists the recorded pages whose URL paths match the given pattern.
+
+    :rtype: list
+    :return: A list of tuple(3)s of each page's URL, media type, and media ID.
+
+    """
+    pages = []
+    for url in transport.urls():
+        match = pattern.match(url.split(u'myanimelist.net', 1)[-1].split(u'?')[0])
+        if match:
+            pages.append((url, match.group(u'type'), int(match.group(u'id'))))
+    if not pages:
+        raise SkipTest(u'No recorded pages of this kind.')
+    return pages
+
+
+class testRecordedPagesClass(TestCase):
+    def setUp(self):
+        self.transport = recordings()
+
+    def media(self, media_type, media_id):
+        # a fresh object of a fresh session each time, so that nothing parsed before is reused.
+        session = myanimelist.session.Session(transport=self.transport)
+        return getattr(session, media_type)(media_id)
+
+    def assertSameAttributes(self, url, expected, actual):
+        self.assertEqual(sorted(actual), sorted(expected), url)
+        for attribute in expected:
+            self.assertEqual(actual[attribute], expected[attribute], u'%s: %s' % (url, attribute))
+
+    def testParserEnginesAgree(self):
+        for pattern, page_type, parse in [(MEDIA_PAGE, u'media', u'parse'),
+                                          (CHARACTERS_PAGE, u'characters', u'parse_characters')]:
+            for url, media_type, media_id in recorded_pages(self.transport, pattern):
+                html = self.transport.get(url).text
+                parsed = [getattr(self.media(media_type, media_id), parse)(
+                    myanimelist.utilities.get_clean_dom(html, engine, page_type))
+                    for engine in [u'html.parser', u'lxml']]
+                self.assertSameAttributes(url, parsed[0], parsed[1])
+
+    def testRegionsHoldEverythingParsed(self):
+        # every element the media parsers look at has to be in a region that straining keeps.
+        for url, media_type, media_id in recorded_pages(self.transport, MEDIA_PAGE):
+            html = myanimelist.utilities.fix_bad_html(self.transport.get(url).text, u'media')
+            whole = self.media(media_type, media_id).parse(bs4.BeautifulSoup(html, u'html.parser'))
+            strained = self.media(media_type, media_id).parse(
+                bs4.BeautifulSoup(html, u'html.parser', parse_only=myanimelist.utilities.REGIONS[u'media']))
+            self.assertSameAttributes(url, whole, strained)
+
+    def testSingleDomMatchesTwoTrees(self):
+        # pages used to be parsed into a cleaned html.parser tree, and a raw lxml tree for the current layout.
+        for url, media_type, media_id in recorded_pages(self.transport, MEDIA_PAGE):
+            response = self.transport.get(url)
+            two_trees = self.media(media_type, media_id).parse(myanimelist.utilities.get_clean_dom(response.text),
+                                                              bs4.BeautifulSoup(response.text, u'lxml'))
+            media = self.media(media_type, media_id)
+            media_page = media.parse_page(response)
+            sections = {}
+            for section in media._sections:
+                sections.update(media.parse_section(section, media_page))
+            self.assertSameAttributes(url, two_trees, sections)
+
+        for url, media_type, media_id in recorded_pages(self.transport, CHARACTERS_PAGE):
+            html = self.transport.get(url).text
+            two_trees = self.media(media_type, media_id).parse_characters(myanimelist.utilities.get_clean_dom(html),
+                                                                         bs4.BeautifulSoup(html, u'lxml'))
+            media = self.media(media_type, media_id)
+            single = media.parse_characters(
+                myanimelist.utilities.get_clean_dom(html, media.session.parser_for(u'characters'), u'characters'))
+            self.assertSameAttributes(url, two_trees, single)
@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import requests
+
+import myanimelist.session
+import myanimelist.retry
+import myanimelist.transport
+from tests.transport_tests import FlakyTransport, TruncatingServer
+
+
+class testRetryClass(TestCase):
+    def setUp(self):
+        self.url = u'http://myanimelist.net/anime/1'
+        self.policy = myanimelist.retry.RetryPolicy(attempts=3, backoff=0, failure_threshold=3, reset_timeout=0)
+
+    def testDelayBounded(self):
+        policy = myanimelist.retry.RetryPolicy(backoff=1, max_backoff=3)
+        for attempt in range(5):
+            self.assertLessEqual(policy.delay(attempt), min(3, 2 ** attempt))
+
+    def testRetriesUntilSuccess(self):
+        live = FlakyTransport('<html></html>', [requests.ConnectionError(),
+                                                myanimelist.transport.Response(self.url, status_code=503)])
+        session = myanimelist.session.Session(transport=live, retry=self.policy)
+        self.assertEqual(session.fetch(self.url).content, '<html></html>')
+        self.assertEqual(len(live.requests), 3)
+
+    def testGivesUp(self):
+        live = FlakyTransport('<html></html>', [requests.ConnectionError()] * 3)
+        session = myanimelist.session.Session(transport=live, retry=self.policy)
+        with self.assertRaises(requests.ConnectionError):
+            session.fetch(self.url)
+
+    def testGivesUpOnResponses(self):
+        # responses that still fail once attempts run out are raised, rather than parsed as if they were pages.
+        failure = myanimelist.transport.Response(self.url, status_code=503)
+        live = FlakyTransport('<html></html>', [failure] * 3)
+        session = myanimelist.session.Session(transport=live, retry=self.policy)
+        with self.assertRaises(myanimelist.retry.RetriesExhaustedError) as raised:
+            session.anime(1).load()
+        self.assertIs(raised.exception.response, failure)
+        self.assertEqual(len(live.requests), 3)
+
+    def testRetriesTruncatedBodies(self):
+        server = TruncatingServer()
+        try:
+            session = myanimelist.session.Session(retry=self.policy)
+            with self.assertRaises(myanimelist.retry.RetriesExhaustedError) as raised:
+                session.fetch(server.url)
+            self.assertTrue(raised.exception.response.incomplete)
+            self.assertEqual(server.requests, 3)
+        finally:
+            server.close()
+
+    def testNotFoundNotRetried(self):
+        live = FlakyTransport('<html></html>', [myanimelist.transport.Response(self.url, status_code=404)])
+        session = myanimelist.session.Session(transport=live, retry=self.policy)
+        self.assertEqual(session.fetch(self.url).status_code, 404)
+        self.assertEqual(len(live.requests), 1)
+
+    def testCircuitBreaker(self):
+        live = FlakyTransport('<html></html>', [requests.ConnectionError()] * 4)
+        self.policy.reset_timeout = 60
+        session = myanimelist.session.Session(transport=live, retry=self.policy)
+        with self.assertRaises(requests.ConnectionError):
+            session.fetch(self.url)
+        self.assertTrue(session.transport.breaker(self.url).open)
+
+        # requests to the same family fail fast, without reaching the transport.
+        with self.assertRaises(myanimelist.retry.CircuitOpenError):
+            session.fetch(u'http://myanimelist.net/anime/2')
+        self.assertEqual(len(live.requests), 3)
+
+        # other families are unaffected.
+        self.assertFalse(session.transport.breaker(u'http://myanimelist.net/profile/shaldengeki').open)
+
+    def testCircuitRecovers(self):
+        breaker = myanimelist.retry.CircuitBreaker(u'media', failure_threshold=1, reset_timeout=0)
+        breaker.failed()
+        self.assertTrue(breaker.open)
+        breaker.allow()
+        with self.assertRaises(myanimelist.retry.CircuitOpenError):
+            breaker.allow()
+        breaker.succeeded()
+        self.assertFalse(breaker.open)
+        breaker.allow()
+
+    def testTrialErrorReopensCircuit(self):
+        live = FlakyTransport('<html></html>', [requests.ConnectionError(), ValueError(u'bad URL')])
+        policy = myanimelist.retry.RetryPolicy(attempts=1, backoff=0, failure_threshold=1, reset_timeout=0)
+        transport = myanimelist.retry.RetryingTransport(live, policy=policy)
+        with self.assertRaises(requests.ConnectionError):
+            transport.get(self.url)
+        with self.assertRaises(ValueError):
+            transport.get(self.url)
+        # the trial failed, so the next request is another trial rather than being refused for good.
+        self.assertEqual(transport.get(self.url).content, '<html></html>')
+        self.assertFalse(transport.breaker(self.url).open)
+
+    def testBlockPageIsFailure(self):
+        challenge = myanimelist.transport.Response(self.url, content='<html><script src="/_Incapsula_Resource?x=1">')
+        live = FlakyTransport('<html></html>', [challenge, challenge])
+        transport = myanimelist.retry.RetryingTransport(live, policy=self.policy)
+        self.assertEqual(transport.get(self.url).content, '<html></html>')
+        self.assertEqual(len(live.requests), 3)
+        self.assertEqual(transport.breaker(self.url).failures, 0)
+
+        policy = myanimelist.retry.RetryPolicy(attempts=1, backoff=0, failure_threshold=1, reset_timeout=60)
+        transport = myanimelist.retry.RetryingTransport(FlakyTransport('<html></html>', [challenge]), policy=policy)
+        with self.assertRaises(myanimelist.retry.RetriesExhaustedError) as raised:
+            transport.get(self.url)
+        self.assertIs(raised.exception.response, challenge)
+        self.assertTrue(transport.breaker(self.url).open)
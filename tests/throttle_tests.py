@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+import myanimelist.session
+import myanimelist.throttle
+import myanimelist.transport
+from tests.transport_tests import FlakyTransport, StaticTransport, TruncatingServer
+
+
+class testTokenBucketClass(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testBurst(self):
+        bucket = myanimelist.throttle.TokenBucket(1, burst=3)
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertGreater(bucket.try_acquire(), 0)
+
+    def testRate(self):
+        bucket = myanimelist.throttle.TokenBucket(50, burst=1)
+        start = time.time()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.time() - start, 0.09)
+
+    def testSharedAcrossThreads(self):
+        bucket = myanimelist.throttle.TokenBucket(1, burst=5)
+        taken = []
+
+        def worker():
+            taken.append(bucket.try_acquire() == 0)
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(taken.count(True), 5)
+
+    def testSharedThroughLockFile(self):
+        lock_path = os.path.join(self.directory, u'mal.lock')
+        first = myanimelist.throttle.TokenBucket(1, burst=2, lock_path=lock_path)
+        second = myanimelist.throttle.TokenBucket(1, burst=2, lock_path=lock_path)
+        self.assertEqual(first.try_acquire(), 0)
+        self.assertEqual(second.try_acquire(), 0)
+        self.assertGreater(first.try_acquire(), 0)
+
+    def testWithoutFlock(self):
+        lock_path = os.path.join(self.directory, u'mal.lock')
+        bucket = myanimelist.throttle.TokenBucket(1, burst=2, lock_path=lock_path)
+        # as on Windows, where there's no fcntl module.
+        fcntl = sys.modules.get(u'fcntl')
+        sys.modules[u'fcntl'] = None
+        try:
+            self.assertEqual([bucket.try_acquire() for _ in range(2)], [0, 0])
+            self.assertGreater(bucket.try_acquire(), 0)
+        finally:
+            if fcntl is None:
+                del sys.modules[u'fcntl']
+            else:
+                sys.modules[u'fcntl'] = fcntl
+        self.assertFalse(os.path.exists(lock_path))
+
+
+class testRateLimiterClass(TestCase):
+    def testFamilyBudgets(self):
+        profile = myanimelist.throttle.TokenBucket(1)
+        limiter = myanimelist.throttle.RateLimiter(families={u'profile': profile})
+        self.assertIs(limiter.bucket(u'http://myanimelist.net/profile/shaldengeki'), profile)
+        self.assertIsNone(limiter.bucket(u'http://myanimelist.net/anime/1'))
+
+    def testSessionThrottlesRequests(self):
+        live = StaticTransport('<html></html>')
+        limiter = myanimelist.throttle.RateLimiter(default=myanimelist.throttle.TokenBucket(1000, burst=1))
+        session = myanimelist.session.Session(transport=live, rate_limiter=limiter)
+        session.fetch(u'http://myanimelist.net/anime/1')
+        self.assertGreater(limiter.default.try_acquire(), 0)
+        self.assertEqual(len(live.requests), 1)
+
+
+class testConcurrencyControllerClass(TestCase):
+    def testIncreasesWhileLatencyFlat(self):
+        controller = myanimelist.throttle.ConcurrencyController(initial=2, maximum=4)
+        for _ in range(20):
+            controller.release(controller.acquire(), 0.1)
+        self.assertEqual(controller.window, 4)
+        self.assertEqual(controller.reasons[u'increase'], 2)
+        self.assertEqual([change[1:] for change in controller.changes], [(2, 3, u'increase'), (3, 4, u'increase')])
+
+    def testHoldsWhileLatencyGrows(self):
+        controller = myanimelist.throttle.ConcurrencyController(initial=2, latency_tolerance=1.5)
+        controller.release(controller.acquire(), 0.1)
+        for _ in range(20):
+            controller.release(controller.acquire(), 5.0)
+        self.assertEqual(controller.window, 2)
+
+    def testCutsOnceOnBlock(self):
+        controller = myanimelist.throttle.ConcurrencyController(initial=8)
+        tickets = [controller.acquire() for _ in range(8)]
+        for ticket in tickets:
+            controller.release(ticket, 0.1, failure=u'http_503')
+        self.assertEqual(controller.window, 4)
+        self.assertEqual(controller.reasons[u'http_503'], 1)
+
+    def testLimitsRequestsInFlight(self):
+        controller = myanimelist.throttle.ConcurrencyController(initial=1)
+        controller.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (controller.acquire(), acquired.set()))
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        controller.release(0, 0.1)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+    def testCutsOnRequestErrors(self):
+        for error, reason in [(requests.exceptions.ReadTimeout(), u'timeout'),
+                              (requests.exceptions.ConnectTimeout(), u'timeout'),
+                              (requests.exceptions.ChunkedEncodingError(), u'request_error'),
+                              (requests.ConnectionError(), u'connection_error'),
+                              (ValueError(u'bad URL'), u'error')]:
+            controller = myanimelist.throttle.ConcurrencyController(initial=4)
+            transport = myanimelist.throttle.AdaptiveTransport(FlakyTransport('', [error]), controller)
+            with self.assertRaises(type(error)):
+                transport.get(u'http://myanimelist.net/anime/1')
+            self.assertEqual(controller.window, 2)
+            self.assertEqual(controller.reasons[reason], 1)
+            self.assertEqual(controller.in_flight, 0)
+
+    def testCutsOnTruncatedBodies(self):
+        server = TruncatingServer()
+        try:
+            controller = myanimelist.throttle.ConcurrencyController(initial=4)
+            session = myanimelist.session.Session(concurrency=controller)
+            self.assertTrue(session.fetch(server.url).incomplete)
+            self.assertEqual(controller.window, 2)
+            self.assertEqual(controller.reasons[u'incomplete'], 1)
+            self.assertEqual(controller.in_flight, 0)
+        finally:
+            server.close()
+
+    def testSessionDetectsIncapsula(self):
+        controller = myanimelist.throttle.ConcurrencyController(initial=4)
+        challenge = myanimelist.transport.Response(u'http://myanimelist.net/anime/1',
+                                                   content='<html><script src="/_Incapsula_Resource?x=1"></script>')
+        session = myanimelist.session.Session(transport=FlakyTransport('', [challenge]), concurrency=controller)
+        session.fetch(u'http://myanimelist.net/anime/1')
+        self.assertEqual(controller.window, 2)
+        self.assertEqual(controller.reasons[u'incapsula'], 1)
+        self.assertEqual(controller.in_flight, 0)
@@ -0,0 +1,160 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import shutil
+import socket
+import tempfile
+import threading
+
+import requests
+
+import myanimelist.session
+import myanimelist.transport
+import myanimelist.anime
+
+
+class StaticTransport(myanimelist.transport.Transport):
+    """Serves a fixed body for every URL, counting the requests made."""
+
+    def __init__(self, content):
+        self.content = content
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append(url)
+        return myanimelist.transport.Response(url, headers={u'Content-Type': u'text/html; charset=utf-8'},
+                                              content=self.content, encoding=u'utf-8')
+
+    def post(self, url, data=None):
+        return self.get(url)
+
+
+class FlakyTransport(StaticTransport):
+    """Fails the first few requests, with an exception or a response, then serves a fixed body."""
+
+    def __init__(self, content, failures):
+        super(FlakyTransport, self).__init__(content)
+        self.failures = list(failures)
+
+    def get(self, url, headers=None):
+        response = super(FlakyTransport, self).get(url, headers=headers)
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return response
+
+
+class TruncatingServer(object):
+    """Serves every request over a real socket, declaring a longer body than it sends before closing the connection."""
+
+    def __init__(self, body='<html><body>', length=1000):
+        self.body = body
+        self.length = length
+        self.requests = 0
+        self.closed = threading.Event()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(8)
+        self.socket.settimeout(0.1)
+        self.url = u'http://127.0.0.1:%d/anime/1' % self.socket.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def serve(self):
+        while not self.closed.is_set():
+            try:
+                connection = self.socket.accept()[0]
+            except socket.timeout:
+                continue
+            connection.settimeout(None)
+            request = ''
+            while '\r\n\r\n' not in request:
+                chunk = connection.recv(4096)
+                if not chunk:
+                    break
+                request += chunk
+            self.requests += 1
+            connection.sendall('HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n'
+                               'Content-Length: %d\r\nConnection: close\r\n\r\n%s' % (self.length, self.body))
+            connection.close()
+
+    def close(self):
+        self.closed.set()
+        self.thread.join()
+        self.socket.close()
+
+
+class testTransportClass(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.newest_page = '<html><body><div class="hoverinfo" rel="#5114"></div></body></html>'
+        self.newest_url = u'http://myanimelist.net/anime.php?o=9&c[]=a&c[]=d&cv=2&w=1'
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testTruncatedBodyIncomplete(self):
+        server = TruncatingServer()
+        try:
+            self.assertTrue(myanimelist.transport.HTTPTransport().get(server.url).incomplete)
+        finally:
+            server.close()
+        server = TruncatingServer(length=len('<html><body>'))
+        try:
+            response = myanimelist.transport.HTTPTransport().get(server.url)
+            self.assertEqual(response.content, '<html><body>')
+            self.assertFalse(response.incomplete)
+        finally:
+            server.close()
+
+    def testResponseText(self):
+        response = myanimelist.transport.Response(u'http://myanimelist.net/', content=u'Ōkami'.encode(u'utf-8'),
+                                                  encoding=u'utf-8')
+        self.assertEqual(response.text, u'Ōkami')
+
+    def testResponseDeclaredEncoding(self):
+        content = u'<html><head><meta charset="Shift_JIS"></head><body>狼</body></html>'.encode(u'shift_jis')
+        response = myanimelist.transport.Response(u'http://myanimelist.net/', content=content)
+        self.assertIn(u'狼', response.text)
+        self.assertEqual(response.encoding, u'shift_jis')
+
+    def testResponseDefaultsToUtf8WithoutSniffing(self):
+        detect = requests.compat.chardet.detect
+        requests.compat.chardet.detect = None
+        try:
+            response = myanimelist.transport.Response(u'http://myanimelist.net/', content=u'Ōkami'.encode(u'utf-8'))
+            self.assertEqual(response.text, u'Ōkami')
+        finally:
+            requests.compat.chardet.detect = detect
+
+    def testHeaderEncoding(self):
+        self.assertEqual(myanimelist.transport.header_encoding({u'Content-Type': u'text/html; charset=UTF-8'}), u'utf-8')
+        self.assertIsNone(myanimelist.transport.header_encoding({u'Content-Type': u'text/html'}))
+
+    def testReplayMissingRecording(self):
+        replay = myanimelist.transport.ReplayTransport(self.directory)
+        with self.assertRaises(myanimelist.transport.MissingRecordingError):
+            replay.get(self.newest_url)
+
+    def testRecordThenReplay(self):
+        live = StaticTransport(self.newest_page)
+        recorder = myanimelist.transport.ReplayTransport(self.directory, record_from=live)
+        self.assertEqual(recorder.get(self.newest_url).content, self.newest_page)
+        self.assertEqual(recorder.get(self.newest_url).content, self.newest_page)
+        self.assertEqual(len(live.requests), 1)
+
+        replay = myanimelist.transport.ReplayTransport(self.directory)
+        response = replay.get(self.newest_url)
+        self.assertEqual(response.content, self.newest_page)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers[u'content-type'], u'text/html; charset=utf-8')
+
+    def testSessionUsesTransport(self):
+        live = StaticTransport(self.newest_page)
+        session = myanimelist.session.Session(transport=live)
+        self.assertEqual(myanimelist.anime.Anime.newest(session), session.anime(5114))
+        self.assertEqual(live.requests, [self.newest_url])
@@ -6,6 +6,7 @@ import datetime
 
 import myanimelist.session
 import myanimelist.user
+from tests.transport_tests import StaticTransport
 
 
 class testUserClass(TestCase):
@@ -271,3 +272,14 @@ class testUserClass(TestCase):
         self.assertGreaterEqual(len(self.mona.friends), 0)
         self.assertIsInstance(self.threger.friends, dict)
         self.assertEqual(len(self.threger.friends), 0)
+
+
+class testUserParserClass(TestCase):
+    def testFindUsernameUsesSessionParser(self):
+        page = '<html><body><div id="contentWrapper"><h1>shaldengeki\'s Comments</h1></div></body></html>'
+        session = myanimelist.session.Session(transport=StaticTransport(page), parser=u'html.parser')
+        page_types = []
+        parser_for = session.parser_for
+        session.parser_for = lambda page_type: page_types.append(page_type) or parser_for(page_type)
+        self.assertEqual(myanimelist.user.User.find_username_from_user_id(session, 64611), u'shaldengeki')
+        self.assertEqual(page_types, [u'profile'])
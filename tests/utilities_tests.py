@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import datetime
+from unittest import TestCase
+
+import myanimelist.utilities
+
+
+class testFixBadHtmlClass(TestCase):
+    def setUp(self):
+        self.licensing = u'<small>L</small></sup><small> represents licensing company</small></div>'
+        self.closing_span = u'<td>5</span>/26</a></span></td>'
+        self.double_div = u'<a href="/character/7373/Holo">Holo</a>\n\t\t\t<div class="spaceit_pad"><small>Main</small></div>\n\t\t\t</div>'
+
+    def testAllFixesByDefault(self):
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.licensing),
+                         u'<small>L</small></sup><small> represents licensing company</small>')
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.closing_span), u'<td>5/26</td>')
+        self.assertEqual(myanimelist.utilities.fix_bad_html(u'<tr>\n td class="x">'), u'<tr>\n<td class="x">')
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.double_div),
+                         u'<a href="/character/7373/Holo">Holo</a>\n\t\t\t<div class="spaceit_pad"><small>Main</small></div>')
+
+    def testPageTypeFixes(self):
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.licensing, u'media'),
+                         myanimelist.utilities.fix_bad_html(self.licensing))
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.closing_span, u'list'), u'<td>5/26</td>')
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.double_div, u'characters'),
+                         myanimelist.utilities.fix_bad_html(self.double_div))
+
+    def testUncheckedPageTypesGetEveryFix(self):
+        for page_type in [u'character', u'other']:
+            for html in [self.licensing, self.closing_span, self.double_div]:
+                self.assertEqual(myanimelist.utilities.fix_bad_html(html, page_type),
+                                 myanimelist.utilities.fix_bad_html(html))
+
+    def testOtherPageTypesUntouched(self):
+        for html in [self.licensing, self.closing_span, self.double_div]:
+            self.assertEqual(myanimelist.utilities.fix_bad_html(html, u'profile'), html)
+        self.assertEqual(myanimelist.utilities.fix_bad_html(self.closing_span, u'media'), self.closing_span)
+
+    def testSkipsFixesWithoutTrigger(self):
+        calls = []
+        fixups = myanimelist.utilities.FIXUPS[u'list']
+        myanimelist.utilities.FIXUPS[u'list'] = [(u'</span>/', lambda html: calls.append(html) or html)]
+        try:
+            myanimelist.utilities.fix_bad_html(u'<td>5/26</td>', u'list')
+            myanimelist.utilities.fix_bad_html(self.closing_span, u'list')
+        finally:
+            myanimelist.utilities.FIXUPS[u'list'] = fixups
+        self.assertEqual(calls, [self.closing_span])
+
+
+class testRegionsClass(TestCase):
+    def setUp(self):
+        self.page = u"""<html><head><script>var MAL = {};</script></head><body>
+<div id="headerSmall"><a href="/">MyAnimeList.net</a></div>
+<div id="contentWrapper"><h1 class="h1"><span itemprop="name">Cowboy Bebop</span></h1><div id="content"><table><tr><td>Sidebar</td></tr></table></div></div>
+<div id="footer"><a href="/about.php">About</a></div>
+</body></html>"""
+
+    def testBuildsOnlyRegions(self):
+        dom = myanimelist.utilities.get_clean_dom(self.page, u'lxml', u'media')
+        self.assertEqual(dom.select(u'div#contentWrapper h1.h1 span')[0].text, u'Cowboy Bebop')
+        self.assertEqual(dom.select(u'div#content table td')[0].text, u'Sidebar')
+        self.assertIsNone(dom.find(u'div', {u'id': u'headerSmall'}))
+        self.assertIsNone(dom.find(u'div', {u'id': u'footer'}))
+        self.assertIsNone(dom.find(u'script'))
+
+    def testKeepsNoSuchResourceNotice(self):
+        page = u'<html><body><div class="badresult">No such series</div><div id="footer"></div></body></html>'
+        dom = myanimelist.utilities.get_clean_dom(page, u'html.parser', u'media')
+        self.assertIsNotNone(dom.find(u'div', {u'class': u'badresult'}))
+        self.assertIsNone(dom.find(u'div', {u'id': u'footer'}))
+
+    def testWholePageWithoutRegions(self):
+        # profile and character pages haven't been checked against whole pages yet, so are built whole too.
+        for page_type in [u'other', u'profile', u'character']:
+            dom = myanimelist.utilities.get_clean_dom(self.page, u'lxml', page_type)
+            self.assertIsNotNone(dom.find(u'div', {u'id': u'footer'}))
+
+
+class testSidebarLabelsClass(TestCase):
+    def setUp(self):
+        self.dom = myanimelist.utilities.get_clean_dom(u"""<div id="contentWrapper"><div id="content"><table><tr><td>
+<div class="spaceit"><span class="dark_text">Episodes:</span> 26</div>
+<div><span class="dark_text">Status:</span> Finished Airing</div>
+<div><span class="dark_text">Status:</span> Not the sidebar</div>
+<div><span>Aired:</span> Apr 3, 1998</div>
+</td></tr></table></div></div>""", u'lxml', u'media')
+
+    def testIndexesLabels(self):
+        labels = myanimelist.utilities.sidebar_labels(self.dom)
+        self.assertEqual(sorted(labels.keys()), [u'Episodes', u'Status'])
+        self.assertEqual(labels[u'Episodes'].name, u'div')
+        self.assertEqual(labels[u'Episodes'].text.strip(), u'Episodes: 26')
+
+    def testFirstLabelWins(self):
+        labels = myanimelist.utilities.sidebar_labels(self.dom)
+        self.assertEqual(labels[u'Status'].text.strip(), u'Status: Finished Airing')
+
+    def testFieldByLabelPrefix(self):
+        labels = {u'Ranked: #22': self.dom.find(u'div', {u'class': u'spaceit'})}
+        self.assertIs(myanimelist.utilities.sidebar_field(labels, u'Ranked'), labels[u'Ranked: #22'])
+        self.assertIsNone(myanimelist.utilities.sidebar_field(labels, u'Popularity'))
+
+
+class testParseProfileDateClass(TestCase):
+    def setUp(self):
+        self.now = datetime.datetime(2015, 3, 1, 12, 30)
+
+    def testListDates(self):
+        parse = myanimelist.utilities.parse_profile_date
+        self.assertEqual(parse(u'2010-04-05'), datetime.date(2010, 4, 5))
+        self.assertEqual(parse(u'2010-04-00'), datetime.date(2010, 4, 1))
+        self.assertEqual(parse(u'2010-00-00'), datetime.date(2010, 1, 1))
+        self.assertIsNone(parse(u'0000-00-00'))
+        self.assertIsNone(parse(u'2010-00-05'))
+        self.assertIsNone(parse(u'2010-02-30'))
+
+    def testOtherAbsoluteDates(self):
+        parse = myanimelist.utilities.parse_profile_date
+        self.assertEqual(parse(u'04-05-10'), datetime.date(2010, 4, 5))
+        self.assertEqual(parse(u'Apr 5, 2010'), datetime.date(2010, 4, 5))
+        self.assertEqual(parse(u'April 5, 2010'), datetime.date(2010, 4, 5))
+        self.assertEqual(parse(u'Apr 2010'), datetime.date(2010, 4, 1))
+        self.assertEqual(parse(u'2010'), datetime.date(2010, 1, 1))
+        self.assertEqual(parse(u'04-05-10, 3:04 PM'), datetime.datetime(2010, 4, 5, 15, 4))
+        self.assertEqual(parse(u'Apr 5, 2010 3:04 PM'), datetime.datetime(2010, 4, 5, 15, 4))
+        self.assertIsNone(parse(u'Unknown'))
+        self.assertIsNone(parse(u'Not a date'))
+
+    def testRelativeDates(self):
+        parse = myanimelist.utilities.parse_profile_date
+        self.assertEqual(parse(u'Now', now=self.now), self.now)
+        self.assertEqual(parse(u'5 seconds ago', now=self.now), datetime.datetime(2015, 3, 1, 12, 29, 55))
+        self.assertEqual(parse(u'1 minute ago', now=self.now), datetime.datetime(2015, 3, 1, 12, 29))
+        self.assertEqual(parse(u'3 hours ago', now=self.now), datetime.datetime(2015, 3, 1, 9, 30))
+        self.assertEqual(parse(u'Today, 3:04 PM', now=self.now), datetime.datetime(2015, 3, 1, 15, 4))
+        self.assertEqual(parse(u'Yesterday, 11:59 AM', now=self.now), datetime.datetime(2015, 2, 28, 11, 59))
+        self.assertEqual(parse(u'Apr 5, 3:04 PM', now=self.now), datetime.datetime(2015, 4, 5, 15, 4))
+
+    def testRemembersAbsoluteDates(self):
+        myanimelist.utilities.parse_profile_date(u'2011-06-07')
+        self.assertEqual(myanimelist.utilities._date_cache[u'2011-06-07'], datetime.date(2011, 6, 7))
+        myanimelist.utilities.parse_profile_date(u'Today, 3:04 PM', now=self.now)
+        self.assertNotIn(u'Today, 3:04 PM', myanimelist.utilities._date_cache)
+
+    def testBoundedCache(self):
+        size = myanimelist.utilities.DATE_CACHE_SIZE
+        myanimelist.utilities.DATE_CACHE_SIZE = 2
+        try:
+            for text in [u'2011-06-07', u'2011-06-08', u'2011-06-09']:
+                myanimelist.utilities.parse_profile_date(text)
+            self.assertEqual(list(myanimelist.utilities._date_cache), [u'2011-06-08', u'2011-06-09'])
+        finally:
+            myanimelist.utilities.DATE_CACHE_SIZE = size
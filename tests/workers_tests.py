@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+import threading
+
+import myanimelist.session
+import myanimelist.throttle
+import myanimelist.workers
+from tests.transport_tests import StaticTransport
+
+
+class FakeResource(object):
+    """Fetches its page on load(), and fails on load_stats() if asked to."""
+
+    def __init__(self, session, id, fail=False, gate=None):
+        self.session = session
+        self.id = id
+        self.fail = fail
+        self.gate = gate
+        self.loaded = False
+
+    def load(self):
+        if self.gate is not None:
+            self.gate.wait()
+        self.session.fetch(u'http://myanimelist.net/anime/' + str(self.id))
+        self.loaded = True
+
+    def load_stats(self):
+        if self.fail:
+            raise ValueError(u'bad stats page')
+
+
+class testWorkerPoolClass(TestCase):
+    def testResult(self):
+        pool = myanimelist.workers.WorkerPool(size=2)
+        self.assertEqual(pool.submit(lambda x: x * 2, 21).result(), 42)
+        pool.shutdown()
+
+    def testException(self):
+        pool = myanimelist.workers.WorkerPool(size=2)
+        future = pool.submit(lambda: 1 / 0)
+        self.assertRaises(ZeroDivisionError, future.result)
+        self.assertIsInstance(future.exception(), ZeroDivisionError)
+        pool.shutdown()
+
+    def testBounded(self):
+        pool = myanimelist.workers.WorkerPool(size=3)
+        gate = threading.Event()
+        futures = [pool.submit(gate.wait) for _ in range(10)]
+        self.assertEqual(len(pool._threads), 3)
+        gate.set()
+        for future in futures:
+            future.result()
+        pool.shutdown()
+
+    def testAsCompleted(self):
+        pool = myanimelist.workers.WorkerPool(size=2)
+        gate = threading.Event()
+        slow = pool.submit(lambda: gate.wait() and u'slow')
+        fast = pool.submit(lambda: u'fast')
+        completed = myanimelist.workers.as_completed([slow, fast])
+        self.assertIs(next(completed), fast)
+        gate.set()
+        self.assertIs(next(completed), slow)
+        pool.shutdown()
+
+
+class testLoadManyClass(TestCase):
+    def setUp(self):
+        self.live = StaticTransport('<html></html>')
+        self.session = myanimelist.session.Session(transport=self.live)
+
+    def testLoadsEveryResource(self):
+        resources = [FakeResource(self.session, i) for i in range(1, 11)]
+        results = list(self.session.load_many(resources, workers=4))
+        self.assertEqual(sorted(resource.id for resource, _ in results), range(1, 11))
+        self.assertTrue(all(resource.loaded for resource in resources))
+        self.assertEqual(len(self.live.requests), 10)
+
+    def testCollectsErrorsPerItem(self):
+        resources = [FakeResource(self.session, 1), FakeResource(self.session, 2, fail=True)]
+        results = dict((resource.id, errors)
+                       for resource, errors in self.session.load_many(resources, loaders=[u'load', u'load_stats']))
+        self.assertEqual(results[1], {})
+        self.assertEqual(results[2].keys(), [u'load_stats'])
+        self.assertIsInstance(results[2][u'load_stats'], ValueError)
+
+    def testStreamsResults(self):
+        gate = threading.Event()
+        slow = FakeResource(self.session, 1, gate=gate)
+        fast = FakeResource(self.session, 2)
+        results = self.session.load_many([slow, fast], workers=2)
+        self.assertIs(next(results)[0], fast)
+        gate.set()
+        self.assertIs(next(results)[0], slow)
+
+    def testRespectsRateLimits(self):
+        limiter = myanimelist.throttle.RateLimiter(default=myanimelist.throttle.TokenBucket(1, burst=3))
+        session = myanimelist.session.Session(transport=self.live, rate_limiter=limiter)
+        list(session.load_many([FakeResource(session, i) for i in range(3)]))
+        self.assertGreater(limiter.default.try_acquire(), 0)